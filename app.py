@@ -6,6 +6,8 @@ import json
 import sys
 import os
 import random
+import threading
+import time
 from pathlib import Path
 from openai import OpenAI
 from dotenv import load_dotenv
@@ -14,8 +16,20 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 load_dotenv(project_root / "backend" / ".env")
 
-from backend.app.game_engine import GameState, AtBatSimulator
-from backend.app.ai import OllamaClient, generate_strategy_advice_prompt, generate_batting_coach_prompt, generate_commentary
+from backend.app.game_engine import (
+    GameState, AtBatSimulator, PitchSimulator, RatingsTable, league_win_probability, lineup_expected_runs,
+    optimize_lineup
+)
+from backend.app.game_engine.baserunning import lead_runner_bucket, sample_transition, team_buckets
+from backend.app.game_engine.box_score import PITCHING_COLUMNS, BoxScore
+from backend.app.game_engine.events import InningEnd, PitcherChange, PlateAppearance
+from backend.app.game_engine.headless import HeadlessGame, state_from_game
+from backend.app.game_engine.run_expectancy import OUTCOMES
+from backend.app.ai import (
+    OllamaClient, DialogueHistory, BullpenAdvisor, ManagerMCTS, evaluate_options, iter_json_objects, recommend_strategy,
+    generate_strategy_advice_prompt, generate_batting_coach_prompt, generate_commentary
+)
+from backend.app.services import DEFAULT_DB_PATH, MLBStorage, RosterArtifact, RosterArtifactError, RosterStore
 
 st.set_page_config(
     page_title="MLB 매니저 시뮬레이터",
@@ -135,22 +149,102 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+ROSTER_ARTIFACT_DIR = project_root / "data" / "mlb"
+
+# 저장소가 없을 때 사용하는 팀 JSON (NL West, 단일 시즌)
+JSON_TEAMS_DIR = project_root / "data" / "mlb" / "nl_west" / "teams"
+JSON_SEASON = 2025
+JSON_TEAMS = {
+    'Los Angeles Dodgers': 'dodgers',
+    'San Diego Padres': 'padres',
+    'Arizona Diamondbacks': 'diamondbacks',
+    'San Francisco Giants': 'giants',
+    'Colorado Rockies': 'rockies'
+}
+
+
+@st.cache_resource
+def get_storage():
+    """SQLite 저장소 (파일이 없으면 None - 팀 JSON 사용)"""
+    storage = MLBStorage(DEFAULT_DB_PATH)
+    return storage if storage.exists else None
+
+
+@st.cache_resource
+def get_roster_artifact(season):
+    """시즌 로스터 아티팩트 헤더는 프로세스당 한 번만 읽음 (없거나 스키마가 다르면 None)"""
+    try:
+        return RosterArtifact(ROSTER_ARTIFACT_DIR / f"roster_{season}.msgpack")
+    except RosterArtifactError as e:
+        print(f"로스터 아티팩트 미사용: {e}")
+        return None
+
+
+@st.cache_resource
+def get_roster_store(season):
+    """시즌 로스터는 프로세스당 하나 - 팀은 처음 선택될 때 로드되고 모든 세션이 같은 불변 객체를 공유"""
+    manager = StreamlitMLBGame()
+    return RosterStore(lambda short_name: manager.load_team(short_name, season))
+
+
+@st.cache_resource
+def get_ratings_table(season, team_keys):
+    """두 팀 선수의 컬럼형 능력치 테이블 (팀 조합별로 한 번만 생성)"""
+    roster = get_roster_store(season)
+    return RatingsTable(roster.players(pid for key in team_keys for pid in roster.team_player_ids(key)))
+
+
+@st.cache_resource
+def get_bullpen_advisor(season, team_keys, defense_team_key, lineup_ids, baserunning):
+    """수비팀 투수진 x 상대 타순 결과 확률 행렬은 경기(타순 조합)당 한 번만 계산"""
+    roster = get_roster_store(season)
+    simulator = AtBatSimulator(get_ratings_table(season, team_keys))
+    return BullpenAdvisor(simulator, roster.pitcher_ids(defense_team_key), lineup_ids, baserunning=baserunning)
+
+
+def roster_players(key):
+    """세션에 저장된 선수 ID 목록 → 선수 레코드"""
+    return get_roster_store(st.session_state.season).players(st.session_state[key])
+
+
+def roster_player(key):
+    return get_roster_store(st.session_state.season)[st.session_state[key]]
+
+
 class StreamlitMLBGame:
     def __init__(self):
-        self.data_dir = project_root / "data" / "mlb" / "nl_west" / "teams"
-        self.teams = {
-            'Dodgers': 'dodgers',
-            'Padres': 'padres',
-            'Diamondbacks': 'diamondbacks',
-            'Giants': 'giants',
-            'Rockies': 'rockies'
-        }
-
-    def load_team(self, team_name):
-        team_file = self.data_dir / f"{team_name}.json"
-        with open(team_file, 'r', encoding='utf-8') as f:
+        self.storage = get_storage()
+
+    def seasons(self):
+        seasons = self.storage.seasons() if self.storage else []
+        return seasons or [JSON_SEASON]
+
+    def list_teams(self, season):
+        """팀 표시 이름 -> 팀 약칭"""
+        if self.storage:
+            return {team['team_name']: team['short_name'] for team in self.storage.list_teams(season)}
+        return dict(JSON_TEAMS)
+
+    def load_team(self, team_name, season):
+        """아티팩트(최신일 때) → 저장소 → 팀 JSON 순서로 로드"""
+        artifact = get_roster_artifact(season)
+        if artifact and team_name in artifact and self._artifact_is_current(team_name, artifact):
+            return artifact.load_team(team_name)
+        if self.storage:
+            return self.storage.load_team(season, team_name)
+        with open(JSON_TEAMS_DIR / f"{team_name}.json", 'r', encoding='utf-8') as f:
             return json.load(f)
 
+    def _artifact_is_current(self, team_name, artifact):
+        """아티팩트 빌드 이후 원본(저장소 또는 팀 JSON)이 갱신됐으면 원본을 그대로 사용"""
+        if self.storage:
+            return artifact.source_version == self.storage.data_version()
+        team_file = JSON_TEAMS_DIR / f"{team_name}.json"
+        try:
+            return team_file.stat().st_mtime <= artifact.path.stat().st_mtime
+        except OSError:
+            return not team_file.exists()
+
     def get_starters(self, team_data):
         pitchers = team_data['pitchers']
         starters = [p for p in pitchers if p.get('ratings_20_80', {}).get('stamina', 0) >= 55]
@@ -182,6 +276,19 @@ STRATEGY_MAP_PITCHING = {
     "조언 무시 (일반 투구)": None
 }
 
+# 자동 감독 모드의 타석당 MCTS 탐색 시간 (초)
+MCTS_TIME_BUDGET = 0.2
+
+# 되돌릴 수 있는 타석 수, What-if 비교 시간 예산 (초) - 선택지가 신뢰구간으로 갈리면 일찍 끝남
+UNDO_DEPTH = 30
+WHAT_IF_TIME_BUDGET = 1.0
+
+# 타석마다 바뀌는 세션 상태 (GameState 밖) - 체크포인트에 함께 저장
+CHECKPOINT_KEYS = (
+    'home_batter_idx', 'away_batter_idx', 'home_current_pitcher', 'away_current_pitcher',
+    'home_bullpen', 'away_bullpen', 'pitcher_consecutive_hits', 'pitcher_runs_allowed'
+)
+
 STRATEGY_KR = {
     'power_swing': '[적극 스윙]',
     'contact_swing': '[컨택 중심]',
@@ -192,12 +299,27 @@ STRATEGY_KR = {
 }
 
 
-def generate_fan_chat(outcome, batter_name, score_diff, inning, is_bottom):
+def stream_openai_json(client, prompt, temperature, max_tokens, depth=2):
+    """JSON 모드 스트리밍 응답에서 완성된 객체를 도착 즉시 yield"""
+    stream = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": prompt}],
+        temperature=temperature,
+        max_tokens=max_tokens,
+        response_format={"type": "json_object"},
+        stream=True
+    )
+    chunks = (chunk.choices[0].delta.content for chunk in stream if chunk.choices)
+    yield from iter_json_objects(chunks, depth)
+
+
+def stream_fan_chat(outcome, batter_name, score_diff, inning, is_bottom):
+    """팬 채팅을 한 건씩 스트리밍 (API 키가 없으면 아무것도 yield하지 않음)"""
     outcome_text = OUTCOME_KR.get(outcome, outcome)
 
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
-        return get_fallback_chat(outcome, outcome_text)
+        return
 
     try:
         client = OpenAI(api_key=api_key)
@@ -228,23 +350,20 @@ def generate_fan_chat(outcome, batter_name, score_diff, inning, is_bottom):
 {{"chats": [{{"user": "닉네임", "message": "채팅내용"}}, ...]}}
 """
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=1.0,
-            max_tokens=300
-        )
+        for chat in stream_openai_json(client, prompt, temperature=1.0, max_tokens=300):
+            if 'user' in chat and 'message' in chat:
+                yield chat
+    except:
+        return
 
-        result_text = response.choices[0].message.content.strip()
-        if result_text.startswith("```"):
-            result_text = result_text.split("```")[1]
-            if result_text.startswith("json"):
-                result_text = result_text[4:]
 
-        result = json.loads(result_text)
-        return result.get('chats', [])
-    except:
-        return get_fallback_chat(outcome, outcome_text)
+def chat_html(chats):
+    """채팅 목록 → chat-message 블록 HTML (최신이 위)"""
+    return ''.join(
+        f'<div class="chat-message"><div class="chat-user">{chat["user"]}</div>'
+        f'<div class="chat-text">{chat["message"]}</div></div>'
+        for chat in reversed(chats)
+    )
 
 
 def get_fallback_chat(outcome, outcome_text):
@@ -322,31 +441,24 @@ def generate_mound_visit_initial(pitcher_name, catcher_name, situation, pitcher_
 }}
 """
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.9,
-            max_tokens=300
-        )
-
-        result_text = response.choices[0].message.content.strip()
-        if result_text.startswith("```"):
-            result_text = result_text.split("```")[1]
-            if result_text.startswith("json"):
-                result_text = result_text[4:]
-
-        result = json.loads(result_text)
-        return result
+        dialogue = []
+        for line in stream_openai_json(client, prompt, temperature=0.9, max_tokens=300):
+            if 'speaker' in line and 'message' in line:
+                dialogue.append(line)
+        if dialogue:
+            return {"dialogue": dialogue}
     except:
-        return {
-            "dialogue": [
-                {"speaker": "포수", "message": f"감독님, {pitcher_name} 구위가 떨어졌어요."},
-                {"speaker": "투수", "message": "괜찮습니다. 계속 가겠습니다."}
-            ]
-        }
+        pass
+
+    return {
+        "dialogue": [
+            {"speaker": "포수", "message": f"감독님, {pitcher_name} 구위가 떨어졌어요."},
+            {"speaker": "투수", "message": "괜찮습니다. 계속 가겠습니다."}
+        ]
+    }
 
 
-def generate_player_response(user_message, pitcher_name, catcher_name, situation, dialogue_history):
+def generate_player_response(user_message, pitcher_name, catcher_name, situation, dialogue_history, history=None):
     """사용자(감독) 입력에 대한 투수/포수 반응 생성"""
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -355,7 +467,8 @@ def generate_player_response(user_message, pitcher_name, catcher_name, situation
     try:
         client = OpenAI(api_key=api_key)
 
-        dialogue_context = "\n".join([f"{d['speaker']}: {d['message']}" for d in dialogue_history])
+        history = history or DialogueHistory()
+        dialogue_context = history.build_context(dialogue_history)
 
         prompt = f"""
 야구 경기 마운드 방문 대화에서 감독의 말에 대한 선수들의 반응을 생성하세요.
@@ -381,23 +494,13 @@ def generate_player_response(user_message, pitcher_name, catcher_name, situation
 {{"speaker": "투수/포수", "message": "대사"}}
 """
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.9,
-            max_tokens=150
-        )
-
-        result_text = response.choices[0].message.content.strip()
-        if result_text.startswith("```"):
-            result_text = result_text.split("```")[1]
-            if result_text.startswith("json"):
-                result_text = result_text[4:]
-
-        result = json.loads(result_text)
-        return result
+        for result in stream_openai_json(client, prompt, temperature=0.9, max_tokens=150, depth=0):
+            if 'speaker' in result and 'message' in result:
+                return result
     except:
-        return {"speaker": "투수", "message": "알겠습니다, 감독님."}
+        pass
+
+    return {"speaker": "투수", "message": "알겠습니다, 감독님."}
 
 
 def check_mound_visit_trigger(game_state, pitcher_stats):
@@ -437,7 +540,6 @@ def init_session():
         'game_manager': StreamlitMLBGame(),
         'at_bat_sim': AtBatSimulator(),
         'llm': OllamaClient(),
-        'play_log': [],
         'last_commentary': None,
         'fan_chats': [],
         'show_chat_popup': False,
@@ -455,21 +557,26 @@ def team_selection_page():
     st.title("MLB 매니저 시뮬레이터")
     st.markdown("### 팀 선택")
 
+    manager = st.session_state.game_manager
+    seasons = manager.seasons()
+    season = st.selectbox("시즌", seasons, index=len(seasons) - 1) if len(seasons) > 1 else seasons[0]
+    teams = manager.list_teams(season)
+
     col1, col2 = st.columns(2)
     with col1:
         st.markdown("#### 홈팀 (당신)")
-        home_team = st.selectbox("홈팀 선택", list(st.session_state.game_manager.teams.keys()))
+        home_team = st.selectbox("홈팀 선택", list(teams.keys()))
     with col2:
         st.markdown("#### 원정팀")
-        away_options = [t for t in st.session_state.game_manager.teams.keys() if t != home_team]
+        away_options = [t for t in teams.keys() if t != home_team]
         away_team = st.selectbox("원정팀 선택", away_options)
 
     if st.button("라인업 구성", type="primary", use_container_width=True):
-        manager = st.session_state.game_manager
+        st.session_state.season = season
         st.session_state.home_team_name = home_team
         st.session_state.away_team_name = away_team
-        st.session_state.home_team_data = manager.load_team(manager.teams[home_team])
-        st.session_state.away_team_data = manager.load_team(manager.teams[away_team])
+        st.session_state.home_team_key = teams[home_team]
+        st.session_state.away_team_key = teams[away_team]
         st.session_state.page = 'lineup_setup'
         st.rerun()
 
@@ -479,29 +586,57 @@ def lineup_setup_page():
 
     tab1, tab2 = st.tabs([f"{st.session_state.home_team_name} (홈)", f"{st.session_state.away_team_name} (원정)"])
     with tab1:
-        setup_team_lineup(st.session_state.home_team_data, "home")
+        setup_team_lineup(st.session_state.home_team_key, "home")
     with tab2:
-        setup_team_lineup(st.session_state.away_team_data, "away")
+        setup_team_lineup(st.session_state.away_team_key, "away")
 
     if st.button("경기 시작", type="primary", use_container_width=True):
         start_game()
 
 
-def setup_team_lineup(team_data, team_key):
+def apply_optimal_lineup(team_key, batter_labels):
+    """현재 선택한 타자 9명을 상대 선발 투수 기준 최적 타순으로 재배치 (버튼 콜백)"""
+    other_key = 'away' if team_key == 'home' else 'home'
+    season = st.session_state.season
+    lineup = st.session_state.get(f'{team_key}_lineup')
+    if not lineup:
+        return
+
+    other_team = st.session_state[f'{other_key}_team_key']
+    pitcher_id = st.session_state.get(f'{other_key}_pitcher') or get_roster_store(season).pitcher_ids(other_team)[0]
+    team_keys = tuple(sorted((st.session_state.home_team_key, st.session_state.away_team_key)))
+    ratings = get_ratings_table(season, team_keys)
+    sim = AtBatSimulator(ratings)
+    baserunning = team_buckets(ratings, lineup, st.session_state.get(f'{other_key}_lineup') or [])
+
+    before = lineup_expected_runs(sim, lineup, pitcher_id, baserunning=baserunning)
+    order, after = optimize_lineup(sim, lineup, pitcher_id, baserunning=baserunning)
+    for position, player_id in enumerate(order, 1):
+        st.session_state[f'{team_key}_batter_{position}'] = batter_labels[player_id]
+    st.session_state[f'{team_key}_lineup_runs'] = (before, after)
+
+
+def setup_team_lineup(team_short_name, team_key):
+    roster = get_roster_store(st.session_state.season)
     st.markdown("### 타순")
 
     # 모든 타자 표시 (필터링 없음)
-    all_batters = sorted(team_data['batters'], key=lambda b: b['ratings_20_80']['overall'], reverse=True)
+    all_batters = roster.players(roster.batter_ids(team_short_name))
 
-    if f'{team_key}_lineup' not in st.session_state:
-        st.session_state[f'{team_key}_lineup'] = all_batters[:9]
-
-    batter_map = {f"{b['name']} ({b['position']}) - OVR:{b['ratings_20_80']['overall']}": b for b in all_batters}
+    batter_map = {f"{b['name']} ({b['position']}) - OVR:{b['ratings_20_80']['overall']}": b['id'] for b in all_batters}
     new_lineup = []
 
+    st.button(
+        "최적 타순 추천", key=f'{team_key}_optimize_lineup',
+        help="선택한 9명의 순서를 상대 선발 투수 기준 경기당 기대 득점이 가장 높게 재배치",
+        on_click=apply_optimal_lineup, args=(team_key, {player_id: label for label, player_id in batter_map.items()})
+    )
+    lineup_runs = st.session_state.get(f'{team_key}_lineup_runs')
+    if lineup_runs:
+        st.caption(f"경기당 기대 득점: {lineup_runs[0]:.2f} → {lineup_runs[1]:.2f}")
+
     for order in range(1, 10):
-        already_selected = [f"{b['name']} ({b['position']}) - OVR:{b['ratings_20_80']['overall']}" for b in new_lineup]
-        available = [name for name in batter_map.keys() if name not in already_selected]
+        available = [name for name, player_id in batter_map.items() if player_id not in new_lineup]
 
         col1, col2 = st.columns([1, 9])
         with col1:
@@ -518,8 +653,8 @@ def setup_team_lineup(team_data, team_key):
 
     st.markdown("### 선발 투수")
     # 모든 투수 표시 (필터링 없음)
-    all_pitchers = sorted(team_data['pitchers'], key=lambda p: p['ratings_20_80']['overall'], reverse=True)
-    pitcher_options = {f"{p['name']} - OVR:{p['ratings_20_80']['overall']}": p for p in all_pitchers}
+    all_pitchers = roster.players(roster.pitcher_ids(team_short_name))
+    pitcher_options = {f"{p['name']} - OVR:{p['ratings_20_80']['overall']}": p['id'] for p in all_pitchers}
     selected_pitcher = st.selectbox("선발 투수", list(pitcher_options.keys()), key=f'{team_key}_pitcher_select')
     st.session_state[f'{team_key}_pitcher'] = pitcher_options[selected_pitcher]
 
@@ -527,19 +662,36 @@ def setup_team_lineup(team_data, team_key):
 def start_game():
     st.session_state.game_state = GameState(st.session_state.away_team_name, st.session_state.home_team_name)
 
-    # 모든 투수를 불펜으로 (선발 제외)
-    home_pitchers = st.session_state.home_team_data['pitchers']
-    away_pitchers = st.session_state.away_team_data['pitchers']
-
-    st.session_state.home_bullpen = [p for p in home_pitchers if p['name'] != st.session_state.home_pitcher['name']]
-    st.session_state.away_bullpen = [p for p in away_pitchers if p['name'] != st.session_state.away_pitcher['name']]
+    # 모든 투수를 불펜으로 (선발 제외) - 세션에는 ID만 저장
+    roster = get_roster_store(st.session_state.season)
+    home_pitchers = roster.pitcher_ids(st.session_state.home_team_key)
+    away_pitchers = roster.pitcher_ids(st.session_state.away_team_key)
+
+    st.session_state.home_bullpen = [pid for pid in home_pitchers if pid != st.session_state.home_pitcher]
+    st.session_state.away_bullpen = [pid for pid in away_pitchers if pid != st.session_state.away_pitcher]
+
+    team_keys = tuple(sorted((st.session_state.home_team_key, st.session_state.away_team_key)))
+    ratings = get_ratings_table(st.session_state.season, team_keys)
+    st.session_state.at_bat_sim = AtBatSimulator(ratings)
+    st.session_state.pitch_sim = PitchSimulator(st.session_state.at_bat_sim)
+    # 공격팀별 (타순 스피드 구간, 상대 수비 구간) - 진루 테이블 조회용 (MCTS/불펜/라인업 모델)
+    home_lineup, away_lineup = st.session_state.home_lineup, st.session_state.away_lineup
+    st.session_state.baserunning = {
+        'home': team_buckets(ratings, home_lineup, away_lineup),
+        'away': team_buckets(ratings, away_lineup, home_lineup),
+    }
+    # 라이브 진행은 주자별 스피드 - GameState.runners에는 이름이 들어가므로 이름 → speed
+    st.session_state.runner_speed = {
+        side: {roster[pid]['name']: roster[pid]['ratings_20_80']['speed'] for pid in lineup}
+        for side, lineup in (('home', home_lineup), ('away', away_lineup))
+    }
 
     st.session_state.home_current_pitcher = st.session_state.home_pitcher
     st.session_state.away_current_pitcher = st.session_state.away_pitcher
     st.session_state.home_batter_idx = 0
     st.session_state.away_batter_idx = 0
+    st.session_state.history = []
     st.session_state.page = 'game'
-    st.session_state.play_log = []
     st.rerun()
 
 
@@ -547,7 +699,7 @@ def game_page():
     show_sidebar()
     game = st.session_state.game_state
 
-    if game.inning > 9:
+    if game.is_game_over():
         show_game_over()
         return
 
@@ -556,16 +708,17 @@ def game_page():
     col_left, col_right = st.columns([3, 2])
 
     with col_left:
+        roster = get_roster_store(st.session_state.season)
         if game.is_bottom:
             lineup = st.session_state.home_lineup
             batter_idx = st.session_state.home_batter_idx
-            pitcher = st.session_state.away_current_pitcher
+            pitcher = roster[st.session_state.away_current_pitcher]
         else:
             lineup = st.session_state.away_lineup
             batter_idx = st.session_state.away_batter_idx
-            pitcher = st.session_state.home_current_pitcher
+            pitcher = roster[st.session_state.home_current_pitcher]
 
-        batter = lineup[batter_idx]
+        batter = roster[lineup[batter_idx]]
         show_matchup(batter, pitcher, game)
 
         col_btn1, col_btn2, col_btn3 = st.columns(3)
@@ -604,7 +757,8 @@ def game_page():
                     'catcher_name': catcher_name,
                     'situation': "감독 요청",
                     'reason': "감독 요청",
-                    'dialogue': initial_dialogue.get('dialogue', [])
+                    'dialogue': initial_dialogue.get('dialogue', []),
+                    'history': DialogueHistory()
                 }
                 st.session_state.show_mound_visit = True
                 st.rerun()
@@ -618,9 +772,18 @@ def game_page():
         elif st.session_state.get('show_pitcher_change', False):
             show_pitcher_change(game)
         else:
+            if st.session_state.get('auto_manage'):
+                if st.button("자동 감독 타석 진행", type="primary", use_container_width=True):
+                    save_checkpoint(game)
+                    auto_manage_at_bat(batter, pitcher, game, batter_idx)
+                    st.rerun()
+                if st.session_state.get('auto_manage_note'):
+                    st.caption(st.session_state.auto_manage_note)
             if st.button("타석 진행 (전략 없음)", type="primary", use_container_width=True):
+                save_checkpoint(game)
                 simulate_at_bat(batter, pitcher, game, batter_idx, None)
                 st.rerun()
+            show_history_controls(game)
 
         if st.session_state.last_commentary:
             st.markdown(f'<div class="commentary-box">실시간 중계<br>{st.session_state.last_commentary}</div>', unsafe_allow_html=True)
@@ -639,42 +802,89 @@ def game_page():
         show_mound_visit_popup()
 
 
+class AdviceStream:
+    """LLM 조언 토큰을 백그라운드 스레드에서 모음 - 스트리밍 중 rerun이 되어도 요청을 다시 보내지 않음"""
+
+    def __init__(self, tokens):
+        self.chunks = []
+        self.done = False
+        threading.Thread(target=self._collect, args=(tokens,), daemon=True).start()
+
+    def _collect(self, tokens):
+        try:
+            for token in tokens:
+                self.chunks.append(token)
+        finally:
+            self.done = True
+
+    @property
+    def text(self) -> str:
+        return "".join(self.chunks).strip()
+
+
+def advice_stream(batter, pitcher, game, state):
+    """이번 타석 상황의 조언 스트림 - 같은 상황이면 세션에 있는 것을 그대로 사용"""
+    key = (batter['id'], pitcher['id'], game.inning, game.is_bottom, game.base_out_state,
+           game.home_score, game.away_score)
+    cached = st.session_state.get('coach_advice')
+    if cached is None or cached[0] != key:
+        if game.is_bottom:
+            prompt = generate_batting_coach_prompt(batter, pitcher, state)
+        else:
+            prompt = generate_strategy_advice_prompt(batter, pitcher, state)
+        cached = st.session_state.coach_advice = (key, AdviceStream(st.session_state.llm.generate_stream(prompt)))
+    return cached[1]
+
+
 def show_strategy_selection(batter, pitcher, game, batter_idx):
     st.markdown("---")
 
-    if 'current_advice' not in st.session_state:
-        with st.spinner("AI 분석 중..."):
-            if game.is_bottom:
-                prompt = generate_batting_coach_prompt(batter, pitcher, game.get_state_dict())
-                st.session_state.is_batting_turn = True
-            else:
-                prompt = generate_strategy_advice_prompt(batter, pitcher, game.get_state_dict())
-                st.session_state.is_batting_turn = False
-            st.session_state.current_advice = st.session_state.llm.generate(prompt)
+    state = game.get_state_dict()
+    st.session_state.is_batting_turn = game.is_bottom
+
+    # 1단계: 로컬 확률 모델로 즉시 추천
+    if 'local_advice' not in st.session_state:
+        st.session_state.local_advice = recommend_strategy(batter, pitcher, state, game.is_bottom)
+    local = st.session_state.local_advice
+    st.success(f"**즉시 추천: {local['name']}**\n\n{local['reason']}")
+
+    # 2단계: LLM 설명은 백그라운드에서 받고 아래에서 갱신 (버튼은 먼저 렌더링)
+    advice_box = st.empty()
+    advice = advice_stream(batter, pitcher, game, state)
+    advice_box.info(f"**AI 코치 조언**{'' if advice.done else ' (생성 중...)'}\n\n{advice.text}")
 
-    st.info(f"**AI 코치 조언**\n\n{st.session_state.current_advice}")
     st.markdown("#### 전략 선택")
 
     if st.session_state.is_batting_turn:
-        strategy = st.radio("타격 전략을 선택하세요", list(STRATEGY_MAP_BATTING.keys()), key="strategy_choice")
         strategy_map = STRATEGY_MAP_BATTING
+        label = "타격 전략을 선택하세요"
     else:
-        strategy = st.radio("투구 전략을 선택하세요", list(STRATEGY_MAP_PITCHING.keys()), key="strategy_choice")
         strategy_map = STRATEGY_MAP_PITCHING
+        label = "투구 전략을 선택하세요"
+    options = list(strategy_map.keys())
+    default = next(i for i, key in enumerate(options) if strategy_map[key] == local['strategy'])
+    strategy = st.radio(label, options, index=default, key="strategy_choice")
 
     col_btn1, col_btn2 = st.columns(2)
     with col_btn1:
         if st.button("전략 실행", type="primary", use_container_width=True):
+            save_checkpoint(game)
             simulate_at_bat(batter, pitcher, game, batter_idx, strategy_map[strategy])
             st.session_state.show_strategy_selection = False
-            st.session_state.pop('current_advice', None)
+            st.session_state.pop('local_advice', None)
             st.rerun()
     with col_btn2:
         if st.button("취소", use_container_width=True):
             st.session_state.show_strategy_selection = False
-            st.session_state.pop('current_advice', None)
+            st.session_state.pop('local_advice', None)
             st.rerun()
 
+    # 생성 중이면 끝날 때까지 화면 갱신 - 중간에 rerun되면 다음 실행이 같은 스트림을 이어서 보여줌
+    while not advice.done:
+        time.sleep(0.1)
+        advice_box.info(f"**AI 코치 조언** (생성 중...)\n\n{advice.text}")
+    advice_box.info(f"**AI 코치 조언**\n\n{advice.text}")
+
 
 def show_pitcher_change(game):
     st.markdown("---")
@@ -684,26 +894,43 @@ def show_pitcher_change(game):
         current_team = "원정"
         bullpen = st.session_state.away_bullpen
         current_pitcher_key = 'away_current_pitcher'
+        defense_team_key, batting_key = st.session_state.away_team_key, 'home'
     else:
         current_team = "홈"
         bullpen = st.session_state.home_bullpen
         current_pitcher_key = 'home_current_pitcher'
+        defense_team_key, batting_key = st.session_state.home_team_key, 'away'
 
-    st.info(f"**현재 {current_team}팀 투수:** {st.session_state[current_pitcher_key]['name']}\n투구수: {game.pitcher_pitches} | 피로도: {game.pitcher_fatigue:.0f}%")
+    st.info(f"**현재 {current_team}팀 투수:** {roster_player(current_pitcher_key)['name']}\n투구수: {game.pitcher_pitches} | 피로도: {game.pitcher_fatigue:.0f}%")
 
     if bullpen:
-        pitcher_options = {f"{p['name']} - OVR:{p['ratings_20_80']['overall']} STF:{p['ratings_20_80']['stuff']} CTL:{p['ratings_20_80']['control']}": p for p in bullpen}
+        # 다음 타자부터 이번 이닝을 막았을 때의 승리 확률 변화 순으로 정렬
+        team_keys = tuple(sorted((st.session_state.home_team_key, st.session_state.away_team_key)))
+        advisor = get_bullpen_advisor(st.session_state.season, team_keys, defense_team_key,
+                                      tuple(st.session_state[f'{batting_key}_lineup']),
+                                      st.session_state.baserunning[batting_key])
+        current_wp, ranking = advisor.rank(game.get_state_dict(), st.session_state[f'{batting_key}_batter_idx'],
+                                           st.session_state[current_pitcher_key], bullpen)
+        st.caption(f"현재 투수 유지 시 승리 확률: {current_wp:.1%}")
+
+        roster = get_roster_store(st.session_state.season)
+        pitcher_options = {}
+        for rank in ranking:
+            p = roster[rank['id']]
+            label = f"{p['name']} - OVR:{p['ratings_20_80']['overall']} STF:{p['ratings_20_80']['stuff']} CTL:{p['ratings_20_80']['control']} | 승리 확률 {rank['delta'] * 100:+.1f}%p"
+            pitcher_options[label] = p
         selected = st.selectbox("교체할 투수 선택", list(pitcher_options.keys()), key="pitcher_change_select")
 
         col_change1, col_change2 = st.columns(2)
         with col_change1:
             if st.button("교체 확정", type="primary", use_container_width=True):
                 new_pitcher = pitcher_options[selected]
-                st.session_state[current_pitcher_key] = new_pitcher
-                bullpen.remove(new_pitcher)
+                st.session_state[current_pitcher_key] = new_pitcher['id']
+                bullpen.remove(new_pitcher['id'])
                 game.pitcher_pitches = 0
-                game.pitcher_fatigue = 0
-                st.session_state.play_log.append(f"[투수 교체: {new_pitcher['name']}]")
+                game.play_log.append(
+                    PitcherChange(game.inning, game.is_bottom, 'away' if game.is_bottom else 'home', new_pitcher['id'])
+                )
                 st.session_state.show_pitcher_change = False
                 st.rerun()
         with col_change2:
@@ -749,13 +976,7 @@ def show_fan_chat_popup():
             st.rerun()
 
     if st.session_state.fan_chats:
-        for chat in reversed(st.session_state.fan_chats[-20:]):
-            st.markdown(f'''
-            <div class="chat-message">
-                <div class="chat-user">{chat["user"]}</div>
-                <div class="chat-text">{chat["message"]}</div>
-            </div>
-            ''', unsafe_allow_html=True)
+        st.markdown(chat_html(st.session_state.fan_chats[-20:]), unsafe_allow_html=True)
     else:
         st.info("아직 채팅이 없습니다. 경기가 진행되면 팬들의 반응을 볼 수 있습니다!")
 
@@ -842,7 +1063,8 @@ def show_mound_visit_popup():
                     data['pitcher_name'],
                     data['catcher_name'],
                     data['situation'],
-                    data['dialogue']
+                    data['dialogue'],
+                    data.get('history')
                 )
                 data['dialogue'].append(response)
 
@@ -959,40 +1181,196 @@ def show_matchup(batter, pitcher, game):
         st.markdown(f"**현재 상태**: 투구수 {game.pitcher_pitches} | 피로도 {game.pitcher_fatigue:.0f}%")
 
 
+def format_event(event):
+    """이벤트 → 중계 문자열"""
+    roster = get_roster_store(st.session_state.season)
+    if isinstance(event, PlateAppearance):
+        text = f"[{roster[event.batter_id]['name']}] {OUTCOME_KR.get(event.outcome, event.outcome)}"
+        if event.runs > 0:
+            text += f" ({event.runs}점)"
+        if event.sequence:
+            text += f" [{event.pitches}구 {event.sequence}]"
+        if event.strategy:
+            text = f"{STRATEGY_KR.get(event.strategy, event.strategy)} 전략 적용 - {text}"
+        return text
+    if isinstance(event, PitcherChange):
+        return f"[투수 교체: {roster[event.pitcher_id]['name']}]"
+    return f"[{event.inning}회 {'말' if event.is_bottom else '초'} 종료]"
+
+
+def event_css(event):
+    outcome = getattr(event, 'outcome', None)
+    if outcome == 'homerun':
+        return "play-item homerun"
+    if outcome in ('single', 'double', 'triple'):
+        return "play-item hit"
+    return "play-item"
+
+
 def show_play_log():
     st.markdown("### 실시간 중계")
     st.markdown('<div class="play-log">', unsafe_allow_html=True)
 
-    logs = [log for log in st.session_state.play_log if log.startswith('[')][-5:]
+    events = st.session_state.game_state.play_log[-5:]
 
-    if logs:
-        for log in reversed(logs):
-            css = "play-item homerun" if '홈런' in log else "play-item hit" if any(w in log for w in ['안타', '2루타', '3루타']) else "play-item"
-            st.markdown(f'<div class="{css}">{log}</div>', unsafe_allow_html=True)
+    if events:
+        for event in reversed(events):
+            st.markdown(f'<div class="{event_css(event)}">{format_event(event)}</div>', unsafe_allow_html=True)
     else:
         st.markdown('<div class="play-item">경기를 시작하세요</div>', unsafe_allow_html=True)
 
     st.markdown('</div>', unsafe_allow_html=True)
 
 
+def auto_manage_at_bat(batter, pitcher, game, batter_idx):
+    """홈팀 결정(투수 교체, 타석 전략)을 MCTS로 고른 뒤 타석 진행"""
+    season = st.session_state.season
+    team_keys = tuple(sorted((st.session_state.home_team_key, st.session_state.away_team_key)))
+    # 앱은 원정팀 투수를 자동으로 바꾸지 않으므로 롤아웃에서도 원정 투수는 그대로 둠
+    model = HeadlessGame(AtBatSimulator(get_ratings_table(season, team_keys)),
+                         st.session_state.home_lineup, st.session_state.away_lineup,
+                         baserunning=st.session_state.baserunning, auto_change=('home',))
+    state = state_from_game(
+        game, st.session_state.home_batter_idx, st.session_state.away_batter_idx,
+        st.session_state.home_current_pitcher, st.session_state.away_current_pitcher,
+        st.session_state.home_bullpen, st.session_state.away_bullpen
+    )
+    search = ManagerMCTS(model, manage_home=True)
+    result = search.search(state, time_budget=MCTS_TIME_BUDGET)
+    change, strategy = search.best_plan(state, result)
+
+    if change is not None:
+        new_pitcher = get_roster_store(season)[change]
+        st.session_state.home_current_pitcher = change
+        st.session_state.home_bullpen.remove(change)
+        game.pitcher_pitches = 0
+        game.play_log.append(PitcherChange(game.inning, game.is_bottom, 'home', change))
+        pitcher = new_pitcher
+
+    # 휴리스틱 추천과 비교해서 표시
+    heuristic = recommend_strategy(batter, pitcher, game.get_state_dict(), game.is_bottom)['strategy']
+    choice = STRATEGY_KR.get(strategy, '[전략 없음]')
+    if change is not None:
+        choice = f"[교체: {pitcher['name']}] {choice}"
+    st.session_state.auto_manage_note = (
+        f"MCTS 선택: {choice} - 예상 승률 {result.win_prob:.1%} ({result.iterations}회 탐색) | "
+        f"휴리스틱 추천: {STRATEGY_KR.get(heuristic, '[전략 없음]')}"
+    )
+    simulate_at_bat(batter, pitcher, game, batter_idx, strategy)
+
+
+def save_checkpoint(game):
+    """타석 직전 상황 저장 - GameState 스냅샷 + 세션 값 (불펜은 튜플로)"""
+    saved = {key: st.session_state[key] for key in CHECKPOINT_KEYS}
+    saved['home_bullpen'], saved['away_bullpen'] = tuple(saved['home_bullpen']), tuple(saved['away_bullpen'])
+    history = st.session_state.setdefault('history', [])
+    history.append((game.snapshot(), saved))
+    del history[:-UNDO_DEPTH]
+    st.session_state.pop('what_if', None)
+
+
+def undo_at_bat():
+    snapshot, saved = st.session_state.history.pop()
+    st.session_state.game_state.restore(snapshot)
+    for key, value in saved.items():
+        st.session_state[key] = list(value) if key.endswith('_bullpen') else value
+    st.session_state.last_commentary = None
+    st.session_state.show_mound_visit = False
+    for key in ('what_if', 'auto_manage_note'):
+        st.session_state.pop(key, None)
+
+
+def what_if_last_at_bat():
+    """직전 타석을 선택지별로 다시 진행한 홈팀 승리 확률 비교 (EvaluationResult, 실제 선택한 전략)"""
+    game = st.session_state.game_state
+    snapshot, saved = st.session_state.history[-1]
+    played = next(e for e in game.play_log[snapshot.log_length:] if isinstance(e, PlateAppearance))
+    roster = get_roster_store(st.session_state.season)
+    batter = roster[played.batter_id]
+
+    base = game.branch()
+    base.restore(snapshot)
+    pitcher_key = 'away_current_pitcher' if base.is_bottom else 'home_current_pitcher'
+    if played.pitcher_id != saved[pitcher_key]:
+        base.pitcher_pitches = 0  # 타석 전에 투수를 바꾼 경우
+
+    sim = st.session_state.at_bat_sim
+    wp = league_win_probability()
+    strategy_map = STRATEGY_MAP_BATTING if base.is_bottom else STRATEGY_MAP_PITCHING
+
+    def replay(strategy, n):
+        results = []
+        for _ in range(n):
+            branch = base.branch()
+            outcome, _ = sim.simulate(played.batter_id, played.pitcher_id, branch.get_state_dict(), strategy)
+            process_outcome(outcome, batter, branch)
+            results.append(wp.from_state(branch.get_state_dict()))
+        return results
+
+    result = evaluate_options(replay, list(strategy_map.values()), time_budget=WHAT_IF_TIME_BUDGET)
+    return result, played.strategy
+
+
+def show_history_controls(game):
+    if not st.session_state.get('history'):
+        return
+    col_undo, col_what_if = st.columns(2)
+    with col_undo:
+        if st.button("↩ 직전 타석 되돌리기", use_container_width=True, help="타석 직전 상황으로 돌아가 다른 선택으로 다시 진행"):
+            undo_at_bat()
+            st.rerun()
+    with col_what_if:
+        if st.button("What-if: 직전 타석", use_container_width=True, help="직전 타석을 선택지별로 다시 진행한 홈팀 승리 확률"):
+            st.session_state.what_if = what_if_last_at_bat()
+
+    what_if = st.session_state.get('what_if')
+    if what_if:
+        result, played = what_if
+        lines = [
+            f"{STRATEGY_KR.get(e.option, '[전략 없음]')} {e.mean:.1%} ({e.low:.1%}~{e.high:.1%}, {e.samples}회)"
+            + (" ← 실제 선택" if e.option == played else "")
+            for e in result.estimates
+        ]
+        verdict = "최선 확정" if result.separated else "시간 예산 소진 - 차이 불확실"
+        st.caption(
+            f"직전 타석 선택별 홈팀 승리 확률 ({result.confidence:.0%} 구간, 총 {result.samples}회 {result.elapsed:.2f}초, {verdict}): "
+            + " | ".join(lines)
+        )
+
+
 def simulate_at_bat(batter, pitcher, game, batter_idx, strategy):
-    outcome, _ = st.session_state.at_bat_sim.simulate(batter, pitcher, game.get_state_dict(), strategy)
+    if st.session_state.get('pitch_mode'):
+        # 투구 단위 진행 - 실제 투구수
+        outcome, details = st.session_state.pitch_sim.simulate(batter['id'], pitcher['id'], game.get_state_dict(), strategy)
+        pitches = details['pitches']
+        sequence = details['sequence']
+    else:
+        outcome, _ = st.session_state.at_bat_sim.simulate(batter['id'], pitcher['id'], game.get_state_dict(), strategy)
+        pitches = random.randint(4, 6)
+        sequence = ''
+    before = game.base_out_state
     runs = process_outcome(outcome, batter, game)
-    game.pitcher_pitches += random.randint(4, 6)
-
-    if strategy:
-        st.session_state.play_log.append(f"{STRATEGY_KR.get(strategy, '')} 전략 적용")
+    game.pitcher_pitches += pitches
+    game.reset_count()
 
+    event = PlateAppearance(game.inning, game.is_bottom, batter['id'], pitcher['id'], outcome, runs,
+                            before, game.base_out_state, pitches, strategy, sequence)
+    game.play_log.append(event)
     result = OUTCOME_KR.get(outcome, outcome)
-    log = f"[{batter['name']}] {result}" + (f" ({runs}점)" if runs > 0 else "")
-    st.session_state.play_log.append(log)
 
-    commentary = generate_commentary(outcome, batter, pitcher, game.get_state_dict(), runs)
+    commentary = generate_commentary(event.outcome, batter, pitcher, game.get_state_dict(), event.runs)
     st.session_state.last_commentary = commentary
 
+    # 스트리밍되는 채팅은 도착하는 대로 자리표시자에 그림 (rerun 후에는 채팅 팝업에서 보임)
     score_diff = game.home_score - game.away_score
-    fan_reactions = generate_fan_chat(outcome, batter['name'], score_diff, game.inning, game.is_bottom)
-    st.session_state.fan_chats.extend(fan_reactions)
+    live_chat = st.empty()
+    streamed = []
+    for chat in stream_fan_chat(outcome, batter['name'], score_diff, game.inning, game.is_bottom):
+        st.session_state.fan_chats.append(chat)
+        streamed.append(chat)
+        live_chat.markdown(chat_html(streamed), unsafe_allow_html=True)
+    if not streamed:
+        st.session_state.fan_chats.extend(get_fallback_chat(outcome, result))
 
     if game.is_bottom:
         st.session_state.home_batter_idx = (batter_idx + 1) % 9
@@ -1053,70 +1431,64 @@ def simulate_at_bat(batter, pitcher, game, batter_idx, strategy):
                 'catcher_name': catcher_name,
                 'situation': situation,
                 'reason': reasons[0],  # 주요 이유 1개만 표시
-                'dialogue': initial_dialogue.get('dialogue', [])
+                'dialogue': initial_dialogue.get('dialogue', []),
+                'history': DialogueHistory()
             }
             st.session_state.show_mound_visit = True
 
     if game.outs >= 3:
-        ended_inning = game.inning
-        ended_half = '말' if game.is_bottom else '초'
+        game.play_log.append(InningEnd(game.inning, game.is_bottom, game.home_score, game.away_score))
         game.end_half_inning()
-        st.session_state.play_log.append(f"[{ended_inning}회 {ended_half} 종료]")
         # 이닝 종료시 투수 통계 리셋
         st.session_state.pitcher_consecutive_hits = 0
 
 
 def process_outcome(outcome, batter, game):
-    runs_scored = 0
-
-    if outcome == 'single':
-        runs_scored = game.advance_runners(1)
-        game.add_runner(1, batter['name'])
-    elif outcome == 'double':
-        runs_scored = game.advance_runners(2)
-        game.add_runner(2, batter['name'])
-    elif outcome == 'triple':
-        runs_scored = game.advance_runners(3)
-        game.add_runner(3, batter['name'])
-    elif outcome == 'homerun':
-        runs_scored = game.advance_runners(4) + 1
-        game.clear_bases()
-    elif outcome == 'walk':
-        if game.runners[1]:
-            if game.runners[2]:
-                if game.runners[3]:
-                    runs_scored = 1
-                game.runners[3] = game.runners[2]
-            game.runners[2] = game.runners[1]
-        game.runners[1] = batter['name']
-    elif outcome in ['strikeout', 'groundout', 'flyout']:
-        game.record_out()
-        if outcome == 'flyout' and game.outs < 3 and game.runners[3]:
-            runs_scored = 1
-            game.runners[3] = None
-
-    if runs_scored > 0:
-        game.add_score(runs_scored)
-
+    """진루 테이블에서 다음 베이스-아웃 상태를 한 번 뽑아 반영 (득점 반환) - 스피드는 가장 앞선 주자(없으면 타자)"""
+    side = 'home' if game.is_bottom else 'away'
+    speeds = st.session_state.runner_speed[side]
+    speed = lead_runner_bucket([speeds.get(game.runners[base]) for base in (1, 2, 3)],
+                               batter['ratings_20_80']['speed'])
+    _, defense = st.session_state.baserunning[side]
+    next_state, runs_scored = sample_transition(OUTCOMES.index(outcome), game.base_out_state, (speed, defense))
+    outs, bases = divmod(next_state, 8)
+    game.apply_transition(batter['name'], bases, outs, runs_scored)
     return runs_scored
 
 
 def show_sidebar():
+    st.sidebar.toggle("자동 감독 (MCTS)", key='auto_manage', help="홈팀의 투수 교체와 타석 전략을 탐색으로 결정")
+    st.sidebar.toggle("투구 단위 시뮬레이션", key='pitch_mode', help="볼카운트를 진행해 실제 투구수로 피로도 계산 (타석 결과 확률은 동일)")
     st.sidebar.markdown("### 라인업")
 
     with st.sidebar.expander(f"{st.session_state.home_team_name} (홈)", expanded=True):
-        st.markdown(f"**투수:** {st.session_state.home_current_pitcher['name']}")
-        for i, b in enumerate(st.session_state.home_lineup, 1):
+        st.markdown(f"**투수:** {roster_player('home_current_pitcher')['name']}")
+        for i, b in enumerate(roster_players('home_lineup'), 1):
             marker = "▶" if i-1 == st.session_state.home_batter_idx else " "
             st.text(f"{marker} {i}. {b['name'][:15]}")
 
     with st.sidebar.expander(f"{st.session_state.away_team_name} (원정)"):
-        st.markdown(f"**투수:** {st.session_state.away_current_pitcher['name']}")
-        for i, b in enumerate(st.session_state.away_lineup, 1):
+        st.markdown(f"**투수:** {roster_player('away_current_pitcher')['name']}")
+        for i, b in enumerate(roster_players('away_lineup'), 1):
             marker = "▶" if i-1 == st.session_state.away_batter_idx else " "
             st.text(f"{marker} {i}. {b['name'][:15]}")
 
 
+def show_box_score(box):
+    roster = get_roster_store(st.session_state.season)
+    innings = sorted({inning for inning, _ in box.line})
+    st.markdown("### 박스스코어")
+    st.dataframe([
+        {'팀': name, **{str(inning): box.line.get((inning, is_bottom), 0) for inning in innings}}
+        for name, is_bottom in ((st.session_state.away_team_name, False), (st.session_state.home_team_name, True))
+    ], hide_index=True)
+    st.dataframe([{'타자': roster[pid]['name'], **line} for pid, line in box.batting.items()], hide_index=True)
+    st.dataframe([
+        {'투수': roster[pid]['name'], 'IP': box.innings_pitched(pid), **{c: line[c] for c in PITCHING_COLUMNS if c != 'OUTS'}}
+        for pid, line in box.pitching.items()
+    ], hide_index=True)
+
+
 def show_game_over():
     game = st.session_state.game_state
 
@@ -1125,10 +1497,14 @@ def show_game_over():
 
     if game.home_score > game.away_score:
         st.success(f"{st.session_state.home_team_name} 승리!")
-    elif game.home_score < game.away_score:
-        st.error(f"{st.session_state.away_team_name} 승리")
     else:
-        st.info("무승부")
+        st.error(f"{st.session_state.away_team_name} 승리")
+
+    show_box_score(BoxScore(game.play_log))
+
+    if st.session_state.get('history') and st.button("↩ 마지막 타석 되돌리기"):
+        undo_at_bat()
+        st.rerun()
 
     if st.button("새 게임"):
         for key in list(st.session_state.keys()):
@@ -5,14 +5,29 @@ from .ollama_client import OllamaClient
 from .strategy_advisor import (
     generate_strategy_advice_prompt,
     generate_pitching_coach_prompt,
-    generate_batting_coach_prompt
+    generate_batting_coach_prompt,
+    recommend_strategy
 )
+from .bullpen_advisor import BullpenAdvisor
+from .manager_mcts import ManagerMCTS
+from .sequential_evaluator import evaluate_decisions, evaluate_options
 from .commentary import generate_commentary
+from .dialogue_history import DialogueHistory, estimate_tokens
+from .json_stream import IncrementalJSONParser, iter_json_objects
 
 __all__ = [
     'OllamaClient',
     'generate_strategy_advice_prompt',
     'generate_pitching_coach_prompt',
     'generate_batting_coach_prompt',
-    'generate_commentary'
+    'recommend_strategy',
+    'BullpenAdvisor',
+    'ManagerMCTS',
+    'evaluate_decisions',
+    'evaluate_options',
+    'generate_commentary',
+    'DialogueHistory',
+    'estimate_tokens',
+    'IncrementalJSONParser',
+    'iter_json_objects'
 ]
@@ -0,0 +1,71 @@
+"""
+불펜 투수 추천 - 남은 하프 이닝 득점 분포로 계산한 승리 확률 변화(ΔWP) 순위
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..game_engine.baserunning import Baserunning
+from ..game_engine.markov import batter_transitions, runs_distribution
+from ..game_engine.run_expectancy import runners_to_mask
+from ..game_engine.win_probability import WinProbability, league_win_probability
+
+
+def _lineup_matrix(simulator, lineup_ids: Sequence[int], pitcher_ids: Sequence[int], state: Dict) -> np.ndarray:
+    """투수 x 타자 x [일반, 득점권] x 결과 확률 (P, 9, 2, 8)"""
+    return np.stack([
+        simulator.outcome_matrix(lineup_ids, pitcher_ids, {**state, 'runners_in_scoring_position': risp})
+        for risp in (False, True)
+    ], axis=2)
+
+
+class BullpenAdvisor:
+    """
+    수비팀 투수진 vs 상대 타순의 불펜 추천
+
+    투수 x 타자 결과 확률과 상태 전이 행렬은 생성 시 한 번만 계산하고,
+    교체 시점에는 다음 타자부터의 득점 분포 → 승리 확률 변환만 한다.
+    불펜 투수는 피로도 0, 현재 투수는 현재 피로도로 계산.
+    baserunning은 (상대 타순 스피드 구간, 수비팀 수비 구간) - None이면 고정 진루 규칙.
+    """
+
+    def __init__(self, simulator, pitcher_ids: Sequence[int], lineup_ids: Sequence[int],
+                 win_probability: Optional[WinProbability] = None, baserunning: Optional[Baserunning] = None):
+        self.simulator = simulator
+        self.pitcher_ids = list(pitcher_ids)
+        self.lineup_ids = list(lineup_ids)
+        self.win_probability = win_probability or league_win_probability()
+        self.baserunning = baserunning
+        self._rows = {pitcher_id: i for i, pitcher_id in enumerate(self.pitcher_ids)}
+        self.matrix = _lineup_matrix(simulator, self.lineup_ids, self.pitcher_ids, {})
+        self.transitions = batter_transitions(self.matrix, baserunning)
+
+    def rank(self, state: Dict, batter_idx: int, current_pitcher_id: int,
+             candidate_ids: Sequence[int]) -> Tuple[float, List[Dict]]:
+        """
+        (현재 투수 유지 시 수비팀 승리 확률, 후보별 {'id', 'win_prob', 'delta'} - delta 내림차순)
+
+        state는 GameState.get_state_dict() 형식, batter_idx는 다음 타자의 타순 인덱스
+        """
+        candidates = [pitcher_id for pitcher_id in candidate_ids if pitcher_id in self._rows]
+        current = _lineup_matrix(self.simulator, self.lineup_ids, [current_pitcher_id],
+                                 {'pitcher_fatigue': state.get('pitcher_fatigue', 0)})
+        transitions = np.concatenate([
+            batter_transitions(current, self.baserunning), self.transitions[[self._rows[pid] for pid in candidates]]
+        ])
+
+        start = state['outs'] * 8 + runners_to_mask(state['runners'])
+        runs_pmf = runs_distribution(transitions, start, leadoff=batter_idx % len(self.lineup_ids))
+        home_wp = self.win_probability.after_runs(
+            state['inning'], state['is_bottom'], state['home_score'] - state['away_score'], runs_pmf
+        )
+        # 말 공격이면 수비는 원정팀
+        defense_wp = 1.0 - home_wp if state['is_bottom'] else home_wp
+
+        base = float(defense_wp[0])
+        ranking = [
+            {'id': pitcher_id, 'win_prob': float(wp), 'delta': float(wp) - base}
+            for pitcher_id, wp in zip(candidates, defense_wp[1:])
+        ]
+        ranking.sort(key=lambda r: r['delta'], reverse=True)
+        return base, ranking
@@ -0,0 +1,66 @@
+"""
+마운드 방문 대화 히스토리 관리 - 토큰 예산 기반 컨텍스트 압축
+"""
+import re
+from typing import Dict, List, Tuple
+
+_TOKEN_PATTERN = re.compile(r"[가-힣]|[A-Za-z]+|\d+|[^\sA-Za-z\d가-힣]")
+
+
+def estimate_tokens(text: str) -> int:
+    """로컬 토큰 수 추정 (한글 음절 1토큰, 영단어/숫자 묶음 1토큰, 기호 1토큰)"""
+    return len(_TOKEN_PATTERN.findall(text))
+
+
+def _format_turn(turn: Dict) -> str:
+    return f"{turn['speaker']}: {turn['message']}"
+
+
+def _condense_turn(turn: Dict, max_chars: int) -> str:
+    message = turn['message'].strip()
+    sentence = re.split(r"(?<=[.!?…])\s", message, maxsplit=1)[0]
+    if len(sentence) > max_chars:
+        sentence = sentence[:max_chars].rstrip() + "…"
+    return f"{turn['speaker']}: {sentence}"
+
+
+class DialogueHistory:
+    """최근 N개 발화는 원문 유지, 그 이전 발화는 요약으로 캐싱"""
+
+    def __init__(self, max_tokens: int = 300, keep_last: int = 4, summary_chars: int = 30):
+        self.max_tokens = max_tokens
+        self.keep_last = keep_last
+        self.summary_chars = summary_chars
+        self._summary_lines: List[Tuple[str, int]] = []
+
+    def _update_summary(self, older: List[Dict]):
+        # 대화는 뒤에만 추가되므로 새로 밀려난 발화만 요약
+        if len(older) < len(self._summary_lines):
+            self._summary_lines = []
+        for turn in older[len(self._summary_lines):]:
+            line = _condense_turn(turn, self.summary_chars)
+            self._summary_lines.append((line, estimate_tokens(line)))
+
+    def build_context(self, dialogue: List[Dict]) -> str:
+        """토큰 예산 안에서 프롬프트용 대화 컨텍스트 생성"""
+        split = max(0, len(dialogue) - self.keep_last)
+        self._update_summary(dialogue[:split])
+
+        recent = [_format_turn(turn) for turn in dialogue[split:]]
+        budget = self.max_tokens - sum(estimate_tokens(line) for line in recent)
+
+        # 최근 발화가 예산을 넘으면 오래된 것부터 제외
+        while recent and budget < 0:
+            budget += estimate_tokens(recent.pop(0))
+
+        summary = []
+        for line, tokens in reversed(self._summary_lines):
+            if tokens > budget:
+                break
+            summary.append(line)
+            budget -= tokens
+        summary.reverse()
+
+        if not summary:
+            return "\n".join(recent)
+        return "[이전 대화 요약]\n" + "\n".join(summary) + "\n\n[최근 대화]\n" + "\n".join(recent)
@@ -0,0 +1,76 @@
+"""
+스트리밍 LLM 응답용 증분 JSON 파서
+"""
+import json
+from typing import Dict, Iterable, Iterator, List
+
+
+class IncrementalJSONParser:
+    """
+    청크 단위로 들어오는 텍스트에서 완성된 JSON 객체를 즉시 추출
+
+    depth는 객체가 열리는 중첩 깊이 - {"chats": [{...}, ...]}의 원소는 2,
+    최상위 객체 자체는 0. 코드펜스 등 JSON 바깥의 텍스트는 무시한다.
+    """
+
+    def __init__(self, depth: int = 2):
+        self.depth = depth
+        self._buffer = []
+        self._level = 0
+        self._in_string = False
+        self._escape = False
+        self._capturing = False
+
+    def feed(self, chunk: str) -> List[Dict]:
+        completed = []
+        for ch in chunk:
+            if self._capturing:
+                self._buffer.append(ch)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in '{[':
+                if ch == '{' and self._level == self.depth and not self._capturing:
+                    self._capturing = True
+                    self._buffer = [ch]
+                self._level += 1
+            elif ch in '}]':
+                self._level = max(0, self._level - 1)
+                if self._capturing and self._level == self.depth:
+                    self._capturing = False
+                    obj = self._decode(''.join(self._buffer))
+                    if obj is not None:
+                        completed.append(obj)
+        return completed
+
+    @staticmethod
+    def _decode(text: str):
+        try:
+            obj = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return obj if isinstance(obj, dict) else None
+
+
+def iter_json_objects(chunks: Iterable[str], depth: int = 2) -> Iterator[Dict]:
+    """
+    텍스트 청크 스트림에서 완성된 객체를 순서대로 yield
+
+    스트림이 중간에 끊겨도 이미 완성된 객체는 모두 전달된 상태로 종료된다.
+    """
+    parser = IncrementalJSONParser(depth)
+    try:
+        for chunk in chunks:
+            if chunk:
+                yield from parser.feed(chunk)
+    except Exception as e:
+        print(f"스트림 중단: {e}")
@@ -0,0 +1,146 @@
+"""
+감독 결정 MCTS - 타석별 전략, 투수 교체, 고의4구를 경기 모델(HeadlessGame)로 탐색
+
+한 팀(기본 홈팀)만 결정하고 상대팀은 기본 정책(전략 없음, model.auto_change에 있을 때만 지치면 교체)을 따른다.
+같은 상황은 전치 테이블(HeadlessGame.key)로 노드를 공유하고, 시간 예산이 끝나면 그때까지의 최선을 반환한다.
+"""
+import math
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from ..game_engine.headless import HeadlessGame, SimState
+from ..game_engine.strategy import BATTING_STRATEGIES, PITCHING_STRATEGIES
+
+# ('strategy', 전략 이름 또는 None) / ('change', 투수 ID)
+Action = Tuple[str, Optional[object]]
+
+BATTING_ACTIONS = [('strategy', None)] + [('strategy', name) for name in BATTING_STRATEGIES]
+PITCHING_ACTIONS = [('strategy', None)] + [('strategy', name) for name in PITCHING_STRATEGIES]
+
+
+class _Node:
+    __slots__ = ('actions', 'visits', 'action_visits', 'action_values')
+
+    def __init__(self, actions: List[Action]):
+        self.actions = actions
+        self.visits = 0
+        self.action_visits = [0] * len(actions)
+        self.action_values = [0.0] * len(actions)
+
+
+class SearchResult(NamedTuple):
+    action: Action
+    win_prob: float
+    iterations: int
+    elapsed: float
+    stats: Dict[Action, Tuple[int, float]]  # 행동별 (방문 수, 평균 승률)
+
+
+class ManagerMCTS:
+    """
+    manage_home=True면 홈팀 감독 입장에서 탐색
+
+    max_relievers: 교체 후보로 펼칠 불펜 투수 수 (불펜 overall 상위)
+    """
+
+    def __init__(self, model: HeadlessGame, manage_home: bool = True, exploration: float = 0.7,
+                 max_relievers: int = 3):
+        self.model = model
+        self.manage_home = manage_home
+        self.exploration = exploration
+        self.max_relievers = max_relievers
+        self.table: Dict[tuple, _Node] = {}
+
+    def legal_actions(self, state: SimState) -> List[Action]:
+        if self.model.fielding_is_home(state) != self.manage_home:
+            return list(BATTING_ACTIONS)
+        actions = list(PITCHING_ACTIONS)
+        if not state.changed:
+            bullpen = state.home_bullpen if self.manage_home else state.away_bullpen
+            actions += [('change', pitcher_id) for pitcher_id in bullpen[:self.max_relievers]]
+        return actions
+
+    def _apply(self, state: SimState, action: Action) -> SimState:
+        kind, value = action
+        if kind == 'change':
+            return self.model.change_pitcher(state, value)
+        return self._next_decision(self.model.play(state, value))
+
+    def _next_decision(self, state: SimState) -> SimState:
+        """상대팀 수비 차례면 상대 기본 교체 정책을 먼저 적용"""
+        if not self.model.is_terminal(state) and self.model.fielding_is_home(state) != self.manage_home:
+            return self.model.default_change(state)
+        return state
+
+    def _result(self, state: SimState) -> float:
+        home = self.model.home_result(state)
+        return home if self.manage_home else 1.0 - home
+
+    def _select(self, node: _Node) -> int:
+        for i, visits in enumerate(node.action_visits):
+            if visits == 0:
+                return i
+        log_visits = math.log(node.visits)
+        return max(
+            range(len(node.actions)),
+            key=lambda i: node.action_values[i] / node.action_visits[i]
+            + self.exploration * math.sqrt(log_visits / node.action_visits[i])
+        )
+
+    def _iterate(self, root: SimState):
+        path = []
+        state = root
+        while not self.model.is_terminal(state):
+            key = self.model.key(state)
+            node = self.table.get(key)
+            expanded = node is None
+            if expanded:
+                node = self.table[key] = _Node(self.legal_actions(state))
+            index = self._select(node)
+            path.append((node, index))
+            state = self._apply(state, node.actions[index])
+            if expanded:
+                break
+
+        value = self._result(self.model.rollout(state))
+        for node, index in path:
+            node.visits += 1
+            node.action_visits[index] += 1
+            node.action_values[index] += value
+
+    def search(self, state: SimState, time_budget: float = 0.2, max_iterations: Optional[int] = None) -> SearchResult:
+        """
+        시간 예산(초) 동안 탐색 후 가장 많이 방문한 행동 반환 (root는 결정할 팀의 타석 직전 상황)
+
+        예산과 상관없이 최소 한 번은 반복하고, 이미 끝난 경기면 ('strategy', None)을 돌려준다.
+        """
+        start = time.perf_counter()
+        deadline = start + time_budget
+        state = self._next_decision(state)
+        if self.model.is_terminal(state):
+            return SearchResult(('strategy', None), self._result(state), 0, time.perf_counter() - start, {})
+        iterations = 0
+        while True:
+            self._iterate(state)
+            iterations += 1
+            if time.perf_counter() >= deadline or (max_iterations is not None and iterations >= max_iterations):
+                break
+
+        node = self.table[self.model.key(state)]
+        stats = {
+            action: (visits, value / visits if visits else 0.0)
+            for action, visits, value in zip(node.actions, node.action_visits, node.action_values)
+        }
+        best = max(stats, key=lambda action: stats[action][0])
+        return SearchResult(best, stats[best][1], iterations, time.perf_counter() - start, stats)
+
+    def best_plan(self, state: SimState, result: SearchResult) -> Tuple[Optional[int], Optional[str]]:
+        """(교체할 투수 ID 또는 None, 이번 타석 전략) - 교체를 골랐으면 교체 후 노드의 최다 방문 전략"""
+        kind, value = result.action
+        if kind == 'strategy':
+            return None, value
+        node = self.table.get(self.model.key(self.model.change_pitcher(state, value)))
+        if node is None or not node.visits:
+            return value, None
+        best = max(range(len(node.actions)), key=lambda i: node.action_visits[i])
+        return value, node.actions[best][1]
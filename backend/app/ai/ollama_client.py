@@ -1,8 +1,9 @@
 """
 Ollama LLM 클라이언트
 """
+import json
 import requests
-from typing import Optional
+from typing import Iterator, Optional
 
 
 class OllamaClient:
@@ -14,16 +15,16 @@ class OllamaClient:
         server_type = "RunPod GPU" if "runpod" in base_url.lower() else "로컬"
         print(f"{'🚀' if 'runpod' in base_url.lower() else '💻'} {server_type} Ollama 서버 사용: {base_url}")
 
-    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    def _build_payload(self, prompt: str, system_prompt: Optional[str], stream: bool) -> dict:
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        payload = {
+        return {
             "model": self.model,
             "messages": messages,
-            "stream": False,
+            "stream": stream,
             "options": {
                 "temperature": 0.3,
                 "top_p": 0.9,
@@ -31,6 +32,9 @@ class OllamaClient:
             }
         }
 
+    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        payload = self._build_payload(prompt, system_prompt, stream=False)
+
         try:
             response = requests.post(self.chat_url, json=payload, timeout=120)
             response.raise_for_status()
@@ -38,3 +42,23 @@ class OllamaClient:
         except requests.exceptions.RequestException as e:
             print(f"Ollama API 오류: {e}")
             return "[AI 응답 실패]"
+
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """토큰 조각을 생성되는 대로 yield (NDJSON 스트리밍)"""
+        payload = self._build_payload(prompt, system_prompt, stream=True)
+
+        try:
+            with requests.post(self.chat_url, json=payload, timeout=120, stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    content = chunk.get('message', {}).get('content', '')
+                    if content:
+                        yield content
+                    if chunk.get('done'):
+                        break
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Ollama API 오류: {e}")
+            yield "[AI 응답 실패]"
@@ -0,0 +1,116 @@
+"""
+순차 표본 평가 - 선택지(전략, 투수 교체 등)를 배치 단위로 시뮬레이션하다가
+최선이 나머지와 신뢰구간으로 갈리거나 시간 예산이 끝나면 멈춘다
+
+구간은 정규 근사에 선택지 수 보정(Bonferroni)을 한 것이고, 이미 밀린 선택지는 더 뽑지 않는다.
+"""
+import time
+from statistics import NormalDist
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from ..game_engine.aggregation import RunningStats
+from ..game_engine.headless import HeadlessGame, SimState
+from .manager_mcts import ManagerMCTS
+
+# sampler(선택지, 표본 수) → 결과 배열 (클수록 좋음)
+Sampler = Callable[[Hashable, int], Sequence[float]]
+
+
+class OptionEstimate(NamedTuple):
+    option: Hashable
+    mean: float
+    low: float
+    high: float
+    samples: int
+
+
+class EvaluationResult(NamedTuple):
+    best: Hashable
+    estimates: List[OptionEstimate]  # 평균 내림차순
+    samples: int                     # 전체 표본 수
+    elapsed: float
+    separated: bool                  # 최선이 신뢰수준으로 갈렸는지 (False면 예산 소진)
+    confidence: float
+
+
+def _z(confidence: float, options: int) -> float:
+    return NormalDist().inv_cdf(1 - (1 - confidence) / (2 * max(options - 1, 1)))
+
+
+def evaluate_options(sampler: Sampler, options: Sequence[Hashable], confidence: float = 0.95,
+                     batch: int = 100, min_samples: int = 200, max_samples: int = 20000,
+                     time_budget: float = 1.0, tolerance: float = 0.0) -> EvaluationResult:
+    """
+    선택지마다 min_samples까지 뽑은 뒤, 아직 최선과 구간이 겹치는 선택지만 batch씩 더 뽑는다
+
+    멈춤 조건: 최선의 하한이 나머지 상한보다 엄격히 높음(tolerance만큼 겹쳐도 허용, 평균이 같은 동점은 불허),
+    선택지당 max_samples 도달, 또는 time_budget(초) 초과
+    """
+    start = time.perf_counter()
+    deadline = start + time_budget
+    stats: Dict[Hashable, RunningStats] = {option: RunningStats() for option in options}
+    z = _z(confidence, len(options))
+
+    def bounds(option):
+        s = stats[option]
+        half = z * s.stderr
+        return s.mean - half, s.mean + half
+
+    contenders = list(options)
+    separated = False
+    while True:
+        for option in contenders:
+            n = min(batch, max_samples - stats[option].count)
+            if stats[option].count < min_samples:
+                n = max(n, min(min_samples, max_samples) - stats[option].count)
+            if n > 0:
+                stats[option].add_many(sampler(option, n))
+
+        best = max(options, key=lambda option: stats[option].mean)
+        best_low, best_mean = bounds(best)[0], stats[best].mean
+        # 상한이 최선의 하한에 닿거나 평균이 같으면(분산 0인 동점 포함) 아직 갈리지 않은 것
+        contenders = [best] + [
+            option for option in options
+            if option != best and (bounds(option)[1] >= best_low + tolerance or stats[option].mean >= best_mean)
+        ]
+        if len(contenders) == 1:
+            separated = True
+            break
+        if time.perf_counter() >= deadline or all(stats[option].count >= max_samples for option in contenders):
+            break
+
+    estimates = [OptionEstimate(option, stats[option].mean, *bounds(option), stats[option].count) for option in options]
+    estimates.sort(key=lambda e: e.mean, reverse=True)
+    return EvaluationResult(
+        best, estimates, sum(s.count for s in stats.values()), time.perf_counter() - start, separated, confidence
+    )
+
+
+def decision_sampler(model: HeadlessGame, state: SimState, manage_home: bool = True) -> Sampler:
+    """
+    ManagerMCTS 행동(('strategy', 이름) / ('change', 투수 ID))을 적용하고 기본 정책으로 끝까지 진행한
+    결정 팀의 승리(1) / 무(0.5) / 패(0)
+    """
+    def sample(action, n: int) -> np.ndarray:
+        kind, value = action
+        results = np.empty(n)
+        for i in range(n):
+            if kind == 'change':
+                after = model.rollout(model.change_pitcher(state, value))
+            else:
+                after = model.rollout(model.play(state, value))
+            home = model.home_result(after)
+            results[i] = home if manage_home else 1.0 - home
+        return results
+
+    return sample
+
+
+def evaluate_decisions(model: HeadlessGame, state: SimState, actions: Optional[Sequence] = None,
+                       manage_home: bool = True, **kwargs) -> EvaluationResult:
+    """타석 직전 상황의 행동들을 순차 표본으로 비교 (actions 기본값은 ManagerMCTS.legal_actions)"""
+    if actions is None:
+        actions = ManagerMCTS(model, manage_home).legal_actions(state)
+    return evaluate_options(decision_sampler(model, state, manage_home), actions, **kwargs)
@@ -1,6 +1,11 @@
 """
 LLM 기반 코치 전략 조언 시스템
 """
+from ..game_engine.at_bat_simulator import AtBatSimulator
+from ..game_engine.run_expectancy import run_value, runners_to_mask
+from ..game_engine.strategy import BATTING_STRATEGIES, PITCHING_STRATEGIES
+
+_simulator = AtBatSimulator()
 
 
 def _format_runners(runners):
@@ -12,7 +17,7 @@ def _get_score_situation(game_state):
     return f"원정 {game_state['away_score']} - {game_state['home_score']} 홈"
 
 
-def _analyze_situation(game_state):
+def _situation_flags(game_state):
     situations = []
     runners = game_state['runners']
 
@@ -31,6 +36,11 @@ def _analyze_situation(game_state):
     if game_state.get('pitcher_fatigue', 0) >= 80:
         situations.append("투수 피로")
 
+    return situations
+
+
+def _analyze_situation(game_state):
+    situations = _situation_flags(game_state)
     return ", ".join(situations) if situations else "일반 상황"
 
 
@@ -132,3 +142,47 @@ def generate_batting_coach_prompt(batter, pitcher, game_state):
 def generate_strategy_advice_prompt(batter, pitcher, game_state):
     """하위 호환성을 위한 래퍼"""
     return generate_pitching_coach_prompt(batter, pitcher, game_state)
+
+
+def _expected_run_value(batter, pitcher, game_state, strategy=None):
+    probs = _simulator.outcome_probabilities(batter['ratings_20_80'], pitcher['ratings_20_80'], game_state, strategy)
+    bases = runners_to_mask(game_state['runners'])
+    outs = game_state['outs']
+    return sum(p * run_value(bases, outs, outcome) for outcome, p in probs.items())
+
+
+def recommend_strategy(batter, pitcher, game_state, is_batting):
+    """
+    LLM 없이 즉시 계산하는 규칙/확률 기반 전략 추천
+
+    AtBatSimulator 확률과 strategy.py 보정치로 전략별 기대 득점 변화(RE24)를 구하고
+    공격은 최대, 수비는 최소가 되는 전략을 고른다.
+    """
+    options = BATTING_STRATEGIES if is_batting else PITCHING_STRATEGIES
+    baseline = _expected_run_value(batter, pitcher, game_state)
+    scores = {key: _expected_run_value(batter, pitcher, game_state, key) for key in options}
+
+    if is_batting:
+        best = max(scores, key=scores.get)
+        if scores[best] <= baseline:
+            best = None
+    else:
+        best = min(scores, key=scores.get)
+        if scores[best] >= baseline:
+            best = None
+
+    situation = _analyze_situation(game_state)
+    condition = _assess_pitcher_condition(game_state)
+    if best is None:
+        reason = f"보정 없는 기본 승부가 가장 유리 (기대 득점 {baseline:+.3f})"
+    else:
+        delta = scores[best] - baseline
+        reason = f"{options[best]['name']} 기대 득점 {scores[best]:+.3f} (기본 대비 {delta:+.3f})"
+
+    return {
+        'strategy': best,
+        'name': options[best]['name'] if best else '기본',
+        'reason': f"{reason} | 상황: {situation} | 투수 상태: {condition}",
+        'baseline': baseline,
+        'scores': scores
+    }
@@ -0,0 +1,45 @@
+"""
+원자적 파일 쓰기 헬퍼 (같은 디렉토리의 임시 파일에 쓴 뒤 rename)
+
+표준 라이브러리만 사용 - backend.app 패키지 초기화 없이 데이터 수집 스크립트에서도 import 가능.
+"""
+import json
+import os
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def atomic_path(path: Path):
+    """
+    임시 파일 경로를 넘겨주고, 블록이 끝나면 path로 교체 - 중단되어도 기존 파일이 깨지지 않음
+
+    임시 파일은 open()과 같은 0666 & ~umask 권한으로 만든다 (mkstemp의 0600 대신).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+    os.close(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+    try:
+        yield str(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_bytes_atomic(path: Path, data: bytes):
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def write_json_atomic(path: Path, data, indent: int = 2):
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
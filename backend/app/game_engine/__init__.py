@@ -1,4 +1,14 @@
+from .aggregation import GameAggregate
 from .at_bat_simulator import AtBatSimulator
+from .box_score import BoxScore
+from .event_log import EventLog
 from .game_state import GameState
+from .lineup_optimizer import LineupOptimizer, lineup_expected_runs, optimize_lineup
+from .pitch_simulator import PitchSimulator
+from .ratings_table import RatingsTable
+from .win_probability import WinProbability, league_win_probability
 
-__all__ = ['AtBatSimulator', 'GameState']
+__all__ = [
+    'AtBatSimulator', 'BoxScore', 'EventLog', 'GameAggregate', 'GameState', 'LineupOptimizer', 'PitchSimulator',
+    'RatingsTable', 'WinProbability', 'league_win_probability', 'lineup_expected_runs', 'optimize_lineup'
+]
@@ -0,0 +1,263 @@
+"""
+대량 시뮬레이션용 온라인 집계 - 결과를 모아 두지 않고 나오는 대로 줄인다
+
+모든 누적기는 add(하나)/add_many(배열)로 쌓고 merge로 합칠 수 있으며 메모리는 일정하다
+(선수별 기록만 선수 수에 비례). 프로세스 풀 워커가 각자 집계한 뒤 피클로 돌려받아 merge하면 된다.
+"""
+import random
+from functools import reduce
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from .event_log import EventLog
+from .events import Event, PlateAppearance
+from .headless import HeadlessGame, SimState
+from .run_expectancy import OUTCOMES
+
+# 선수별 기록 컬럼 - 타석 결과 8개 + 득점(타자는 타점, 투수는 실점) + 투구수
+COUNT_COLUMNS = OUTCOMES + ('runs', 'pitches')
+_RUNS_COLUMN = len(OUTCOMES)
+_PITCHES_COLUMN = len(OUTCOMES) + 1
+
+
+class RunningStats:
+    """Welford 평균/분산 - 배치는 배치 통계를 만든 뒤 Chan 공식으로 합침"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+
+    def add(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    def add_many(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        if not len(values):
+            return
+        batch = RunningStats()
+        batch.count = len(values)
+        batch.mean = float(values.mean())
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        batch.min, batch.max = float(values.min()), float(values.max())
+        self.merge(batch)
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        if not other.count:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """표본 분산"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return self.variance ** 0.5
+
+    @property
+    def stderr(self) -> float:
+        return (self.variance / self.count) ** 0.5 if self.count else float('inf')
+
+
+class Histogram:
+    """정수 고정 구간 [low, high] 히스토그램 - 범위 밖 값은 양 끝 구간에 넣음"""
+
+    def __init__(self, low: int, high: int):
+        self.low = low
+        self.high = high
+        self.counts = np.zeros(high - low + 1, dtype=np.int64)
+
+    def add(self, value: int):
+        self.counts[min(max(int(value), self.low), self.high) - self.low] += 1
+
+    def add_many(self, values):
+        index = np.clip(np.asarray(values, dtype=np.int64).ravel(), self.low, self.high) - self.low
+        self.counts += np.bincount(index, minlength=len(self.counts))
+
+    def merge(self, other: 'Histogram') -> 'Histogram':
+        if (other.low, other.high) != (self.low, self.high):
+            raise ValueError(f"구간이 다른 히스토그램: {(self.low, self.high)} vs {(other.low, other.high)}")
+        self.counts += other.counts
+        return self
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    @property
+    def values(self) -> np.ndarray:
+        return np.arange(self.low, self.high + 1)
+
+    def pmf(self) -> np.ndarray:
+        total = self.total
+        return self.counts / total if total else np.zeros(len(self.counts))
+
+    def quantile(self, q: float) -> int:
+        cumulative = np.cumsum(self.counts)
+        return int(self.values[np.searchsorted(cumulative, q * cumulative[-1])])
+
+
+class PlayerCounter:
+    """선수 ID별 COUNT_COLUMNS 카운트 (행은 처음 본 순서로 추가)"""
+
+    def __init__(self):
+        self._rows: Dict[int, int] = {}
+        self.counts = np.zeros((0, len(COUNT_COLUMNS)), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _row_indexes(self, player_ids) -> np.ndarray:
+        new = [int(pid) for pid in dict.fromkeys(np.asarray(player_ids).tolist()) if int(pid) not in self._rows]
+        if new:
+            for pid in new:
+                self._rows[pid] = len(self._rows)
+            grown = np.zeros((len(self._rows), len(COUNT_COLUMNS)), dtype=np.int64)
+            grown[:len(self.counts)] = self.counts
+            self.counts = grown
+        return np.fromiter((self._rows[int(pid)] for pid in np.asarray(player_ids).tolist()), dtype=np.int64)
+
+    def add_many(self, player_ids, outcomes, runs, pitches):
+        """같은 길이의 배열 - outcomes는 OUTCOMES 인덱스"""
+        if not len(player_ids):
+            return
+        rows = self._row_indexes(player_ids)
+        np.add.at(self.counts, (rows, np.asarray(outcomes, dtype=np.int64)), 1)
+        np.add.at(self.counts[:, _RUNS_COLUMN], rows, np.asarray(runs, dtype=np.int64))
+        np.add.at(self.counts[:, _PITCHES_COLUMN], rows, np.asarray(pitches, dtype=np.int64))
+
+    def merge(self, other: 'PlayerCounter') -> 'PlayerCounter':
+        if len(other):
+            ids = list(other._rows)
+            rows = self._row_indexes(ids)  # 새 ID가 있으면 self.counts가 새 배열로 바뀌므로 먼저 계산
+            self.counts[rows] += other.counts[[other._rows[pid] for pid in ids]]
+        return self
+
+    def get(self, player_id: int) -> Dict[str, int]:
+        row = self._rows.get(int(player_id))
+        if row is None:
+            return dict.fromkeys(COUNT_COLUMNS, 0)
+        return dict(zip(COUNT_COLUMNS, self.counts[row].tolist()))
+
+    def items(self):
+        for player_id, row in self._rows.items():
+            yield player_id, dict(zip(COUNT_COLUMNS, self.counts[row].tolist()))
+
+
+class GameAggregate:
+    """
+    경기 결과 집계 - 팀별 득점, 점수차(홈 - 원정) 분포, 홈팀 승/무/패, 타자/투수별 기록
+
+    add_game은 끝난 상태(SimState 또는 GameState)와 그 경기의 이벤트(EventLog 또는 이벤트 목록)를 받는다.
+    """
+
+    def __init__(self, max_runs: int = 30, max_margin: int = 30):
+        self.games = 0
+        self.home_runs = RunningStats()
+        self.away_runs = RunningStats()
+        self.margin = RunningStats()
+        self.home_runs_hist = Histogram(0, max_runs)
+        self.away_runs_hist = Histogram(0, max_runs)
+        self.margin_hist = Histogram(-max_margin, max_margin)
+        self.results = np.zeros(3, dtype=np.int64)  # 홈팀 기준 [패, 무, 승]
+        self.batting = PlayerCounter()
+        self.pitching = PlayerCounter()
+
+    def add_game(self, final, events: Optional[Iterable[Event]] = None):
+        home, away = final.home_score, final.away_score
+        self.games += 1
+        self.home_runs.add(home)
+        self.away_runs.add(away)
+        self.margin.add(home - away)
+        self.home_runs_hist.add(home)
+        self.away_runs_hist.add(away)
+        self.margin_hist.add(home - away)
+        self.results[(home > away) - (home < away) + 1] += 1
+        if events is not None:
+            self.add_events(events)
+
+    def add_events(self, events: Iterable[Event]):
+        """타석 이벤트만 선수별 기록에 반영 (EventLog면 컬럼째 처리)"""
+        if isinstance(events, EventLog):
+            columns = events.columns()
+            pa = columns['kind'] == 0
+            outcomes, runs, pitches = columns['outcome'][pa], columns['runs'][pa], columns['pitches'][pa]
+            self.batting.add_many(columns['batter_id'][pa], outcomes, runs, pitches)
+            self.pitching.add_many(columns['pitcher_id'][pa], outcomes, runs, pitches)
+            return
+        plate_appearances = [e for e in events if isinstance(e, PlateAppearance)]
+        if plate_appearances:
+            outcomes = [OUTCOMES.index(e.outcome) for e in plate_appearances]
+            runs = [e.runs for e in plate_appearances]
+            pitches = [e.pitches for e in plate_appearances]
+            self.batting.add_many([e.batter_id for e in plate_appearances], outcomes, runs, pitches)
+            self.pitching.add_many([e.pitcher_id for e in plate_appearances], outcomes, runs, pitches)
+
+    def merge(self, other: 'GameAggregate') -> 'GameAggregate':
+        self.games += other.games
+        for name in ('home_runs', 'away_runs', 'margin', 'home_runs_hist', 'away_runs_hist', 'margin_hist',
+                     'batting', 'pitching'):
+            getattr(self, name).merge(getattr(other, name))
+        self.results += other.results
+        return self
+
+    @property
+    def home_win_rate(self) -> float:
+        """무승부는 절반으로"""
+        return (self.results[2] + 0.5 * self.results[1]) / self.games if self.games else 0.0
+
+
+def merge_all(parts: Iterable):
+    """워커별 누적기를 하나로 (첫 번째에 합침)"""
+    return reduce(lambda total, part: total.merge(part), parts)
+
+
+def aggregate_rollouts(model: HeadlessGame, state: SimState, games: int, seed: Optional[int] = None,
+                       with_players: bool = True, flush_events: int = 4096) -> GameAggregate:
+    """
+    같은 상황에서 기본 정책으로 games번 끝까지 진행하며 집계 (프로세스 풀 워커로 쓸 수 있는 최상위 함수)
+
+    seed를 주면 model.rng를 새로 만든다. 선수 기록은 이벤트를 EventLog에 flush_events개까지 모았다가
+    컬럼째 반영하고 로그를 비운다.
+    """
+    if seed is not None:
+        model.rng = random.Random(seed)
+    aggregate = GameAggregate()
+    log = EventLog(flush_events)
+    for _ in range(games):
+        if not with_players:
+            aggregate.add_game(model.rollout(state))
+            continue
+        aggregate.add_game(_drain(model.events(state), log))
+        if len(log) >= flush_events:
+            aggregate.add_events(log)
+            log.clear()
+    if len(log):
+        aggregate.add_events(log)
+    return aggregate
+
+
+def _drain(events, log: EventLog):
+    """이벤트 제너레이터를 끝까지 돌려 log에 쌓고 제너레이터 반환값(끝난 상태)을 돌려줌"""
+    while True:
+        try:
+            log.append(next(events))
+        except StopIteration as stop:
+            return stop.value
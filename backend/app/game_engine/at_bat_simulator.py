@@ -2,18 +2,45 @@
 타석 시뮬레이터 - 확률 기반 결과 계산
 """
 import random
-from typing import Dict, Tuple
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .ratings_table import RatingsTable
+
+PlayerRef = Union[int, Dict]
+
+
+def _clip(value, low, high):
+    """스칼라는 max/min, 배열은 np.clip"""
+    if isinstance(value, np.ndarray):
+        return np.clip(value, low, high)
+    return max(low, min(high, value))
 
 
 class AtBatSimulator:
-    def __init__(self):
-        self.outcomes = ['single', 'double', 'triple', 'homerun', 'strikeout', 'walk', 'groundout', 'flyout']
+    """
+    선수는 dict(ratings_20_80 포함) 또는 선수 ID로 전달 - ID는 ratings 테이블에서 조회
+    """
 
-    def simulate(self, batter: Dict, pitcher: Dict, game_state: Dict, strategy: str = None) -> Tuple[str, Dict]:
-        b_ratings = batter['ratings_20_80']
-        p_ratings = pitcher['ratings_20_80']
-        outcome = self._determine_outcome(b_ratings, p_ratings, game_state, strategy)
-        details = {'batter_name': batter['name'], 'pitcher_name': pitcher['name']}
+    def __init__(self, ratings: Optional[RatingsTable] = None):
+        self.outcomes = ['single', 'double', 'triple', 'homerun', 'strikeout', 'walk', 'groundout', 'flyout']
+        self.ratings = ratings
+
+    def _ratings_of(self, player: PlayerRef):
+        if isinstance(player, (int, np.integer)):
+            return self.ratings.row(player)
+        return player['ratings_20_80']
+
+    @staticmethod
+    def _describe(player: PlayerRef, role: str) -> Dict:
+        if isinstance(player, (int, np.integer)):
+            return {f'{role}_id': int(player)}
+        return {f'{role}_name': player['name']}
+
+    def simulate(self, batter: PlayerRef, pitcher: PlayerRef, game_state: Dict, strategy: str = None) -> Tuple[str, Dict]:
+        outcome = self._determine_outcome(self._ratings_of(batter), self._ratings_of(pitcher), game_state, strategy)
+        details = {**self._describe(batter, 'batter'), **self._describe(pitcher, 'pitcher')}
         return outcome, details
 
     def _determine_outcome(self, batter: Dict, pitcher: Dict, state: Dict, strategy: str = None) -> str:
@@ -41,6 +68,63 @@ class AtBatSimulator:
         else:
             return 'groundout' if random.random() < 0.55 else 'flyout'
 
+    def outcome_probabilities(self, batter, pitcher, state: Dict, strategy: str = None) -> Dict[str, float]:
+        """
+        _determine_outcome과 같은 규칙으로 결과별 확률을 해석적으로 계산
+
+        batter/pitcher는 능력치 dict, 선수 ID, 또는 RatingsTable 행 배열(브로드캐스트)
+        """
+        if isinstance(batter, (int, np.integer)):
+            batter = self.ratings.row(batter)
+        if isinstance(pitcher, (int, np.integer)):
+            pitcher = self.ratings.row(pitcher)
+
+        walk_rate = self._calculate_walk_rate(batter, pitcher, state)
+        strikeout_rate = self._calculate_strikeout_rate(batter, pitcher, state)
+        hit_rate = self._calculate_hit_rate(batter, pitcher, state)
+
+        power_modifier = 1.0
+        if strategy:
+            from .strategy import apply_strategy
+            modified = apply_strategy({'walk': walk_rate, 'strikeout': strikeout_rate, 'hit': hit_rate}, strategy)
+            walk_rate = modified['walk']
+            strikeout_rate = modified['strikeout']
+            hit_rate = modified['hit']
+            power_modifier = modified.get('power_modifier', 1.0)
+
+        def cum(value):
+            return _clip(value, 0.0, 100.0) / 100
+
+        p_walk = cum(walk_rate)
+        p_strikeout = cum(walk_rate + strikeout_rate) - p_walk
+        p_hit = cum(walk_rate + strikeout_rate + hit_rate) - p_walk - p_strikeout
+        p_out = 1.0 - p_walk - p_strikeout - p_hit
+
+        power_factor = (batter['power'] - 50) / 50
+        movement_factor = (pitcher['movement'] - 50) / 50
+        hr_rate = _clip((14.0 + power_factor * 8 - movement_factor * 4) * power_modifier, 2, 30) / 100
+        xbh_rate = _clip(27.0 + power_factor * 12 - movement_factor * 6, 15, 45) / 100
+
+        return {
+            'single': p_hit * (1 - hr_rate - xbh_rate),
+            'double': p_hit * xbh_rate * 0.92,
+            'triple': p_hit * xbh_rate * 0.08,
+            'homerun': p_hit * hr_rate,
+            'strikeout': p_strikeout,
+            'walk': p_walk,
+            'groundout': p_out * 0.55,
+            'flyout': p_out * 0.45
+        }
+
+    def outcome_matrix(self, batter_ids: Sequence[int], pitcher_ids: Sequence[int],
+                       state: Dict, strategy: str = None) -> np.ndarray:
+        """투수 x 타자 x 결과(self.outcomes 순서) 확률 배열 - 한 번의 팬시 인덱싱으로 계산"""
+        batters = self.ratings.rows(batter_ids)[np.newaxis, :]
+        pitchers = self.ratings.rows(pitcher_ids)[:, np.newaxis]
+        probs = self.outcome_probabilities(batters, pitchers, state, strategy)
+        shape = (len(pitcher_ids), len(batter_ids))
+        return np.stack([np.broadcast_to(probs[outcome], shape) for outcome in self.outcomes], axis=-1)
+
     def _calculate_walk_rate(self, batter: Dict, pitcher: Dict, state: Dict) -> float:
         eye_factor = (batter['eye'] - 50) / 50
         control_factor = (pitcher['control'] - 50) / 50
@@ -55,7 +139,7 @@ class AtBatSimulator:
         if fatigue > 85:
             walk_rate += 2.5
 
-        return max(3, min(18, walk_rate))
+        return _clip(walk_rate, 3, 18)
 
     def _calculate_strikeout_rate(self, batter: Dict, pitcher: Dict, state: Dict) -> float:
         contact_factor = (batter['contact'] - 50) / 50
@@ -71,7 +155,7 @@ class AtBatSimulator:
         if state.get('same_handedness'):
             k_rate += 2
 
-        return max(10, min(40, k_rate))
+        return _clip(k_rate, 10, 40)
 
     def _calculate_hit_rate(self, batter: Dict, pitcher: Dict, state: Dict) -> float:
         contact_factor = (batter['contact'] - 50) / 50
@@ -87,7 +171,7 @@ class AtBatSimulator:
         if state.get('same_handedness'):
             hit_rate -= 2
 
-        return max(15, min(40, hit_rate))
+        return _clip(hit_rate, 15, 40)
 
     def _determine_hit_type(self, power: int, movement: int, power_modifier: float = 1.0) -> str:
         power_factor = (power - 50) / 50
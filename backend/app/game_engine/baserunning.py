@@ -0,0 +1,207 @@
+"""
+주루/병살 전이 테이블
+
+(타석 결과, 베이스-아웃 상태, 주자 스피드 구간, 수비 구간) → 다음 상태/득점 확률 분포.
+수비는 수비팀 야수들의 defense 평균으로 구간을 나눈다. 스피드는 엔진에 따라 다르다:
+- 라이브 경기(app.process_outcome): 타석마다 가장 앞선 주자(없으면 타자)의 speed - lead_runner_bucket
+- Markov/배치/MCTS 엔진(상태에 주자 이름이 없음): 공격팀 타순의 speed 평균 - team_buckets
+테이블은 import 시 한 번 만들어 배열로 두고, 타석마다 조회만 한다.
+"""
+import random
+from bisect import bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .run_expectancy import OUTCOMES
+
+N_STATES = 24
+INNING_OVER = 24
+MAX_RUNS_PER_PA = 4
+
+# 능력치 구간 경계 (40 미만 / 60 미만 / 60 이상)
+BUCKET_EDGES = (40, 60)
+N_BUCKETS = len(BUCKET_EDGES) + 1
+AVERAGE_BUCKET = 1
+
+# 스피드가 빠를수록, 수비가 나쁠수록 추가 진루 확률 증가
+SPEED_ADJUST = (-0.12, 0.0, 0.12)
+DEFENSE_ADJUST = (0.06, 0.0, -0.06)
+
+Baserunning = Tuple[int, int]  # (스피드 구간, 수비 구간)
+
+
+def bucket(rating: float) -> int:
+    return int(sum(rating >= edge for edge in BUCKET_EDGES))
+
+
+def team_buckets(ratings, batting_ids: Sequence[int], fielding_ids: Sequence[int]) -> Baserunning:
+    """
+    RatingsTable로 (공격팀 스피드 구간, 수비팀 수비 구간) - 수비팀 타순을 모르면 평균 수비
+
+    스피드는 타순 평균 - 주자를 구분하지 않는 Markov/배치/MCTS 엔진용 (라이브 경기는 lead_runner_bucket)
+    """
+    speed = bucket(ratings.column('speed', batting_ids).mean())
+    defense = bucket(ratings.column('defense', fielding_ids).mean()) if len(fielding_ids) else AVERAGE_BUCKET
+    return speed, defense
+
+
+def lead_runner_bucket(runner_speeds: Sequence[Optional[float]], batter_speed: float) -> int:
+    """
+    라이브 경기의 타석별 스피드 구간 - 가장 앞선 주자의 speed, 주자가 없으면 타자의 speed
+
+    runner_speeds: 1루, 2루, 3루 주자의 speed (빈 베이스는 None)
+    """
+    for speed in reversed(runner_speeds):
+        if speed is not None:
+            return bucket(speed)
+    return bucket(batter_speed)
+
+
+def _clip(p: float) -> float:
+    return max(0.02, min(0.98, p))
+
+
+def _branches(outcome: str, bases: int, outs: int, speed: int, defense: int) -> List[Tuple[float, int, int, int]]:
+    """[(확률, 다음 주자 마스크, 다음 아웃, 득점)]"""
+    extra = SPEED_ADJUST[speed] + DEFENSE_ADJUST[defense]
+    two_outs = outs == 2
+    on1, on2, on3 = bool(bases & 1), bool(bases & 2), bool(bases & 4)
+
+    if outcome in ('triple', 'homerun'):
+        runs = on1 + on2 + on3
+        if outcome == 'homerun':
+            return [(1.0, 0, outs, runs + 1)]
+        return [(1.0, 0b100, outs, runs)]
+
+    if outcome == 'walk':
+        if bases == 0b111:
+            return [(1.0, 0b111, outs, 1)]
+        if on1:
+            return [(1.0, bases | 0b011 if not on2 else 0b111, outs, 0)]
+        return [(1.0, bases | 1, outs, 0)]
+
+    if outcome == 'strikeout':
+        return [(1.0, bases, outs + 1, 0)]
+
+    if outcome == 'single':
+        # 3루 주자 득점, 2루 주자는 홈 또는 3루, 1루 주자는 (3루가 비면) 3루 또는 2루
+        score2 = _clip(0.60 + extra + (0.25 if two_outs else 0)) if on2 else 0.0
+        first_to_third = _clip(0.28 + extra + (0.10 if two_outs else 0)) if on1 else 0.0
+        branches = []
+        for p2, runner2_scores in ((score2, True), (1 - score2, False)) if on2 else ((1.0, False),):
+            third_free = not on2 or runner2_scores
+            for p1, runner1_to_third in ((first_to_third, True), (1 - first_to_third, False)) if on1 and third_free else ((1.0, False),):
+                new_bases = 0b001
+                if on2 and not runner2_scores:
+                    new_bases |= 0b100
+                if on1:
+                    new_bases |= 0b100 if runner1_to_third else 0b010
+                branches.append((p2 * p1, new_bases, outs, on3 + (on2 and runner2_scores)))
+        return branches
+
+    if outcome == 'double':
+        score1 = _clip(0.40 + extra + (0.20 if two_outs else 0)) if on1 else 0.0
+        base_runs = on2 + on3
+        if not on1:
+            return [(1.0, 0b010, outs, base_runs)]
+        return [(score1, 0b010, outs, base_runs + 1), (1 - score1, 0b110, outs, base_runs)]
+
+    if outcome == 'groundout':
+        branches = []
+        no_double_play = 1.0
+        if on1 and outs < 2:
+            double_play = max(0.05, min(0.85, 0.45 - SPEED_ADJUST[speed] - DEFENSE_ADJUST[defense]))
+            no_double_play = 1 - double_play
+            # 타자와 1루 주자 아웃, 나머지 주자는 한 베이스씩 (3아웃이면 득점 없음)
+            new_outs = outs + 2
+            if new_outs >= 3:
+                branches.append((double_play, 0, 3, 0))
+            else:
+                branches.append((double_play, 0b100 if on2 else 0, new_outs, int(on3)))
+        if outs + 1 >= 3:
+            return branches + [(no_double_play, 0, 3, 0)]
+
+        # 타자만 아웃 - 포스 주자는 진루, 포스가 아닌 주자는 확률적으로 진루
+        forced2 = on1
+        forced3 = on1 and on2
+        advance3 = 1.0 if forced3 else (_clip(0.45 + extra) if on3 else 0.0)
+        for p3, runner3_scores in ((advance3, True), (1 - advance3, False)) if on3 else ((1.0, False),):
+            third_free = not on3 or runner3_scores
+            if on2:
+                advance2 = 1.0 if forced2 else (_clip(0.55 + extra) if third_free else 0.0)
+                options2 = ((advance2, True), (1 - advance2, False))
+            else:
+                options2 = ((1.0, False),)
+            for p2, runner2_advances in options2:
+                if p3 * p2 == 0:
+                    continue
+                new_bases = 0
+                if on3 and not runner3_scores:
+                    new_bases |= 0b100
+                if on2:
+                    new_bases |= 0b100 if runner2_advances else 0b010
+                if on1:
+                    new_bases |= 0b010
+                branches.append((no_double_play * p3 * p2, new_bases, outs + 1, int(on3 and runner3_scores)))
+        return branches
+
+    # flyout - 3루 주자 태그업, 2루 주자는 3루가 비면 태그업 시도
+    if outs + 1 >= 3:
+        return [(1.0, 0, 3, 0)]
+    tag3 = _clip(0.70 + extra) if on3 else 0.0
+    branches = []
+    for p3, runner3_scores in ((tag3, True), (1 - tag3, False)) if on3 else ((1.0, False),):
+        third_free = not on3 or runner3_scores
+        tag2 = _clip(0.25 + extra) if on2 and third_free else 0.0
+        for p2, runner2_advances in ((tag2, True), (1 - tag2, False)) if on2 else ((1.0, False),):
+            new_bases = bases & 0b001
+            if on3 and not runner3_scores:
+                new_bases |= 0b100
+            if on2:
+                new_bases |= 0b100 if runner2_advances else 0b010
+            branches.append((p3 * p2, new_bases, outs + 1, int(on3 and runner3_scores)))
+    return branches
+
+
+def _build():
+    """TRANSITIONS[스피드, 수비, 득점, 상태, 결과, 다음 상태] 확률"""
+    table = np.zeros((N_BUCKETS, N_BUCKETS, MAX_RUNS_PER_PA + 1, N_STATES, len(OUTCOMES), N_STATES + 1))
+    for speed in range(N_BUCKETS):
+        for defense in range(N_BUCKETS):
+            for state in range(N_STATES):
+                for o, outcome in enumerate(OUTCOMES):
+                    for prob, new_bases, new_outs, runs in _branches(outcome, state % 8, state // 8, speed, defense):
+                        next_state = new_outs * 8 + new_bases if new_outs < 3 else INNING_OVER
+                        table[speed, defense, runs, state, o, next_state] += prob
+    return table
+
+
+TRANSITIONS = _build()
+TRANSITIONS.setflags(write=False)
+
+# 샘플링용: [스피드][수비][상태][결과] → (누적 확률, [(다음 상태, 득점)])
+_CHOICES = []
+for _speed in range(N_BUCKETS):
+    _CHOICES.append([])
+    for _defense in range(N_BUCKETS):
+        by_state = []
+        for _state in range(N_STATES):
+            by_outcome = []
+            for _o in range(len(OUTCOMES)):
+                runs_idx, next_idx = np.nonzero(TRANSITIONS[_speed, _defense, :, _state, _o, :])
+                probs = TRANSITIONS[_speed, _defense, runs_idx, _state, _o, next_idx]
+                by_outcome.append((np.cumsum(probs).tolist(), list(zip(next_idx.tolist(), runs_idx.tolist()))))
+            by_state.append(by_outcome)
+        _CHOICES[_speed].append(by_state)
+
+
+def sample_transition(outcome: int, state: int, baserunning: Baserunning,
+                      rng: Optional[random.Random] = None) -> Tuple[int, int]:
+    """결과 인덱스(OUTCOMES 순서)와 상태로 (다음 상태, 득점) 하나 뽑기 - 24는 이닝 종료"""
+    speed, defense = baserunning
+    cumulative, choices = _CHOICES[speed][defense][state][outcome]
+    if len(choices) == 1:
+        return choices[0]
+    r = (rng or random).random() * cumulative[-1]
+    return choices[min(bisect_right(cumulative, r), len(choices) - 1)]
@@ -0,0 +1,63 @@
+"""
+박스스코어 - 경기 이벤트 스트림을 한 번 훑으며 타자/투수 기록과 이닝별 득점 집계
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, Tuple
+
+from .events import HITS, Event, PlateAppearance
+
+BATTING_COLUMNS = ('PA', 'AB', 'H', '2B', '3B', 'HR', 'BB', 'SO', 'RBI')
+PITCHING_COLUMNS = ('BF', 'OUTS', 'H', 'R', 'BB', 'SO', 'PIT')
+
+
+class BoxScore:
+    """
+    이벤트를 add로 하나씩 (또는 consume으로 스트림째) 받아 누적
+
+    batting/pitching: 선수 ID → 컬럼별 기록, line: (이닝, 말 여부) → 득점.
+    타점은 타석 중 들어온 득점으로 계산한다.
+    """
+
+    def __init__(self, events: Iterable[Event] = ()):
+        self.batting: Dict[int, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(BATTING_COLUMNS, 0))
+        self.pitching: Dict[int, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(PITCHING_COLUMNS, 0))
+        self.line: Dict[Tuple[int, bool], int] = defaultdict(int)
+        self.consume(events)
+
+    def consume(self, events: Iterable[Event]) -> 'BoxScore':
+        for event in events:
+            self.add(event)
+        return self
+
+    def add(self, event: Event):
+        if not isinstance(event, PlateAppearance):
+            return
+        outcome = event.outcome
+        batter = self.batting[event.batter_id]
+        pitcher = self.pitching[event.pitcher_id]
+        hit = outcome in HITS
+
+        batter['PA'] += 1
+        batter['AB'] += outcome != 'walk'
+        batter['H'] += hit
+        batter['2B'] += outcome == 'double'
+        batter['3B'] += outcome == 'triple'
+        batter['HR'] += outcome == 'homerun'
+        batter['BB'] += outcome == 'walk'
+        batter['SO'] += outcome == 'strikeout'
+        batter['RBI'] += event.runs
+
+        pitcher['BF'] += 1
+        pitcher['OUTS'] += event.outs_made
+        pitcher['H'] += hit
+        pitcher['R'] += event.runs
+        pitcher['BB'] += outcome == 'walk'
+        pitcher['SO'] += outcome == 'strikeout'
+        pitcher['PIT'] += event.pitches
+
+        self.line[(event.inning, event.is_bottom)] += event.runs
+
+    def innings_pitched(self, pitcher_id: int) -> str:
+        """아웃 수 → '2.1' 형식 이닝"""
+        whole, partial = divmod(self.pitching[pitcher_id]['OUTS'], 3)
+        return f"{whole}.{partial}"
@@ -0,0 +1,240 @@
+"""
+컬럼형 이벤트 로그 - 이벤트를 필드별 NumPy 배열에 쌓아 두는 GameState.play_log
+
+append는 행 튜플을 작은 대기 버퍼에 모았다가 FLUSH_ROWS개마다 배열에 한 번에 쓰고,
+배열은 미리 잡아 두고 가득 차면 두 배로 늘린다. 결과/전략은 코드(int8), 투구 기록은
+Arrow 문자열과 같은 (오프셋, 바이트) 버퍼로 저장해서 이벤트 수만큼 파이썬 객체를 만들지 않는다.
+columns()는 복사 없는 뷰, to_arrow/to_parquet/to_csv는 한 번에 내보낸다 (pyarrow 필요).
+fork()는 배열을 공유하는 갈래를 만들고, 공유 중인 로그는 처음 쓸 때만 배열을 복사한다.
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from .events import Event, InningEnd, PitcherChange, PlateAppearance
+from .run_expectancy import OUTCOMES
+from .strategy import STRATEGIES
+
+KINDS = (PlateAppearance, PitcherChange, InningEnd)
+KIND_NAMES = ('plate_appearance', 'pitcher_change', 'inning_end')
+STRATEGY_NAMES = tuple(STRATEGIES)
+
+_OUTCOME_CODE = {name: code for code, name in enumerate(OUTCOMES)}
+_STRATEGY_CODE = {name: code for code, name in enumerate(STRATEGY_NAMES)}
+
+FLUSH_ROWS = 1024
+
+# 해당 이벤트에 없는 필드는 0, 결과/전략 코드는 -1
+COLUMNS = (
+    ('kind', np.int8),
+    ('inning', np.int16),
+    ('is_bottom', np.bool_),
+    ('batter_id', np.int64),
+    ('pitcher_id', np.int64),
+    ('outcome', np.int8),
+    ('runs', np.int8),
+    ('before', np.int8),
+    ('after', np.int8),
+    ('pitches', np.int16),
+    ('strategy', np.int8),
+    ('home_score', np.int16),
+    ('away_score', np.int16),
+)
+
+
+class EventLog:
+    """
+    append/extend로 이벤트를 쌓고, 인덱스/슬라이스/반복 시에만 이벤트 NamedTuple로 되돌린다
+
+    PitcherChange의 팀은 수비팀이므로 is_bottom에서 복원한다.
+    """
+
+    def __init__(self, capacity: int = 256):
+        capacity = max(1, capacity)
+        self._size = 0
+        self._columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in COLUMNS}
+        self._offsets = np.zeros(capacity + 1, dtype=np.int32)
+        self._chars = np.zeros(capacity * 4, dtype=np.uint8)
+        self._pending: List[tuple] = []
+        self._pending_sequences: List[bytes] = []
+        self._shared = False
+
+    def __len__(self) -> int:
+        return self._size + len(self._pending)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._columns['kind'])
+
+    def _reserve(self, rows: int, chars: int):
+        capacity = self.capacity
+        if self._size + rows > capacity:
+            capacity = max(capacity * 2, self._size + rows)
+            for name, column in self._columns.items():
+                self._columns[name] = _resized(column, capacity)
+            self._offsets = _resized(self._offsets, capacity + 1)
+        end = int(self._offsets[self._size]) + chars
+        if end > len(self._chars):
+            self._chars = _resized(self._chars, max(len(self._chars) * 2, end))
+
+    def append(self, event: Event):
+        if isinstance(event, PlateAppearance):
+            row = (0, event.inning, event.is_bottom, event.batter_id, event.pitcher_id, _OUTCOME_CODE[event.outcome],
+                   event.runs, event.before, event.after, event.pitches, _STRATEGY_CODE.get(event.strategy, -1), 0, 0)
+            self._pending_sequences.append(event.sequence.encode('ascii'))
+        elif isinstance(event, PitcherChange):
+            row = (1, event.inning, event.is_bottom, 0, event.pitcher_id, -1, 0, 0, 0, 0, -1, 0, 0)
+            self._pending_sequences.append(b'')
+        else:
+            row = (2, event.inning, event.is_bottom, 0, 0, -1, 0, 0, 0, 0, -1, event.home_score, event.away_score)
+            self._pending_sequences.append(b'')
+        self._pending.append(row)
+        if len(self._pending) >= FLUSH_ROWS:
+            self._flush()
+
+    def _flush(self):
+        """대기 중인 행을 컬럼 배열로 옮김"""
+        if not self._pending:
+            return
+        if self._shared:
+            self._columns = {name: column.copy() for name, column in self._columns.items()}
+            self._offsets = self._offsets.copy()
+            self._chars = self._chars.copy()
+            self._shared = False
+        rows = len(self._pending)
+        sequences = b''.join(self._pending_sequences)
+        self._reserve(rows, len(sequences))
+        start, stop = self._size, self._size + rows
+        for (name, dtype), values in zip(COLUMNS, zip(*self._pending)):
+            self._columns[name][start:stop] = np.array(values, dtype=dtype)
+
+        base = self._offsets[start]
+        lengths = np.fromiter(map(len, self._pending_sequences), dtype=np.int32, count=rows)
+        self._offsets[start + 1:stop + 1] = base + np.cumsum(lengths)
+        self._chars[base:base + len(sequences)] = np.frombuffer(sequences, dtype=np.uint8)
+        self._size = stop
+        self._pending.clear()
+        self._pending_sequences.clear()
+
+    def extend(self, events: Iterable[Event]):
+        for event in events:
+            self.append(event)
+
+    def clear(self):
+        self.truncate(0)
+
+    def truncate(self, length: int):
+        """앞의 length개만 남김 (스냅샷 복원용) - 배열은 건드리지 않아 공유 중인 갈래에 영향 없음"""
+        self._flush()
+        if not 0 <= length <= self._size:
+            raise ValueError(f"로그 길이 {self._size}보다 길게 자를 수 없음: {length}")
+        self._size = length
+
+    def fork(self) -> 'EventLog':
+        """배열을 복사하지 않고 공유하는 갈래 (copy-on-write)"""
+        self._flush()
+        other = EventLog.__new__(EventLog)
+        other._size = self._size
+        other._columns = dict(self._columns)
+        other._offsets = self._offsets
+        other._chars = self._chars
+        other._pending = []
+        other._pending_sequences = []
+        self._shared = other._shared = True
+        return other
+
+    # ---- 조회 ----
+
+    def columns(self, start: int = 0, stop: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """[start, stop) 구간 필드별 배열 (복사 없는 읽기 전용 뷰)"""
+        self._flush()
+        start, stop, _ = slice(start, stop).indices(self._size)
+        views = {}
+        for name, column in self._columns.items():
+            view = column[start:stop]
+            view.flags.writeable = False
+            views[name] = view
+        return views
+
+    def sequence(self, i: int) -> str:
+        self._flush()
+        return self._chars[self._offsets[i]:self._offsets[i + 1]].tobytes().decode('ascii')
+
+    def event(self, i: int) -> Event:
+        self._flush()
+        c = self._columns
+        kind = int(c['kind'][i])
+        inning, is_bottom = int(c['inning'][i]), bool(c['is_bottom'][i])
+        if kind == 0:
+            strategy = int(c['strategy'][i])
+            return PlateAppearance(
+                inning, is_bottom, int(c['batter_id'][i]), int(c['pitcher_id'][i]), OUTCOMES[c['outcome'][i]],
+                int(c['runs'][i]), int(c['before'][i]), int(c['after'][i]), int(c['pitches'][i]),
+                STRATEGY_NAMES[strategy] if strategy >= 0 else None, self.sequence(i)
+            )
+        if kind == 1:
+            return PitcherChange(inning, is_bottom, 'away' if is_bottom else 'home', int(c['pitcher_id'][i]))
+        return InningEnd(inning, is_bottom, int(c['home_score'][i]), int(c['away_score'][i]))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Event, List[Event]]:
+        self._flush()
+        if isinstance(index, slice):
+            return [self.event(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("이벤트 인덱스 범위 밖")
+        return self.event(index)
+
+    def __iter__(self) -> Iterator[Event]:
+        self._flush()
+        for i in range(self._size):
+            yield self.event(i)
+
+    # ---- 내보내기 ----
+
+    def to_arrow(self):
+        """pyarrow.Table - 숫자 컬럼은 복사 없이 감싸고, 결과/전략/종류는 딕셔너리 컬럼"""
+        import pyarrow as pa
+
+        self._flush()
+        n = self._size
+        c = self._columns
+        arrays = {}
+        for name, _ in COLUMNS:
+            if name in ('kind', 'outcome', 'strategy'):
+                continue
+            arrays[name] = pa.array(c[name][:n])
+        arrays['kind'] = pa.DictionaryArray.from_arrays(pa.array(c['kind'][:n]), pa.array(KIND_NAMES))
+        for name, names in (('outcome', OUTCOMES), ('strategy', STRATEGY_NAMES)):
+            codes = c[name][:n]
+            arrays[name] = pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0), pa.array(list(names), type=pa.string())
+            )
+        arrays['sequence'] = pa.StringArray.from_buffers(
+            n, pa.py_buffer(self._offsets[:n + 1]), pa.py_buffer(self._chars[:self._offsets[n]])
+        )
+        order = ['kind'] + [name for name, _ in COLUMNS if name != 'kind'] + ['sequence']
+        return pa.table({name: arrays[name] for name in order})
+
+    def to_parquet(self, path):
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path)
+
+    def to_csv(self, path):
+        """딕셔너리 컬럼은 이름 문자열로 풀어서 저장"""
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        table = self.to_arrow()
+        for i, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+        pacsv.write_csv(table, path)
+
+
+def _resized(array: np.ndarray, size: int) -> np.ndarray:
+    grown = np.zeros(size, dtype=array.dtype)
+    grown[:min(len(array), size)] = array[:size]
+    return grown
@@ -0,0 +1,44 @@
+"""
+경기 이벤트 - 타석 결과, 투수 교체, 이닝 종료를 작은 NamedTuple로 표현
+
+선수는 ID, 상황은 markov 상태 인덱스(outs * 8 + 주자 마스크, 24는 이닝 종료)로만 담는다.
+중계 문자열, 해설, 박스스코어, 분석은 같은 이벤트 스트림을 각자 소비한다.
+"""
+from typing import NamedTuple, Optional, Union
+
+HITS = frozenset(('single', 'double', 'triple', 'homerun'))
+
+
+class PlateAppearance(NamedTuple):
+    inning: int
+    is_bottom: bool
+    batter_id: int
+    pitcher_id: int
+    outcome: str
+    runs: int
+    before: int  # 타석 전 베이스-아웃 상태
+    after: int   # 타석 후 베이스-아웃 상태 (24 = 이닝 종료)
+    pitches: int
+    strategy: Optional[str] = None
+    sequence: str = ''  # 투구 단위 모드의 투구 기록 ('BSFX')
+
+    @property
+    def outs_made(self) -> int:
+        return (3 if self.after >= 24 else self.after // 8) - self.before // 8
+
+
+class PitcherChange(NamedTuple):
+    inning: int
+    is_bottom: bool
+    team: str  # 'home' / 'away' - 교체한(수비) 팀
+    pitcher_id: int
+
+
+class InningEnd(NamedTuple):
+    inning: int
+    is_bottom: bool
+    home_score: int
+    away_score: int
+
+
+Event = Union[PlateAppearance, PitcherChange, InningEnd]
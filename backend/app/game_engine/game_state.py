@@ -1,7 +1,27 @@
 """
 게임 상태 관리
 """
-from typing import Dict
+import copy
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .event_log import EventLog
+
+
+class GameSnapshot(NamedTuple):
+    """GameState의 불변 스냅샷 - 로그는 길이만 기록 (로그는 추가만 하므로 잘라서 복원)"""
+    inning: int
+    is_bottom: bool
+    outs: int
+    balls: int
+    strikes: int
+    runners: Tuple[Optional[str], Optional[str], Optional[str]]
+    home_score: int
+    away_score: int
+    home_pitcher_pitches: int
+    away_pitcher_pitches: int
+    pitcher_hits_allowed: int
+    final: bool
+    log_length: int
 
 
 class GameState:
@@ -19,7 +39,8 @@ class GameState:
         self.home_pitcher_pitches = 0
         self.away_pitcher_pitches = 0
         self.pitcher_hits_allowed = 0
-        self.play_log = []
+        self.final = False  # 9회 이후 동점이 아닌 채로 이닝 종료
+        self.play_log = EventLog()
 
     @property
     def current_team(self) -> str:
@@ -44,6 +65,13 @@ class GameState:
     def runners_in_scoring_position(self) -> bool:
         return self.runners[2] is not None or self.runners[3] is not None
 
+    @property
+    def base_out_state(self) -> int:
+        """outs * 8 + 주자 마스크 (markov 상태 인덱스), 3아웃이면 24"""
+        if self.outs >= 3:
+            return 24
+        return self.outs * 8 + sum(1 << (base - 1) for base in (1, 2, 3) if self.runners[base] is not None)
+
     def add_runner(self, base: int, player_name: str):
         self.runners[base] = player_name
 
@@ -63,11 +91,36 @@ class GameState:
                     self.runners[base] = None
         return runs_scored
 
+    def apply_transition(self, batter_name: str, bases: int, outs: int, runs: int):
+        """
+        진루 테이블 결과(다음 주자 마스크, 아웃, 득점) 반영
+
+        앞선 주자부터 득점하고, 남은 주자는 순서대로 높은 베이스부터 채우며 나머지(타자 포함)는 아웃.
+        """
+        if outs >= 3:
+            self.outs = 3
+            return
+        order = [self.runners[base] for base in (3, 2, 1) if self.runners[base] is not None] + [batter_name]
+        remaining = iter(order[runs:])
+        self.runners = {base: None for base in (1, 2, 3)}
+        for base in (3, 2, 1):
+            if bases & (1 << (base - 1)):
+                self.runners[base] = next(remaining)
+        self.outs = outs
+        if runs > 0:
+            self.add_score(runs)
+
+    def reset_count(self):
+        self.balls = 0
+        self.strikes = 0
+
     def record_out(self) -> bool:
         self.outs += 1
         return self.outs >= 3
 
     def end_half_inning(self):
+        if self.is_bottom and self.inning >= 9 and self.home_score != self.away_score:
+            self.final = True
         self.outs = 0
         self.clear_bases()
         if self.is_bottom:
@@ -83,17 +136,41 @@ class GameState:
             self.away_score += runs
 
     def is_game_over(self) -> bool:
+        """9회 이후 동점이 아닌 채로 이닝 종료, 또는 9회말 이후 홈팀 리드(끝내기) - 동점이면 연장"""
         if self.inning >= 9 and self.is_bottom and self.home_score > self.away_score:
             return True
-        if self.inning > 9 and self.home_score != self.away_score:
-            return True
-        return False
+        return self.final
+
+    def snapshot(self) -> GameSnapshot:
+        return GameSnapshot(
+            self.inning, self.is_bottom, self.outs, self.balls, self.strikes,
+            (self.runners[1], self.runners[2], self.runners[3]), self.home_score, self.away_score,
+            self.home_pitcher_pitches, self.away_pitcher_pitches, self.pitcher_hits_allowed, self.final,
+            len(self.play_log)
+        )
+
+    def restore(self, snapshot: GameSnapshot):
+        """같은 경기(또는 그 갈래)에서 찍은 스냅샷 시점으로 되돌림"""
+        (self.inning, self.is_bottom, self.outs, self.balls, self.strikes, runners, self.home_score,
+         self.away_score, self.home_pitcher_pitches, self.away_pitcher_pitches, self.pitcher_hits_allowed,
+         self.final, log_length) = snapshot
+        self.runners = {1: runners[0], 2: runners[1], 3: runners[2]}
+        self.play_log.truncate(log_length)
+
+    def branch(self) -> 'GameState':
+        """현재 상황에서 갈라진 경기 - 로그 배열은 공유하다가 쓸 때 복사"""
+        other = copy.copy(self)
+        other.runners = dict(self.runners)
+        other.play_log = self.play_log.fork()
+        return other
 
     def get_state_dict(self) -> Dict:
         return {
             'inning': self.inning,
             'is_bottom': self.is_bottom,
             'outs': self.outs,
+            'balls': self.balls,
+            'strikes': self.strikes,
             'home_score': self.home_score,
             'away_score': self.away_score,
             'runners': self.runners.copy(),
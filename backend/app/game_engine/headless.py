@@ -0,0 +1,224 @@
+"""
+UI 없이 빠르게 돌리는 경기 모델 (탐색/롤아웃용)
+
+경기 상황은 불변 SimState(NamedTuple)로 표현하고, 타석 결과는 AtBatSimulator 확률을
+(타자, 투수, 전략, 득점권, 피로 구간)별로 캐시해서 뽑는다. 진루는 baserunning 테이블이 있으면
+공격팀별 (스피드, 수비) 구간으로 한 번 조회하고, 없으면 run_expectancy.advance와 같은 고정 규칙.
+"""
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, Iterator, NamedTuple, Optional, Sequence, Tuple
+
+from .baserunning import Baserunning, sample_transition
+from .events import Event, InningEnd, PitcherChange, PlateAppearance
+from .markov import INNING_OVER, NEXT_STATE, RUNS
+from .run_expectancy import OUTCOMES, runners_to_mask
+
+LAST_INNING = 9
+PITCHES_PER_PA = (4, 6)
+
+# AtBatSimulator의 피로도 구간 경계 (70 초과, 85 초과)
+FATIGUE_THRESHOLDS = (70, 85)
+# 롤아웃 기본 정책: 이 피로도를 넘으면 불펜 최상위 투수로 교체 (HeadlessGame.auto_change 팀만)
+AUTO_CHANGE_FATIGUE = 85
+
+_NEXT_STATE = NEXT_STATE.tolist()
+_RUNS = RUNS.astype(int).tolist()
+
+
+class SimState(NamedTuple):
+    inning: int
+    is_bottom: bool
+    outs: int
+    bases: int
+    home_score: int
+    away_score: int
+    home_batter_idx: int
+    away_batter_idx: int
+    home_pitcher: int
+    away_pitcher: int
+    home_pitches: int
+    away_pitches: int
+    home_bullpen: Tuple[int, ...]
+    away_bullpen: Tuple[int, ...]
+    changed: bool = False  # 이번 타석 전에 이미 투수를 바꿨는지
+    final: bool = False  # 9회 이후 동점이 아닌 채로 이닝(초/말)이 끝남
+
+
+def fatigue(pitches: int) -> float:
+    """GameState.pitcher_fatigue와 같은 계산"""
+    return min(100, (pitches / 120) * 100)
+
+
+def fatigue_band(pitches: int) -> int:
+    value = fatigue(pitches)
+    return sum(value > threshold for threshold in FATIGUE_THRESHOLDS)
+
+
+def state_from_game(game, home_batter_idx: int, away_batter_idx: int, home_pitcher: int, away_pitcher: int,
+                    home_bullpen: Sequence[int], away_bullpen: Sequence[int]) -> SimState:
+    """GameState + 세션의 타순/투수 정보 → SimState"""
+    return SimState(
+        game.inning, game.is_bottom, game.outs, runners_to_mask(game.runners), game.home_score, game.away_score,
+        home_batter_idx, away_batter_idx, home_pitcher, away_pitcher,
+        game.home_pitcher_pitches, game.away_pitcher_pitches, tuple(home_bullpen), tuple(away_bullpen),
+        final=game.final
+    )
+
+
+class HeadlessGame:
+    """
+    양 팀 타순과 AtBatSimulator(ratings 테이블 포함)로 SimState를 진행
+
+    불펜 튜플은 overall 내림차순이라고 가정한다 (RosterStore.pitcher_ids 순서).
+    baserunning: {'home': (스피드, 수비), 'away': ...} - 공격팀 기준 진루 테이블 구간
+    auto_change: 기본 정책으로 지친 투수를 교체하는 팀 ('home'/'away') - 앱처럼 자동 교체가 없는 팀은 빼서
+        그 팀 투수가 끝까지 던지게 한다
+    """
+
+    def __init__(self, simulator, home_lineup: Sequence[int], away_lineup: Sequence[int],
+                 rng: Optional[random.Random] = None, baserunning: Optional[Dict[str, Baserunning]] = None,
+                 auto_change: Sequence[str] = ('home', 'away')):
+        self.simulator = simulator
+        self.home_lineup = tuple(home_lineup)
+        self.away_lineup = tuple(away_lineup)
+        self.rng = rng or random.Random()
+        self.baserunning = baserunning
+        self.auto_change = frozenset(auto_change)
+        self._cumulative: Dict[tuple, list] = {}
+
+    # ---- 상태 조회 ----
+
+    @staticmethod
+    def key(state: SimState) -> tuple:
+        """전치 테이블 키 - 투구수는 결과 확률이 같은 피로 구간으로 묶음"""
+        return state[:10] + (fatigue_band(state.home_pitches), fatigue_band(state.away_pitches)) + state[12:]
+
+    @staticmethod
+    def is_terminal(state: SimState) -> bool:
+        """GameState.is_game_over와 같은 규칙 - 9회 이후 동점이 아닌 채로 이닝 종료, 또는 끝내기 (동점이면 연장)"""
+        if state.final:
+            return True
+        return state.inning >= LAST_INNING and state.is_bottom and state.home_score > state.away_score
+
+    @staticmethod
+    def home_result(state: SimState) -> float:
+        """홈팀 기준 1(승) / 0.5(무) / 0(패)"""
+        if state.home_score == state.away_score:
+            return 0.5
+        return 1.0 if state.home_score > state.away_score else 0.0
+
+    @staticmethod
+    def fielding_is_home(state: SimState) -> bool:
+        return not state.is_bottom
+
+    # ---- 상태 전이 ----
+
+    def change_pitcher(self, state: SimState, pitcher_id: int) -> SimState:
+        """수비팀 투수 교체 (투구수 0, 불펜에서 제외)"""
+        if self.fielding_is_home(state):
+            bullpen = tuple(p for p in state.home_bullpen if p != pitcher_id)
+            return state._replace(home_pitcher=pitcher_id, home_pitches=0, home_bullpen=bullpen, changed=True)
+        bullpen = tuple(p for p in state.away_bullpen if p != pitcher_id)
+        return state._replace(away_pitcher=pitcher_id, away_pitches=0, away_bullpen=bullpen, changed=True)
+
+    def default_change(self, state: SimState) -> SimState:
+        """기본 정책 - 수비팀이 auto_change에 있고 투수가 지치면 불펜 최상위 투수로 교체"""
+        home = self.fielding_is_home(state)
+        if state.changed or ('home' if home else 'away') not in self.auto_change:
+            return state
+        pitches = state.home_pitches if home else state.away_pitches
+        bullpen = state.home_bullpen if home else state.away_bullpen
+        if bullpen and fatigue(pitches) > AUTO_CHANGE_FATIGUE:
+            return self.change_pitcher(state, bullpen[0])
+        return state
+
+    def _cumulative_probs(self, batter: int, pitcher: int, strategy: Optional[str], risp: bool, pitches: int) -> list:
+        key = (batter, pitcher, strategy, risp, fatigue_band(pitches))
+        cumulative = self._cumulative.get(key)
+        if cumulative is None:
+            state = {'runners_in_scoring_position': risp, 'pitcher_fatigue': fatigue(pitches)}
+            probs = self.simulator.outcome_probabilities(batter, pitcher, state, strategy)
+            cumulative = list(accumulate(float(probs[o]) for o in OUTCOMES))
+            self._cumulative[key] = cumulative
+        return cumulative
+
+    def play(self, state: SimState, strategy: Optional[str] = None) -> SimState:
+        """타석 하나 진행 (strategy는 공격/수비 어느 쪽 전략이든 하나)"""
+        return self._advance(state, strategy)[0]
+
+    def _advance(self, state: SimState, strategy: Optional[str]) -> tuple:
+        """(다음 SimState, 결과 인덱스, 득점, 다음 베이스-아웃 상태, 투구수)"""
+        if state.is_bottom:
+            batter, pitcher, pitches = self.home_lineup[state.home_batter_idx], state.away_pitcher, state.away_pitches
+        else:
+            batter, pitcher, pitches = self.away_lineup[state.away_batter_idx], state.home_pitcher, state.home_pitches
+
+        cumulative = self._cumulative_probs(batter, pitcher, strategy, bool(state.bases & 0b110), pitches)
+        outcome = min(bisect_right(cumulative, self.rng.random() * cumulative[-1]), len(OUTCOMES) - 1)
+
+        base_out = state.outs * 8 + state.bases
+        if self.baserunning:
+            next_state, runs = sample_transition(
+                outcome, base_out, self.baserunning['home' if state.is_bottom else 'away'], self.rng
+            )
+        else:
+            next_state, runs = _NEXT_STATE[base_out][outcome], _RUNS[base_out][outcome]
+        low, high = PITCHES_PER_PA
+        thrown = low + int(self.rng.random() * (high - low + 1))
+        pitches += thrown
+
+        (inning, is_bottom, _, _, home_score, away_score, home_idx, away_idx,
+         home_pitcher, away_pitcher, home_pitches, away_pitches, home_bullpen, away_bullpen, _, _) = state
+        if is_bottom:
+            home_score += runs
+            away_pitches = pitches
+            home_idx = (home_idx + 1) % len(self.home_lineup)
+        else:
+            away_score += runs
+            home_pitches = pitches
+            away_idx = (away_idx + 1) % len(self.away_lineup)
+
+        final = False
+        if next_state == INNING_OVER:
+            outs = bases = 0
+            # 9회말 이후 점수가 갈렸으면 종료 (9회초 이후 홈 리드는 is_terminal이 바로 잡음)
+            final = is_bottom and inning >= LAST_INNING and home_score != away_score
+            if is_bottom:
+                inning += 1
+            is_bottom = not is_bottom
+        else:
+            outs, bases = divmod(next_state, 8)
+        new_state = SimState(inning, is_bottom, outs, bases, home_score, away_score, home_idx, away_idx,
+                             home_pitcher, away_pitcher, home_pitches, away_pitches, home_bullpen, away_bullpen,
+                             final=final)
+        return new_state, outcome, runs, next_state, thrown
+
+    def rollout(self, state: SimState) -> SimState:
+        """기본 정책(전략 없음, 지치면 교체)으로 경기 끝까지 진행"""
+        while not self.is_terminal(state):
+            state = self.play(self.default_change(state))
+        return state
+
+    def events(self, state: SimState) -> Iterator[Event]:
+        """rollout과 같은 진행을 이벤트로 하나씩 yield (끝난 SimState는 제너레이터 반환값)"""
+        while not self.is_terminal(state):
+            changed = self.default_change(state)
+            if changed is not state:
+                home = self.fielding_is_home(state)
+                yield PitcherChange(state.inning, state.is_bottom, 'home' if home else 'away',
+                                    changed.home_pitcher if home else changed.away_pitcher)
+            state = changed
+
+            new_state, outcome, runs, next_state, thrown = self._advance(state, None)
+            if state.is_bottom:
+                batter, pitcher = self.home_lineup[state.home_batter_idx], state.away_pitcher
+            else:
+                batter, pitcher = self.away_lineup[state.away_batter_idx], state.home_pitcher
+            yield PlateAppearance(state.inning, state.is_bottom, batter, pitcher, OUTCOMES[outcome], runs,
+                                  state.outs * 8 + state.bases, next_state, thrown)
+            if next_state == INNING_OVER:
+                yield InningEnd(state.inning, state.is_bottom, new_state.home_score, new_state.away_score)
+            state = new_state
+        return state
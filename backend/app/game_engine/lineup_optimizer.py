@@ -0,0 +1,113 @@
+"""
+타순 최적화 - 마르코프 기대 득점으로 상대 투수에 대한 최적 타순 탐색
+
+9! = 362,880가지를 모두 평가하지 않고, 앞 타순(prefix)부터 빔 서치로 채운 뒤
+두 타자 자리 바꾸기로 다듬는다. 평가한 타순/부분 타순은 캐시한다.
+"""
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .baserunning import Baserunning
+from .markov import expected_runs
+
+LINEUP_SIZE = 9
+
+
+def lineup_probabilities(simulator, batter_ids: Sequence[int], pitcher_id: int) -> np.ndarray:
+    """타자별 [일반, 득점권] 결과 확률 (n, 2, 8) - 상대 투수 기준"""
+    probs = [
+        simulator.outcome_matrix(batter_ids, [pitcher_id], {'runners_in_scoring_position': risp})[0]
+        for risp in (False, True)
+    ]
+    return np.stack(probs, axis=1)
+
+
+class LineupOptimizer:
+    """
+    타자 9명의 결과 확률로 타순을 탐색
+
+    부분 타순은 빈 자리를 남은 타자들의 평균 확률로 채워 점수를 매기고,
+    점수 상위 beam_width개만 다음 타순으로 확장한다. baserunning은 markov.expected_runs와 같음.
+    """
+
+    def __init__(self, batter_probs: np.ndarray, innings: int = 9, beam_width: int = 64,
+                 baserunning: Optional[Baserunning] = None):
+        self.probs = np.asarray(batter_probs, dtype=float)
+        if len(self.probs) != LINEUP_SIZE:
+            raise ValueError(f"타자는 {LINEUP_SIZE}명이어야 함: {len(self.probs)}")
+        self.innings = innings
+        self.beam_width = beam_width
+        self.baserunning = baserunning
+        self._cache: Dict[Tuple[int, ...], float] = {}
+        self.evaluations = 0
+
+    def _lineup_array(self, prefix: Tuple[int, ...]) -> np.ndarray:
+        remaining = [b for b in range(LINEUP_SIZE) if b not in prefix]
+        lineup = np.empty((LINEUP_SIZE,) + self.probs.shape[1:])
+        lineup[:len(prefix)] = self.probs[list(prefix)]
+        if remaining:
+            lineup[len(prefix):] = self.probs[remaining].mean(axis=0)
+        return lineup
+
+    def score(self, prefixes: Sequence[Tuple[int, ...]]) -> np.ndarray:
+        """타순(또는 부분 타순) 목록의 기대 득점 - 캐시에 없는 것만 한 번에 계산"""
+        missing = list(dict.fromkeys(p for p in prefixes if p not in self._cache))
+        if missing:
+            values = expected_runs(np.stack([self._lineup_array(p) for p in missing]), self.innings, self.baserunning)
+            self._cache.update(zip(missing, values.tolist()))
+            self.evaluations += len(missing)
+        return np.array([self._cache[p] for p in prefixes])
+
+    def _beam_search(self) -> Tuple[int, ...]:
+        beam = [()]
+        for _ in range(LINEUP_SIZE):
+            candidates = [prefix + (b,) for prefix in beam for b in range(LINEUP_SIZE) if b not in prefix]
+            scores = self.score(candidates)
+            keep = np.argsort(-scores, kind='stable')[:self.beam_width]
+            beam = [candidates[i] for i in keep]
+        return beam[0]
+
+    def _improve(self, order: Tuple[int, ...], deadline: float) -> Tuple[int, ...]:
+        """두 자리 바꾸기 중 가장 좋은 것을 개선이 없을 때까지 반복"""
+        best = self.score([order])[0]
+        while time.perf_counter() < deadline:
+            swaps = []
+            for i in range(LINEUP_SIZE):
+                for j in range(i + 1, LINEUP_SIZE):
+                    swapped = list(order)
+                    swapped[i], swapped[j] = swapped[j], swapped[i]
+                    swaps.append(tuple(swapped))
+            scores = self.score(swaps)
+            top = int(np.argmax(scores))
+            if scores[top] <= best + 1e-12:
+                break
+            order, best = swaps[top], scores[top]
+        return order
+
+    def optimize(self, time_budget: float = 5.0) -> Tuple[Tuple[int, ...], float]:
+        """(타순 인덱스, 경기당 기대 득점)"""
+        deadline = time.perf_counter() + time_budget
+        order = self._improve(self._beam_search(), deadline)
+        return order, float(self.score([order])[0])
+
+
+def optimize_lineup(simulator, batter_ids: Sequence[int], pitcher_id: int, innings: int = 9,
+                    beam_width: int = 64, time_budget: float = 5.0,
+                    baserunning: Optional[Baserunning] = None) -> Tuple[List[int], float]:
+    """
+    타자 9명(ID)의 최적 타순과 경기당 기대 득점
+
+    simulator는 ratings 테이블에 타자와 상대 투수가 들어 있는 AtBatSimulator
+    """
+    batter_ids = list(batter_ids)
+    optimizer = LineupOptimizer(lineup_probabilities(simulator, batter_ids, pitcher_id), innings, beam_width, baserunning)
+    order, runs = optimizer.optimize(time_budget)
+    return [batter_ids[i] for i in order], runs
+
+
+def lineup_expected_runs(simulator, batter_ids: Sequence[int], pitcher_id: int, innings: int = 9,
+                         baserunning: Optional[Baserunning] = None) -> float:
+    """주어진 타순 그대로의 경기당 기대 득점"""
+    return expected_runs(lineup_probabilities(simulator, batter_ids, pitcher_id), innings, baserunning)
@@ -0,0 +1,153 @@
+"""
+타순별 기대 득점 마르코프 모델
+
+24개 베이스-아웃 상태(outs * 8 + 주자 마스크)와 이닝 종료(24)로 구성.
+진루 규칙은 baserunning=(스피드 구간, 수비 구간)을 주면 baserunning.TRANSITIONS,
+아니면 run_expectancy.advance의 고정 규칙. 타석 결과 확률은 AtBatSimulator에서 받는다.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .baserunning import TRANSITIONS
+from .run_expectancy import OUTCOMES, advance
+
+N_STATES = 24
+INNING_OVER = 24
+
+# 이닝 득점 분포의 마지막 칸은 MAX_RUNS점 이상
+MAX_RUNS = 15
+
+# 득점권 주자(2루 또는 3루)가 있는 상태 - 볼넷 확률이 달라짐
+RISP_STATES = np.array([(state % 8) & 0b110 != 0 for state in range(N_STATES)])
+
+
+def _build_tables():
+    next_state = np.zeros((N_STATES, len(OUTCOMES)), dtype=np.int64)
+    runs = np.zeros((N_STATES, len(OUTCOMES)))
+    for state in range(N_STATES):
+        for o, outcome in enumerate(OUTCOMES):
+            bases, outs, scored = advance(state % 8, state // 8, outcome)
+            next_state[state, o] = outs * 8 + bases if outs < 3 else INNING_OVER
+            runs[state, o] = scored
+    # (상태, 결과) 쌍을 다음 상태로 모으는 원-핫 행렬
+    scatter = np.zeros((N_STATES * len(OUTCOMES), N_STATES + 1))
+    scatter[np.arange(N_STATES * len(OUTCOMES)), next_state.ravel()] = 1.0
+    return next_state, runs, scatter
+
+
+NEXT_STATE, RUNS, _SCATTER = _build_tables()
+_RUNS_FLAT = RUNS.ravel()
+# [득점 수(0~4), 상태, 결과, 다음 상태] 원-핫
+_RUN_SCATTER = np.stack([
+    (_SCATTER * (_RUNS_FLAT == runs)[:, None]).reshape(N_STATES, len(OUTCOMES), N_STATES + 1)
+    for runs in range(5)
+])
+
+
+@lru_cache(maxsize=None)
+def _transition_tables(baserunning=None):
+    """(득점별 전이 [득점, 상태, 결과, 다음 상태], (상태*결과, 다음 상태) 전이, (상태*결과) 기대 득점)"""
+    run_scatter = _RUN_SCATTER if baserunning is None else TRANSITIONS[baserunning]
+    scatter = run_scatter.sum(axis=0).reshape(N_STATES * len(OUTCOMES), N_STATES + 1)
+    runs_flat = np.tensordot(np.arange(len(run_scatter)), run_scatter, axes=1).sum(axis=-1).ravel()
+    return run_scatter, scatter, runs_flat
+
+
+def inning_tables(lineup_probs, baserunning=None, tol=1e-9, max_batters=40):
+    """
+    타순별로 각 타자가 선두타자인 이닝의 기대 득점과 다음 이닝 선두타자 분포
+
+    lineup_probs: (B, 9, 2, 8) - [타순, 득점권 여부, 결과] 확률 (OUTCOMES 순서)
+    반환: expected (B, 9), next_leadoff (B, 9, 9)
+    """
+    _, scatter, runs_flat = _transition_tables(baserunning)
+    batch, slots = lineup_probs.shape[:2]
+    leadoff = np.arange(slots)
+    alive = np.zeros((batch, slots, N_STATES))
+    alive[:, :, 0] = 1.0
+    expected = np.zeros((batch, slots))
+    next_leadoff = np.zeros((batch, slots, slots))
+
+    # 상태별로 득점권 확률 세트를 고른 인덱스 (0: 일반, 1: 득점권)
+    risp = RISP_STATES.astype(np.int64)
+    batch_idx = np.arange(batch)[:, None]
+
+    for step in range(max_batters):
+        slot = (leadoff + step) % slots
+        probs = lineup_probs[batch_idx, slot][:, :, risp, :]          # (B, 9, 24, 8)
+        flow = (probs * alive[..., None]).reshape(batch * slots, -1)  # (B*9, 24*8)
+        expected += (flow @ runs_flat).reshape(batch, slots)
+
+        moved = (flow @ scatter).reshape(batch, slots, N_STATES + 1)
+        alive = moved[..., :N_STATES]
+        next_leadoff[:, leadoff, (slot + 1) % slots] += moved[..., INNING_OVER]
+
+        if alive.sum(axis=-1).max() < tol:
+            break
+    return expected, next_leadoff
+
+
+def expected_runs(lineup_probs, innings=9, baserunning=None):
+    """
+    타순의 경기당 기대 득점 (1번 타자부터 시작해 innings 이닝)
+
+    lineup_probs: (9, 2, 8) 또는 여러 타순을 묶은 (B, 9, 2, 8). 반환은 스칼라 또는 (B,)
+    """
+    lineup_probs = np.asarray(lineup_probs, dtype=float)
+    single = lineup_probs.ndim == 3
+    if single:
+        lineup_probs = lineup_probs[np.newaxis]
+
+    expected, next_leadoff = inning_tables(lineup_probs, baserunning)
+    leadoff_dist = np.zeros(expected.shape)
+    leadoff_dist[:, 0] = 1.0
+    total = np.zeros(len(expected))
+    for _ in range(innings):
+        total += (leadoff_dist * expected).sum(axis=1)
+        leadoff_dist = np.einsum('bi,bij->bj', leadoff_dist, next_leadoff)
+
+    return float(total[0]) if single else total
+
+
+def batter_transitions(probs, baserunning=None) -> np.ndarray:
+    """
+    결과 확률 (..., 2, 8) → 득점 수별 상태 전이 행렬 (..., 5, 24, 25)
+
+    [r, s, t] = 상태 s에서 r점을 내고 상태 t(24는 이닝 종료)로 갈 확률
+    """
+    probs = np.asarray(probs, dtype=float)[..., RISP_STATES.astype(np.int64), :]  # (..., 24, 8)
+    return np.einsum('...so,rsot->...rst', probs, _transition_tables(baserunning)[0])
+
+
+def runs_distribution(transitions, state=0, leadoff=0, max_runs=MAX_RUNS, tol=1e-10, max_batters=40):
+    """
+    주어진 베이스-아웃 상태부터 이닝이 끝날 때까지의 득점 분포
+
+    transitions: (B, n, 5, 24, 25) - B개 시나리오(예: 투수별)의 타순 n명 전이 행렬, leadoff번째 타자부터 순환
+    state: 시작 상태 (스칼라 또는 (B,))
+    반환: (B, max_runs + 1) - 마지막 칸은 max_runs점 이상
+    """
+    batch, slots = transitions.shape[:2]
+    dist = np.zeros((batch, max_runs + 1, N_STATES))
+    dist[np.arange(batch), 0, state] = 1.0
+    finished = np.zeros((batch, max_runs + 1))
+
+    for step in range(max_batters):
+        # (B, 1, R, 24) @ (B, 5, 24, 25) → (B, 5, R, 25)
+        moved_by_runs = dist[:, None] @ transitions[:, (leadoff + step) % slots]
+        moved = moved_by_runs[:, 0].copy()
+        for runs in range(1, moved_by_runs.shape[1]):
+            # 상한을 넘는 득점은 마지막 칸에 모음
+            moved[:, runs:-1] += moved_by_runs[:, runs, :-runs - 1]
+            moved[:, -1] += moved_by_runs[:, runs, -runs - 1:].sum(axis=1)
+        finished += moved[..., INNING_OVER]
+        dist = moved[..., :N_STATES]
+        if dist.sum(axis=(1, 2)).max() < tol:
+            break
+    return finished
+
+
+def inning_runs_distribution(lineup_probs, state=0, leadoff=0, max_runs=MAX_RUNS, baserunning=None):
+    """결과 확률 (B, n, 2, 8)로 바로 계산하는 runs_distribution"""
+    return runs_distribution(batter_transitions(lineup_probs, baserunning), state, leadoff, max_runs)
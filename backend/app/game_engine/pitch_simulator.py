@@ -0,0 +1,229 @@
+"""
+투구 단위 시뮬레이터 - 볼카운트(12개 상태) 진행으로 실제 투구수 생성
+
+카운트별 볼/스트라이크/인플레이 확률은 카운트 보정 테이블 x 두 배율(볼, 스트라이크)로 정하고,
+두 배율은 0-0에서 출발한 볼넷/삼진 흡수 확률이 AtBatSimulator 타석 확률과 같아지도록 맞춘다.
+인플레이 결과는 타석 확률의 안타/아웃 비율을 그대로 써서 타석 결과 분포가 PA 엔진과 동일하다.
+"""
+import random
+from bisect import bisect_right
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+BALLS = 4
+STRIKES = 3
+N_COUNTS = BALLS * STRIKES  # (볼 0~3, 스트라이크 0~2)
+
+# 카운트별 보정 [볼][스트라이크] - 불리한 카운트에서 투수는 존에 넣고, 유리하면 유인구
+BALL_ADJUST = np.array([
+    [1.00, 1.10, 1.35],
+    [0.95, 1.05, 1.20],
+    [0.85, 0.95, 1.05],
+    [0.70, 0.85, 0.95],
+])
+STRIKE_ADJUST = np.array([
+    [1.10, 1.00, 0.90],
+    [1.05, 1.00, 0.95],
+    [1.10, 1.00, 0.95],
+    [1.30, 1.05, 1.00],
+])
+# 초구/3-0에서는 잘 치지 않고, 2스트라이크에서는 커트하며 인플레이가 늘어남
+IN_PLAY_ADJUST = np.array([
+    [0.45, 0.75, 1.00],
+    [0.70, 0.90, 1.05],
+    [0.80, 0.95, 1.10],
+    [0.35, 0.85, 1.10],
+])
+
+# 투구 결과 (카운트 전이 테이블의 열 순서)
+PITCH_EVENTS = ('B', 'S', 'F', 'X')  # 볼, 스트라이크(헛스윙/루킹), 2스트라이크 파울, 인플레이
+IN_PLAY = ('single', 'double', 'triple', 'homerun', 'groundout', 'flyout')
+
+OUTCOME_INDEX = {name: i for i, name in enumerate(
+    ('single', 'double', 'triple', 'homerun', 'strikeout', 'walk', 'groundout', 'flyout')
+)}
+_IN_PLAY_INDEX = [OUTCOME_INDEX[name] for name in IN_PLAY]
+
+
+def count_index(balls: int, strikes: int) -> int:
+    return balls * STRIKES + strikes
+
+
+def foul_rate(batter, pitcher):
+    """2스트라이크 이후 스트라이크 중 파울 비율 - 컨택이 좋을수록, 구위가 좋을수록 반대"""
+    contact_factor = (batter['contact'] - 50) / 50
+    stuff_factor = (pitcher['stuff'] - 50) / 50
+    return np.clip(0.45 + contact_factor * 0.12 - stuff_factor * 0.08, 0.25, 0.65)
+
+
+def pitch_probabilities(ball_scale, strike_scale, foul) -> np.ndarray:
+    """카운트별 투구 결과 확률 (..., 12, 4) - PITCH_EVENTS 순서"""
+    ball_scale, strike_scale, foul = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (ball_scale, strike_scale, foul)))
+    ball = ball_scale[..., None, None] * BALL_ADJUST
+    strike = strike_scale[..., None, None] * STRIKE_ADJUST
+    total = ball + strike + IN_PLAY_ADJUST
+
+    probs = np.zeros(ball_scale.shape + (BALLS, STRIKES, len(PITCH_EVENTS)))
+    probs[..., 0] = ball / total
+    probs[..., 1] = strike / total
+    probs[..., 3] = IN_PLAY_ADJUST / total
+    # 2스트라이크에서는 스트라이크 중 foul 비율만큼 카운트 유지
+    probs[..., 2, 2] = probs[..., 2, 1] * foul[..., None]
+    probs[..., 2, 1] *= 1.0 - foul[..., None]
+    return probs.reshape(ball_scale.shape + (N_COUNTS, len(PITCH_EVENTS)))
+
+
+def absorption(probs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """0-0에서 출발한 (볼넷 확률, 삼진 확률) - probs는 pitch_probabilities 결과"""
+    walk = np.zeros(probs.shape[:-2] + (BALLS + 1, STRIKES + 1))
+    strikeout = np.zeros_like(walk)
+    walk[..., BALLS, :] = 1.0
+    strikeout[..., :, STRIKES] = 1.0
+
+    for balls in range(BALLS - 1, -1, -1):
+        for strikes in range(STRIKES - 1, -1, -1):
+            p = probs[..., count_index(balls, strikes), :]
+            stay = 1.0 - p[..., 2]
+            for value in (walk, strikeout):
+                value[..., balls, strikes] = (
+                    p[..., 0] * value[..., balls + 1, strikes] + p[..., 1] * value[..., balls, strikes + 1]
+                ) / stay
+    return walk[..., 0, 0], strikeout[..., 0, 0]
+
+
+def calibrate(p_walk, p_strikeout, foul, iterations: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    0-0 흡수 확률이 (p_walk, p_strikeout)이 되는 (볼 배율, 스트라이크 배율) - 로그 공간 뉴턴법, 벡터화
+    """
+    target = np.stack(np.broadcast_arrays(np.asarray(p_walk, dtype=float), np.asarray(p_strikeout, dtype=float)), axis=-1)
+    foul = np.broadcast_to(np.asarray(foul, dtype=float), target.shape[:-1])
+    log_scale = np.zeros(target.shape)
+    step = 1e-6
+
+    def residual(log_scale):
+        walk, strikeout = absorption(pitch_probabilities(np.exp(log_scale[..., 0]), np.exp(log_scale[..., 1]), foul))
+        return np.stack([walk, strikeout], axis=-1) - target
+
+    for _ in range(iterations):
+        f = residual(log_scale)
+        if np.abs(f).max() < 1e-12:
+            break
+        jacobian = np.stack([
+            (residual(log_scale + step * np.eye(2)[k]) - f) / step for k in range(2)
+        ], axis=-1)
+        delta = np.linalg.solve(jacobian, -f[..., None])[..., 0]
+        log_scale += np.clip(delta, -2.0, 2.0)
+    return np.exp(log_scale[..., 0]), np.exp(log_scale[..., 1])
+
+
+class PitchSimulator:
+    """
+    AtBatSimulator를 감싸 투구 단위로 타석을 진행
+
+    simulate는 AtBatSimulator.simulate와 같은 형태로 (결과, 상세)를 반환하고,
+    상세에 투구수/투구 기록/마지막 카운트가 추가된다. 카운트 전이 테이블은 타석 확률별로 캐시.
+    0-0에서 시작하면 결과 분포가 타석 확률과 같다.
+    """
+
+    def __init__(self, at_bat_sim, rng: Optional[random.Random] = None):
+        self.at_bat_sim = at_bat_sim
+        self.rng = rng or random.Random()
+        self._tables: Dict[tuple, tuple] = {}
+
+    def _table(self, probs: Dict[str, float], foul: float) -> tuple:
+        """(카운트별 누적 투구 확률, 인플레이 결과 누적 확률)"""
+        key = tuple(round(float(probs[o]), 12) for o in OUTCOME_INDEX) + (round(float(foul), 12),)
+        table = self._tables.get(key)
+        if table is None:
+            pitch = pitch_probabilities(*calibrate(probs['walk'], probs['strikeout'], foul), foul)
+            in_play = np.array([probs[o] for o in IN_PLAY], dtype=float)
+            table = (np.cumsum(pitch, axis=-1).tolist(), np.cumsum(in_play).tolist())
+            self._tables[key] = table
+        return table
+
+    def simulate(self, batter, pitcher, game_state: Dict, strategy: str = None) -> Tuple[str, Dict]:
+        batter_ratings = self.at_bat_sim._ratings_of(batter)
+        pitcher_ratings = self.at_bat_sim._ratings_of(pitcher)
+        probs = self.at_bat_sim.outcome_probabilities(batter_ratings, pitcher_ratings, game_state, strategy)
+        details = {**self.at_bat_sim._describe(batter, 'batter'), **self.at_bat_sim._describe(pitcher, 'pitcher')}
+
+        if probs['walk'] >= 1.0 - 1e-9:
+            # 고의4구
+            details.update({'pitches': 4, 'sequence': 'BBBB', 'count': (BALLS, 0)})
+            return 'walk', details
+
+        pitch_cum, in_play_cum = self._table(probs, foul_rate(batter_ratings, pitcher_ratings))
+        # 진행 중인 카운트에서 이어서 시작 (GameState.balls/strikes)
+        balls = game_state.get('balls', 0)
+        strikes = game_state.get('strikes', 0)
+        sequence = []
+        while True:
+            row = pitch_cum[count_index(balls, strikes)]
+            event = PITCH_EVENTS[min(bisect_right(row, self.rng.random() * row[-1]), 3)]
+            sequence.append(event)
+            if event == 'B':
+                balls += 1
+                if balls == BALLS:
+                    outcome = 'walk'
+                    break
+            elif event == 'S':
+                strikes += 1
+                if strikes == STRIKES:
+                    outcome = 'strikeout'
+                    break
+            elif event == 'X':
+                outcome = IN_PLAY[min(bisect_right(in_play_cum, self.rng.random() * in_play_cum[-1]), len(IN_PLAY) - 1)]
+                break
+
+        details.update({'pitches': len(sequence), 'sequence': ''.join(sequence), 'count': (balls, strikes)})
+        return outcome, details
+
+    @staticmethod
+    def simulate_many(outcome_probs: np.ndarray, foul, rng: Optional[np.random.Generator] = None,
+                      max_pitches: int = 60) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 타석을 한 번에 투구 단위로 진행 (벡터화)
+
+        outcome_probs: (N, 8) 타석 결과 확률 (AtBatSimulator.outcomes 순서), foul: 스칼라 또는 (N,)
+        반환: (결과 인덱스 (N,), 투구수 (N,))
+        """
+        rng = rng or np.random.default_rng()
+        outcome_probs = np.asarray(outcome_probs, dtype=float)
+        n = len(outcome_probs)
+        foul = np.broadcast_to(np.asarray(foul, dtype=float), (n,))
+        p_walk = outcome_probs[:, OUTCOME_INDEX['walk']]
+        intentional = p_walk >= 1.0 - 1e-9
+
+        # 같은 (볼넷, 삼진, 파울) 조합은 한 번만 맞춤
+        keys = np.stack([np.where(intentional, 0.5, p_walk), outcome_probs[:, OUTCOME_INDEX['strikeout']], foul], axis=1)
+        unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+        ball_scale, strike_scale = calibrate(unique[:, 0], unique[:, 1], unique[:, 2])
+        pitch_cum = np.cumsum(pitch_probabilities(ball_scale, strike_scale, unique[:, 2]), axis=-1)[inverse.ravel()]
+
+        balls = np.zeros(n, dtype=np.int64)
+        strikes = np.zeros(n, dtype=np.int64)
+        pitches = np.zeros(n, dtype=np.int64)
+        outcome = np.full(n, -1, dtype=np.int64)
+        # 고의4구는 볼 4개로 바로 처리
+        outcome[intentional] = OUTCOME_INDEX['walk']
+        pitches[intentional] = BALLS
+        active = np.flatnonzero(~intentional)
+        for _ in range(max_pitches):
+            if not len(active):
+                break
+            row = pitch_cum[active, balls[active] * STRIKES + strikes[active]]
+            event = (rng.random(len(active))[:, None] * row[:, -1:] >= row).sum(axis=1)
+            pitches[active] += 1
+            balls[active] += event == 0
+            strikes[active] += event == 1
+            outcome[active[balls[active] == BALLS]] = OUTCOME_INDEX['walk']
+            outcome[active[strikes[active] == STRIKES]] = OUTCOME_INDEX['strikeout']
+            in_play = active[event == 3]
+            if len(in_play):
+                weights = outcome_probs[in_play][:, _IN_PLAY_INDEX]
+                cum = np.cumsum(weights, axis=1)
+                pick = (rng.random(len(in_play))[:, None] * cum[:, -1:] >= cum).sum(axis=1)
+                outcome[in_play] = np.array(_IN_PLAY_INDEX)[np.minimum(pick, len(IN_PLAY) - 1)]
+            active = active[outcome[active] < 0]
+        return outcome, pitches
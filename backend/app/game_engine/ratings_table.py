@@ -0,0 +1,80 @@
+"""
+선수 능력치 컬럼형 테이블 (NumPy 구조화 배열, 선수 ID로 조회)
+"""
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
+
+BATTER_RATINGS = ('contact', 'power', 'eye', 'speed', 'defense')
+PITCHER_RATINGS = ('stuff', 'control', 'movement', 'stamina', 'pitchability')
+RATING_COLUMNS = ('overall',) + BATTER_RATINGS + PITCHER_RATINGS
+
+# 해당 포지션에 없는 능력치는 리그 평균(50)으로 채움
+DEFAULT_RATING = 50
+
+RATINGS_DTYPE = np.dtype(
+    [('id', np.int64), ('is_pitcher', np.bool_)]
+    + [(column, np.int16) for column in RATING_COLUMNS]
+    + [('bat_side', 'U1'), ('pitch_hand', 'U1')]
+)
+
+
+class RatingsTable:
+    """
+    선수 ID 정렬된 구조화 배열 - rows(ids)로 라인업 전체를 한 번에 조회
+
+    row(id)가 돌려주는 레코드는 record['contact']처럼 dict와 같은 방식으로 읽을 수 있다.
+    """
+
+    def __init__(self, players: Iterable[Mapping]):
+        records = []
+        for player in players:
+            ratings = player.get('ratings_20_80') or {}
+            records.append(
+                (int(player['id']), bool(player.get('is_pitcher')))
+                + tuple(int(ratings.get(column, DEFAULT_RATING)) for column in RATING_COLUMNS)
+                + (player.get('bat_side') or '', player.get('pitch_hand') or '')
+            )
+
+        table = np.array(records, dtype=RATINGS_DTYPE)
+        table.sort(order='id')
+        if len(table) > 1 and (np.diff(table['id']) == 0).any():
+            raise ValueError("중복된 선수 ID")
+        self.table = table
+        self.ids = table['id']
+        # 단일 조회용 ID -> 행 번호 (배열 조회는 searchsorted)
+        self._positions = {int(player_id): pos for pos, player_id in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, player_id: int) -> bool:
+        return int(player_id) in self._positions
+
+    def index(self, player_ids) -> np.ndarray:
+        """선수 ID(스칼라 또는 배열) → 행 번호, 없는 ID는 KeyError"""
+        ids = np.asarray(player_ids, dtype=np.int64)
+        pos = np.searchsorted(self.ids, ids)
+        pos = np.minimum(pos, len(self.ids) - 1)
+        if not np.all(self.ids[pos] == ids):
+            missing = np.atleast_1d(ids)[np.atleast_1d(self.ids[pos] != ids)]
+            raise KeyError(f"능력치 없는 선수 ID: {missing.tolist()}")
+        return pos
+
+    def row(self, player_id: int) -> np.void:
+        try:
+            return self.table[self._positions[int(player_id)]]
+        except KeyError:
+            raise KeyError(f"능력치 없는 선수 ID: {player_id}") from None
+
+    def rows(self, player_ids: Sequence[int]) -> np.ndarray:
+        """여러 선수를 한 번의 팬시 인덱싱으로 조회 (입력 순서 유지)"""
+        return self.table[self.index(player_ids)]
+
+    def column(self, name: str, player_ids: Sequence[int]) -> np.ndarray:
+        return self.table[name][self.index(player_ids)]
+
+    def same_handedness(self, batter_id: int, pitcher_id: int) -> bool:
+        """스위치 타자(S)는 항상 False"""
+        bat_side = self.row(batter_id)['bat_side']
+        return bat_side != 'S' and bat_side == self.row(pitcher_id)['pitch_hand']
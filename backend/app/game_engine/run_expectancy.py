@@ -0,0 +1,57 @@
+"""
+베이스-아웃 상태와 기대 득점(RE24)
+"""
+from typing import Dict, Tuple
+
+# 주자 상태는 비트마스크 (1루=1, 2루=2, 3루=4)
+# MLB 2010-2015 평균 기대 득점 [아웃][주자 마스크]
+RUN_EXPECTANCY = (
+    (0.481, 0.859, 1.100, 1.437, 1.357, 1.798, 1.920, 2.282),
+    (0.254, 0.509, 0.664, 0.884, 0.950, 1.130, 1.352, 1.520),
+    (0.098, 0.224, 0.319, 0.429, 0.353, 0.478, 0.580, 0.736),
+)
+
+# 타석 결과별 득점 가치 계산에 쓰는 결과 목록 (AtBatSimulator.outcomes와 동일 순서)
+OUTCOMES = ('single', 'double', 'triple', 'homerun', 'strikeout', 'walk', 'groundout', 'flyout')
+
+
+def runners_to_mask(runners: Dict) -> int:
+    return sum(1 << (base - 1) for base in (1, 2, 3) if runners[base] is not None)
+
+
+def advance(bases: int, outs: int, outcome: str) -> Tuple[int, int, int]:
+    """고정 진루 규칙으로 (다음 주자 마스크, 다음 아웃, 득점) 계산 - app.process_outcome과 동일"""
+    if outcome in ('single', 'double', 'triple', 'homerun'):
+        hit_bases = OUTCOMES.index(outcome) + 1
+        runs = 0
+        new_bases = 0
+        for base in (1, 2, 3):
+            if bases & (1 << (base - 1)):
+                if base + hit_bases >= 4:
+                    runs += 1
+                else:
+                    new_bases |= 1 << (base + hit_bases - 1)
+        if hit_bases == 4:
+            return 0, outs, runs + 1
+        return new_bases | (1 << (hit_bases - 1)), outs, runs
+
+    if outcome == 'walk':
+        if bases == 0b111:
+            return 0b111, outs, 1
+        if bases & 1:
+            if bases & 2:
+                return 0b111, outs, 0
+            return bases | 0b011, outs, 0
+        return bases | 1, outs, 0
+
+    outs += 1
+    if outcome == 'flyout' and outs < 3 and bases & 4:
+        return bases & 0b011, outs, 1
+    return bases, outs, 0
+
+
+def run_value(bases: int, outs: int, outcome: str) -> float:
+    """결과 하나의 득점 가치 (RE24 변화량 + 득점)"""
+    new_bases, new_outs, runs = advance(bases, outs, outcome)
+    after = RUN_EXPECTANCY[new_outs][new_bases] if new_outs < 3 else 0.0
+    return after - RUN_EXPECTANCY[outs][bases] + runs
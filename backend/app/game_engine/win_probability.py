@@ -0,0 +1,122 @@
+"""
+승리 확률(WP) 모델
+
+양 팀 공격의 이닝 득점 분포(markov.inning_runs_distribution)로 이닝/점수차별 홈팀 승리 확률을
+역방향으로 계산해 둔다. 종료 규칙은 GameState.is_game_over와 같다 - 9회초 이후 홈팀이 앞서거나 9회말 이후
+점수가 갈리면 끝나고, 동점이면 연장 이닝을 반복한다.
+"""
+from functools import lru_cache
+from typing import Dict, Optional
+
+import numpy as np
+
+from .at_bat_simulator import AtBatSimulator
+from .baserunning import AVERAGE_BUCKET, Baserunning
+from .markov import MAX_RUNS, N_STATES, inning_runs_distribution
+from .run_expectancy import runners_to_mask
+
+# 점수차 범위 (-MAX_DIFF ~ MAX_DIFF, 밖은 잘라냄)
+MAX_DIFF = 30
+REGULATION_INNINGS = 9
+
+AVERAGE_RATINGS = {name: 50 for name in ('contact', 'power', 'eye', 'stuff', 'control', 'movement')}
+
+
+def average_probabilities(simulator: Optional[AtBatSimulator] = None) -> np.ndarray:
+    """평균(50) 타자 vs 평균 투수의 [일반, 득점권] 결과 확률 (2, 8)"""
+    simulator = simulator or AtBatSimulator()
+    return np.array([
+        [simulator.outcome_probabilities(AVERAGE_RATINGS, AVERAGE_RATINGS, {'runners_in_scoring_position': risp})[o]
+         for o in simulator.outcomes]
+        for risp in (False, True)
+    ])
+
+
+class WinProbability:
+    """
+    홈팀 승리 확률 테이블
+
+    away_probs/home_probs: 각 팀 공격의 [일반, 득점권] 결과 확률 (2, 8) - 기본은 리그 평균
+    baserunning: 진루 테이블 구간 (None이면 고정 진루 규칙)
+    """
+
+    def __init__(self, away_probs: Optional[np.ndarray] = None, home_probs: Optional[np.ndarray] = None,
+                 baserunning: Optional[Baserunning] = None):
+        if away_probs is None or home_probs is None:
+            average = average_probabilities()
+            away_probs = average if away_probs is None else away_probs
+            home_probs = average if home_probs is None else home_probs
+
+        # 상태별 남은 이닝 득점 분포 (24, MAX_RUNS + 1)
+        states = np.arange(N_STATES)
+        self._runs_from_state = {
+            is_bottom: inning_runs_distribution(np.broadcast_to(probs, (N_STATES, 1) + np.shape(probs)), states,
+                                                baserunning=baserunning)
+            for is_bottom, probs in ((False, away_probs), (True, home_probs))
+        }
+        self._diffs = np.arange(-MAX_DIFF, MAX_DIFF + 1)
+
+        away_inning = self._runs_from_state[False][0]
+        home_inning = self._runs_from_state[True][0]
+        tie = float(away_inning @ home_inning)
+        home_wins = sum(away_inning[a] * home_inning[a + 1:].sum() for a in range(MAX_RUNS + 1))
+        self.extra_inning_wp = home_wins / (1.0 - tie)
+
+        # _start[(inning, is_bottom)][점수차 인덱스] - 하프 이닝 시작 시점 홈팀 승리 확률
+        self._start = {}
+        for inning in range(REGULATION_INNINGS, 0, -1):
+            for is_bottom in (True, False):
+                self._start[(inning, is_bottom)] = self._play_half(inning, is_bottom, self._runs_from_state[is_bottom][0])
+
+    def _index(self, diffs):
+        return np.clip(diffs, -MAX_DIFF, MAX_DIFF) + MAX_DIFF
+
+    def end_of_half(self, inning: int, is_bottom: bool, diffs) -> np.ndarray:
+        """하프 이닝이 끝난 시점(점수차 = 홈 - 원정)의 홈팀 승리 확률"""
+        diffs = np.asarray(diffs)
+        inning = min(inning, REGULATION_INNINGS)
+        if not is_bottom:
+            after = self._start[(inning, True)][self._index(diffs)]
+            if inning == REGULATION_INNINGS:
+                # 9회 이후 초 종료 시 홈팀이 앞서면 경기 종료
+                after = np.where(diffs > 0, 1.0, after)
+            return after
+        if inning == REGULATION_INNINGS:
+            return np.where(diffs > 0, 1.0, np.where(diffs < 0, 0.0, self.extra_inning_wp))
+        return self._start[(inning + 1, False)][self._index(diffs)]
+
+    def _play_half(self, inning: int, is_bottom: bool, runs_pmf: np.ndarray) -> np.ndarray:
+        """득점 분포로 하프 이닝을 진행한 홈팀 승리 확률 (점수차별)"""
+        runs = np.arange(len(runs_pmf))
+        after = self._diffs[:, None] + (runs if is_bottom else -runs)
+        return self.end_of_half(inning, is_bottom, after) @ runs_pmf
+
+    def after_runs(self, inning: int, is_bottom: bool, diff: int, runs_pmf: np.ndarray) -> np.ndarray:
+        """
+        남은 하프 이닝의 득점 분포가 runs_pmf일 때 홈팀 승리 확률
+
+        runs_pmf: (R,) 또는 여러 시나리오를 묶은 (B, R)
+        """
+        runs = np.arange(runs_pmf.shape[-1])
+        after = diff + (runs if is_bottom else -runs)
+        return runs_pmf @ self.end_of_half(inning, is_bottom, after)
+
+    def home_win_probability(self, inning: int, is_bottom: bool, outs: int, bases: int, diff: int) -> float:
+        """경기 상황(점수차 = 홈 - 원정)의 홈팀 승리 확률"""
+        if outs >= 3:
+            return float(self.end_of_half(inning, is_bottom, diff))
+        runs_pmf = self._runs_from_state[is_bottom][outs * 8 + bases]
+        return float(self.after_runs(inning, is_bottom, diff, runs_pmf))
+
+    def from_state(self, state: Dict) -> float:
+        """GameState.get_state_dict() 형식으로 홈팀 승리 확률"""
+        return self.home_win_probability(
+            state['inning'], state['is_bottom'], state['outs'], runners_to_mask(state['runners']),
+            state['home_score'] - state['away_score']
+        )
+
+
+@lru_cache(maxsize=1)
+def league_win_probability() -> WinProbability:
+    """리그 평균 공격력/주루/수비 기준 WP 테이블 (프로세스당 한 번 계산)"""
+    return WinProbability(baserunning=(AVERAGE_BUCKET, AVERAGE_BUCKET))
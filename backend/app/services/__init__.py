@@ -0,0 +1,16 @@
+"""
+서비스 모듈
+"""
+from .roster_artifact import RosterArtifact, RosterArtifactError, write_roster_artifact
+from .roster_store import RosterStore
+from .storage import DEFAULT_DB_PATH, MLBStorage, StorageError
+
+__all__ = [
+    'RosterArtifact',
+    'RosterArtifactError',
+    'write_roster_artifact',
+    'RosterStore',
+    'DEFAULT_DB_PATH',
+    'MLBStorage',
+    'StorageError'
+]
@@ -0,0 +1,132 @@
+"""
+게임 실행용 경량 로스터 아티팩트 (msgpack)
+
+팀 데이터에서 앱/엔진이 실제로 읽는 필드만 뽑아 하나의 파일로 묶는다.
+
+파일 구조: MAGIC | <스키마 버전, 헤더 길이> | 헤더(msgpack) | 팀별 msgpack 블록
+헤더에는 팀별 (offset, length)가 있어 필요한 팀만 읽어서 디코딩한다.
+"""
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import msgpack
+
+from ..file_io import write_bytes_atomic
+
+# 필드 구성이 바뀌면 올려서 기존 아티팩트 무효화
+ROSTER_SCHEMA_VERSION = 1
+
+MAGIC = b'MLBROSTR'
+_PREFIX = struct.Struct('<II')
+
+TEAM_FIELDS = ('team_id', 'team_name', 'short_name', 'stadium', 'league', 'division')
+PLAYER_FIELDS = ('id', 'name', 'position', 'bat_side', 'pitch_hand', 'is_pitcher', 'ratings_20_80')
+
+# strategy_advisor._get_player_stats에서 읽는 FanGraphs 지표
+FANGRAPHS_KEYS = ('wRC+', 'ISO', 'K%', 'BB%', 'WAR', 'OPS', 'GB%', 'FIP', 'ERA', 'Strike%', 'HR/9')
+
+# 매치업 화면(show_matchup)에 표시하는 시즌 성적
+BATTING_DISPLAY_STATS = ('avg', 'ops', 'homeRuns', 'rbi', 'hits', 'runs')
+PITCHING_DISPLAY_STATS = ('era', 'whip', 'wins', 'losses', 'strikeOuts', 'inningsPitched')
+
+
+class RosterArtifactError(ValueError):
+    """아티팩트가 없거나 형식/스키마 버전이 맞지 않음"""
+
+
+def _pick(source: Dict, keys: Iterable[str]) -> Dict:
+    return {key: source[key] for key in keys if key in source}
+
+
+def slim_player(player: Dict) -> Dict:
+    """게임에서 쓰는 필드만 남긴 선수 레코드"""
+    slim = _pick(player, PLAYER_FIELDS)
+    if player.get('fangraphs_stats'):
+        slim['fangraphs_stats'] = _pick(player['fangraphs_stats'], FANGRAPHS_KEYS)
+    if 'stats_2024' in player:
+        keys = PITCHING_DISPLAY_STATS if player.get('is_pitcher') else BATTING_DISPLAY_STATS
+        slim['stats_2024'] = _pick(player['stats_2024'] or {}, keys)
+    return slim
+
+
+def slim_team(team_data: Dict) -> Dict:
+    slim = _pick(team_data, TEAM_FIELDS)
+    slim['pitchers'] = [slim_player(p) for p in team_data['pitchers']]
+    slim['batters'] = [slim_player(b) for b in team_data['batters']]
+    return slim
+
+
+def write_roster_artifact(teams: Iterable[Dict], path: Path, season: Optional[int] = None,
+                          source_version: Optional[int] = None) -> int:
+    """
+    팀 데이터 목록을 아티팩트로 저장 (원자적 교체), 기록한 바이트 수 반환
+
+    source_version은 원본 저장소의 data_version - 리더가 최신 여부를 판단할 때 사용
+    """
+    path = Path(path)
+    blocks = []
+    index = {}
+    offset = 0
+    for team_data in teams:
+        block = msgpack.packb(slim_team(team_data), use_bin_type=True)
+        index[team_data['short_name']] = (offset, len(block))
+        blocks.append(block)
+        offset += len(block)
+
+    header = msgpack.packb({
+        'built_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'season': season,
+        'source_version': source_version,
+        'teams': index
+    }, use_bin_type=True)
+    payload = b''.join([MAGIC, _PREFIX.pack(ROSTER_SCHEMA_VERSION, len(header)), header] + blocks)
+
+    write_bytes_atomic(path, payload)
+    return len(payload)
+
+
+class RosterArtifact:
+    """
+    아티팩트 리더 - 생성 시 헤더만 읽고, 팀 블록은 load_team 호출 시 디코딩
+
+    load_team은 매번 새 dict를 반환하므로 세션별로 수정해도 서로 영향이 없다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        try:
+            with open(self.path, 'rb') as f:
+                prefix = f.read(len(MAGIC) + _PREFIX.size)
+                if len(prefix) < len(MAGIC) + _PREFIX.size or not prefix.startswith(MAGIC):
+                    raise RosterArtifactError(f"로스터 아티팩트 형식 아님: {self.path}")
+                version, header_len = _PREFIX.unpack_from(prefix, len(MAGIC))
+                if version != ROSTER_SCHEMA_VERSION:
+                    raise RosterArtifactError(f"로스터 아티팩트 스키마 불일치: {version} != {ROSTER_SCHEMA_VERSION}")
+                header = msgpack.unpackb(f.read(header_len), raw=False)
+        except OSError as e:
+            raise RosterArtifactError(f"로스터 아티팩트 읽기 실패: {e}") from e
+
+        self.version = version
+        self.built_at = header.get('built_at')
+        self.season = header.get('season')
+        self.source_version = header.get('source_version')
+        self._index = {name: tuple(span) for name, span in header['teams'].items()}
+        self._data_start = len(MAGIC) + _PREFIX.size + header_len
+
+    @property
+    def teams(self) -> List[str]:
+        return list(self._index)
+
+    def __contains__(self, short_name: str) -> bool:
+        return short_name in self._index
+
+    def load_team(self, short_name: str) -> Optional[Dict]:
+        span = self._index.get(short_name)
+        if span is None:
+            return None
+        offset, length = span
+        with open(self.path, 'rb') as f:
+            f.seek(self._data_start + offset)
+            return msgpack.unpackb(f.read(length), raw=False, strict_map_key=False)
@@ -0,0 +1,90 @@
+"""
+프로세스 전체에서 공유하는 읽기 전용 로스터 저장소
+
+세션은 선수 ID(int)만 들고 있고, 선수 레코드는 여기서 조회한다.
+레코드는 MappingProxyType/tuple로 고정되어 어느 세션도 수정할 수 없다.
+팀은 처음 요청될 때 한 번만 로드한다.
+"""
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+
+def freeze(value):
+    """dict/list를 재귀적으로 읽기 전용 구조로 변환"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _by_overall(players: Iterable[Mapping]) -> Tuple[int, ...]:
+    ordered = sorted(players, key=lambda p: p['ratings_20_80']['overall'], reverse=True)
+    return tuple(int(p['id']) for p in ordered)
+
+
+class RosterStore:
+    """
+    시즌 하나의 불변 로스터 - load_team(팀 약칭)으로 팀을 지연 로드
+
+    선수 ID 목록은 overall 내림차순으로 정렬되어 있다.
+    """
+
+    def __init__(self, load_team: Callable[[str], Optional[Dict]]):
+        self._load_team = load_team
+        self._lock = threading.Lock()
+        self._players = {}
+        self._team_info = {}
+        self._batters = {}
+        self._pitchers = {}
+
+    def ensure_team(self, short_name: str):
+        """팀이 아직 로드되지 않았으면 로드 (동시에 요청돼도 한 번만)"""
+        if short_name in self._team_info:
+            return
+        with self._lock:
+            if short_name in self._team_info:
+                return
+            team_data = self._load_team(short_name)
+            if team_data is None:
+                raise KeyError(f"팀 데이터 없음: {short_name}")
+            for player in team_data['pitchers'] + team_data['batters']:
+                self._players[int(player['id'])] = freeze(player)
+            self._batters[short_name] = _by_overall(team_data['batters'])
+            self._pitchers[short_name] = _by_overall(team_data['pitchers'])
+            self._team_info[short_name] = freeze({k: v for k, v in team_data.items() if k not in ('pitchers', 'batters')})
+
+    def __getitem__(self, player_id: int) -> Mapping:
+        return self._players[player_id]
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._players
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def get(self, player_id: int) -> Optional[Mapping]:
+        return self._players.get(player_id)
+
+    def players(self, player_ids: Iterable[int]) -> Tuple[Mapping, ...]:
+        return tuple(self._players[player_id] for player_id in player_ids)
+
+    @property
+    def loaded_teams(self) -> Tuple[str, ...]:
+        return tuple(self._team_info)
+
+    def team_info(self, short_name: str) -> Mapping:
+        self.ensure_team(short_name)
+        return self._team_info[short_name]
+
+    def batter_ids(self, short_name: str) -> Tuple[int, ...]:
+        self.ensure_team(short_name)
+        return self._batters[short_name]
+
+    def pitcher_ids(self, short_name: str) -> Tuple[int, ...]:
+        self.ensure_team(short_name)
+        return self._pitchers[short_name]
+
+    def team_player_ids(self, short_name: str) -> Tuple[int, ...]:
+        return self.pitcher_ids(short_name) + self.batter_ids(short_name)
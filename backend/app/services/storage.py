@@ -0,0 +1,226 @@
+"""
+리그/시즌별 팀·선수 데이터 저장소 (SQLite)
+
+팀 JSON과 같은 구조의 dict를 저장/조회한다. 선수 레코드 전체는 JSON 컬럼에 두고,
+조회 조건(시즌, 팀, 선수 ID, 포지션)만 인덱스 컬럼으로 분리해 전체 스캔 없이 찾는다.
+"""
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[3] / "data" / "mlb" / "mlb.sqlite3"
+
+# 테이블 구조가 바뀌면 올림
+STORAGE_SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS teams (
+    season INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    short_name TEXT NOT NULL,
+    team_name TEXT NOT NULL,
+    stadium TEXT,
+    league TEXT,
+    division TEXT,
+    collection_date TEXT,
+    PRIMARY KEY (season, team_id)
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_teams_short_name ON teams (season, short_name);
+CREATE INDEX IF NOT EXISTS idx_teams_division ON teams (season, league, division);
+
+CREATE TABLE IF NOT EXISTS players (
+    season INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    roster_order INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    position TEXT,
+    is_pitcher INTEGER NOT NULL,
+    overall INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (season, team_id, player_id)
+);
+CREATE INDEX IF NOT EXISTS idx_players_player ON players (player_id, season);
+CREATE INDEX IF NOT EXISTS idx_players_position ON players (season, position);
+"""
+
+TEAM_COLUMNS = ('team_id', 'short_name', 'team_name', 'stadium', 'league', 'division', 'collection_date')
+
+TeamRef = Union[int, str]
+
+
+class StorageError(RuntimeError):
+    """저장소 스키마 버전 불일치 등"""
+
+
+class MLBStorage:
+    """
+    SQLite 기반 팀/선수 저장소
+
+    연결은 스레드별로 열고 쓰기는 락으로 직렬화한다 (WAL 모드라 읽기는 쓰기와 동시 진행).
+    팀 단위 저장은 하나의 트랜잭션이라 중간에 끊겨도 이전 로스터가 그대로 남는다.
+    """
+
+    def __init__(self, path: Path = DEFAULT_DB_PATH):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._init_schema(conn)
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self, conn: sqlite3.Connection):
+        with self._write_lock, conn:
+            conn.executescript(SCHEMA)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None:
+                conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', ?)", (str(STORAGE_SCHEMA_VERSION),))
+            elif int(row['value']) != STORAGE_SCHEMA_VERSION:
+                raise StorageError(f"저장소 스키마 불일치: {row['value']} != {STORAGE_SCHEMA_VERSION}")
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('data_version', '0')")
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ---- 쓰기 ----
+
+    def save_team(self, team_data: Dict, season: int):
+        """팀 로스터 전체를 교체 저장 (팀 정보 + 선수) - 선수가 없으면 기존 로스터를 지우지 않고 StorageError"""
+        team_id = team_data['team_id']
+        players = team_data['pitchers'] + team_data['batters']
+        if not players:
+            raise StorageError(f"선수 없는 팀은 저장하지 않음: {team_data['short_name']}")
+        conn = self._conn()
+
+        with self._write_lock, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO teams (season, team_id, short_name, team_name, stadium, league, division, "
+                "collection_date) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (season, team_id, team_data['short_name'], team_data['team_name'], team_data.get('stadium'),
+                 team_data.get('league'), team_data.get('division'), team_data.get('collection_date'))
+            )
+            conn.execute("DELETE FROM players WHERE season = ? AND team_id = ?", (season, team_id))
+            conn.executemany(
+                "INSERT OR REPLACE INTO players (season, team_id, player_id, roster_order, name, position, "
+                "is_pitcher, overall, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (season, team_id, player['id'], order, player['name'], player.get('position'),
+                     int(bool(player.get('is_pitcher'))), (player.get('ratings_20_80') or {}).get('overall'),
+                     json.dumps(player, ensure_ascii=False))
+                    for order, player in enumerate(players)
+                ]
+            )
+            conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'data_version'")
+
+    # ---- 조회 ----
+
+    def data_version(self) -> int:
+        """팀이 저장될 때마다 1씩 증가 - 파생 데이터(로스터 아티팩트)의 최신 여부 확인용"""
+        row = self._conn().execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+        return int(row['value'])
+
+    def seasons(self) -> List[int]:
+        return [row[0] for row in self._conn().execute("SELECT DISTINCT season FROM teams ORDER BY season")]
+
+    def list_teams(self, season: int, league: Optional[str] = None, division: Optional[str] = None) -> List[Dict]:
+        """시즌의 팀 목록 (선수 제외), 리그/지구로 필터링"""
+        query = f"SELECT {', '.join(TEAM_COLUMNS)} FROM teams WHERE season = ?"
+        params = [season]
+        if league:
+            query += " AND league = ?"
+            params.append(league)
+        if division:
+            query += " AND division = ?"
+            params.append(division)
+        query += " ORDER BY league, division, team_name"
+        return [dict(row) for row in self._conn().execute(query, params)]
+
+    def _team_row(self, season: int, team: TeamRef) -> Optional[sqlite3.Row]:
+        column = 'team_id' if isinstance(team, int) else 'short_name'
+        return self._conn().execute(
+            f"SELECT {', '.join(TEAM_COLUMNS)} FROM teams WHERE season = ? AND {column} = ?", (season, team)
+        ).fetchone()
+
+    def load_team(self, season: int, team: TeamRef) -> Optional[Dict]:
+        """팀 JSON과 같은 구조로 로드 (team은 팀 ID 또는 약칭), 없으면 None"""
+        row = self._team_row(season, team)
+        if row is None:
+            return None
+
+        pitchers = []
+        batters = []
+        for player in self._players("season = ? AND team_id = ?", (season, row['team_id'])):
+            (pitchers if player.get('is_pitcher') else batters).append(player)
+
+        team_data = dict(row)
+        team_data.update({
+            'pitchers': pitchers,
+            'batters': batters,
+            'total_players': len(pitchers) + len(batters)
+        })
+        return team_data
+
+    def load_teams(self, season: int, league: Optional[str] = None, division: Optional[str] = None) -> List[Dict]:
+        return [self.load_team(season, team['team_id']) for team in self.list_teams(season, league, division)]
+
+    def load_players(self, season: int, team: TeamRef) -> Dict[int, Dict]:
+        """팀 선수 ID -> 레코드 (변경 감지용, 팀이 없으면 빈 dict)"""
+        row = self._team_row(season, team)
+        if row is None:
+            return {}
+        return {player['id']: player for player in self._players("season = ? AND team_id = ?", (season, row['team_id']))}
+
+    def get_player(self, player_id: int, season: Optional[int] = None) -> Optional[Dict]:
+        """선수 레코드 (시즌 미지정 시 가장 최근 시즌)"""
+        if season is None:
+            players = self._players("player_id = ?", (player_id,), order="season DESC", limit=1)
+        else:
+            players = self._players("player_id = ? AND season = ?", (player_id, season), limit=1)
+        return players[0] if players else None
+
+    def find_players(self, season: int, position: Optional[str] = None, team: Optional[TeamRef] = None,
+                     is_pitcher: Optional[bool] = None) -> List[Dict]:
+        """시즌 내 포지션/팀/투타 조건으로 선수 검색 (overall 내림차순)"""
+        where = ["season = ?"]
+        params = [season]
+        if position:
+            where.append("position = ?")
+            params.append(position)
+        if team is not None:
+            row = self._team_row(season, team)
+            if row is None:
+                return []
+            where.append("team_id = ?")
+            params.append(row['team_id'])
+        if is_pitcher is not None:
+            where.append("is_pitcher = ?")
+            params.append(int(is_pitcher))
+        return self._players(" AND ".join(where), params, order="overall DESC")
+
+    def _players(self, where: str, params: Iterable, order: str = "roster_order", limit: Optional[int] = None) -> List[Dict]:
+        query = f"SELECT data FROM players WHERE {where} ORDER BY {order}"
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        return [json.loads(row['data']) for row in self._conn().execute(query, tuple(params))]
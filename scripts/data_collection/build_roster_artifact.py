@@ -0,0 +1,44 @@
+"""
+저장소의 시즌 로스터 → 게임 실행용 경량 로스터 아티팩트 (roster_{season}.msgpack) 빌드
+"""
+import argparse
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.services.roster_artifact import write_roster_artifact
+from backend.app.services.storage import DEFAULT_DB_PATH, MLBStorage
+from scripts.utils.constants import MLB_SEASON
+
+ARTIFACT_DIR = project_root / "data" / "mlb"
+
+
+def artifact_path(season: int) -> Path:
+    return ARTIFACT_DIR / f"roster_{season}.msgpack"
+
+
+def build_roster_artifact(storage: MLBStorage, season: int, league=None, division=None):
+    """시즌의 (필터링된) 팀을 모두 읽어 아티팩트 생성"""
+    source_version = storage.data_version()
+    teams = storage.load_teams(season, league, division)
+    path = artifact_path(season)
+    size = write_roster_artifact(teams, path, season, source_version)
+    print(f"Roster artifact: {len(teams)} teams ({season}), {size:,} bytes")
+    print(f"Saved to {path}")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게임 실행용 로스터 아티팩트 빌드")
+    parser.add_argument("--season", type=int, default=MLB_SEASON, help="시즌")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH, help="SQLite 저장소 파일")
+    args = parser.parse_args()
+
+    print("\nBuilding runtime roster artifact\n")
+    build_roster_artifact(MLBStorage(args.db), args.season)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+데이터 수집 체크포인트 저널 및 변경 감지
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+# 스탯 변동 여부를 판단하는 누적 지표 (타자 / 투수)
+HITTING_SIGNATURE_KEYS = ('gamesPlayed', 'plateAppearances')
+PITCHING_SIGNATURE_KEYS = ('gamesPlayed', 'battersFaced', 'inningsPitched')
+
+
+def stats_signature(stats: Optional[Dict], is_pitcher: bool) -> tuple:
+    """시즌 스탯의 변경 감지용 서명"""
+    keys = PITCHING_SIGNATURE_KEYS if is_pitcher else HITTING_SIGNATURE_KEYS
+    stats = stats or {}
+    return tuple(str(stats.get(key, '')) for key in keys)
+
+
+def is_unchanged(player: Dict, existing: Optional[Dict]) -> bool:
+    """기존 레코드와 비교해 스탯이 그대로인지 확인"""
+    if not existing or existing.get('is_pitcher') != player.get('is_pitcher'):
+        return False
+    is_pitcher = player['is_pitcher']
+    return stats_signature(player.get('stats_2024'), is_pitcher) == stats_signature(existing.get('stats_2024'), is_pitcher)
+
+
+class CollectionJournal:
+    """선수 단위로 수집 결과를 한 줄씩 기록하는 JSONL 체크포인트"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[int, Dict]:
+        """이전 실행에서 완료된 선수 레코드 (중간에 잘린 마지막 줄은 무시)"""
+        records = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    records[record['id']] = record
+        except OSError:
+            pass
+        return records
+
+    def append(self, record: Dict):
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+
+    def discard(self):
+        """팀 파일 저장이 끝나면 저널 삭제"""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
@@ -1,72 +1,184 @@
 """
-MLB NL West 팀 데이터 수집 스크립트
+MLB 팀 데이터 수집 스크립트 (리그/지구/시즌 선택, SQLite 저장소에 기록)
 """
-import json
+import argparse
 import time
 import sys
-import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # 프로젝트 루트를 Python path에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from scripts.utils.mlb_api import MLBAPIClient
-from scripts.utils.constants import NL_WEST_TEAMS
+from backend.app.file_io import write_json_atomic
+from backend.app.services.storage import DEFAULT_DB_PATH, MLBStorage
+from scripts.utils.mlb_api import MLBAPIClient, OfflineCacheMiss, ResponseCache
+from scripts.data_collection.checkpoint import (
+    HITTING_SIGNATURE_KEYS, PITCHING_SIGNATURE_KEYS, CollectionJournal, is_unchanged
+)
+from scripts.utils.constants import (
+    MLB_SEASON, MLB_DIVISIONS, MLB_API_BASE_URL, MLB_API_RATE_LIMIT, MLB_API_MAX_WORKERS, MLB_API_CACHE_TTL,
+    select_teams
+)
 
+CACHE_DIR = project_root / "data" / "cache" / "mlb_api"
+DATA_DIR = project_root / "data" / "mlb"
 
-def collect_team_data(team_id: int, team_info: dict, api_client: MLBAPIClient) -> dict:
-    """특정 팀의 전체 데이터 수집"""
-    print(f"\nCollecting {team_info['name']}...")
 
-    roster = api_client.get_team_roster(team_id)
-    print(f"Found {len(roster)} players")
+class IncompleteTeamData(RuntimeError):
+    """로스터를 못 받았거나 일부 선수가 빠진 수집 결과 - 저장하면 기존 팀 데이터를 덮어쓰므로 저장하지 않음"""
 
-    pitchers = []
-    batters = []
-    errors = []
 
-    for idx, player in enumerate(roster, 1):
-        player_id = player['id']
-        player_name = player['name']
+def division_dir(division: str) -> Path:
+    """지구별 JSON 내보내기 디렉토리 (예: NL West -> data/mlb/nl_west/teams)"""
+    return DATA_DIR / division.lower().replace(" ", "_") / "teams"
 
-        print(f"[{idx}/{len(roster)}] {player_name}...", end=" ")
 
-        try:
-            player_data = api_client.get_complete_player_data(player_id)
+def checkpoint_path(season: int, short_name: str) -> Path:
+    return DATA_DIR / ".checkpoints" / str(season) / f"{short_name}.jsonl"
+
+
+def fetch_player(api_client: MLBAPIClient, player_id: int, existing: dict = None) -> dict:
+    """개별 선수 조회 - 기존 레코드가 있으면 스탯만 먼저 받아보고 변동이 있을 때만 전체 재수집"""
+    if existing:
+        stats = api_client.get_player_stats(player_id, existing['is_pitcher'])
+        if stats is not None and is_unchanged({'is_pitcher': existing['is_pitcher'], 'stats_2024': stats}, existing):
+            return existing
+    return api_client.get_complete_player_data(player_id)
+
+
+def fetch_team_players(team_id: int, team_info: dict, api_client: MLBAPIClient,
+                       executor: ThreadPoolExecutor, existing: dict = None,
+                       journal: CollectionJournal = None) -> tuple:
+    """
+    팀 선수 데이터 조회 - hydrate 로스터 1회 요청을 우선 사용하고,
+    실패 시 /people 배치 요청, 그래도 빠진 선수만 개별 요청 (두 경로 모두 저널에 선수 단위로 체크포인트)
+
+    배치 경로에서는 기존 레코드가 있는 선수의 시즌 스탯만 먼저 받아 변동이 없으면 기존 레코드를 쓰고,
+    새 선수와 스탯이 바뀐 선수만 전체 데이터를 받는다.
+    """
+    existing = existing or {}
+    done = journal.load() if journal else {}
+
+    players = api_client.get_team_players(team_id)
+    if players is not None:
+        print(f"[{team_info['short_name']}] Found {len(players)} players (hydrated roster)")
+        for player_data in players:
+            if journal and done.get(player_data['id']) != player_data:
+                journal.append(player_data)
+        return players, []
+
+    roster = api_client.get_team_roster(team_id)
+    print(f"[{team_info['short_name']}] Found {len(roster)} players")
+    if done:
+        print(f"[{team_info['short_name']}] Resuming: {len(done)} players from checkpoint")
 
-            if not player_data:
-                print("Failed")
-                errors.append(player_name)
-                continue
+    def record(player_id, player_data):
+        done[player_id] = player_data
+        if journal:
+            journal.append(player_data)
 
-            player_data['team'] = team_info['name']
-            player_data['team_id'] = team_id
-            player_data['team_short_name'] = team_info['short_name']
+    pending = [player['id'] for player in roster if player['id'] not in done]
 
-            if player_data['is_pitcher']:
-                pitchers.append(player_data)
-                print("P")
-            else:
-                batters.append(player_data)
-                print("B")
+    # 변경 감지 - 기존 선수는 서명 스탯만 배치로 받아 비교
+    known = {player_id: existing[player_id]['is_pitcher'] for player_id in pending if player_id in existing}
+    if known:
+        stats = api_client.get_season_stats_bulk(known, HITTING_SIGNATURE_KEYS + PITCHING_SIGNATURE_KEYS)
+        for player_id, is_pitcher in known.items():
+            if player_id in stats and is_unchanged({'is_pitcher': is_pitcher, 'stats_2024': stats[player_id]},
+                                                   existing[player_id]):
+                record(player_id, existing[player_id])
+        before = len(pending)
+        pending = [player_id for player_id in pending if player_id not in done]
+        print(f"[{team_info['short_name']}] {before - len(pending)} unchanged, fetching {len(pending)}")
 
-            time.sleep(0.5)
+    bulk = api_client.get_players_bulk(pending)
+    for player_id in pending:
+        if player_id in bulk:
+            record(player_id, bulk[player_id])
 
+    futures = {executor.submit(fetch_player, api_client, player_id, existing.get(player_id)): player_id
+               for player_id in pending if player_id not in bulk}
+    for future in as_completed(futures):
+        try:
+            player_data = future.result()
+        except OfflineCacheMiss:
+            raise
         except Exception as e:
-            print(f"Error: {e}")
-            errors.append(player_name)
+            print(f"[{team_info['short_name']}] {futures[future]} Error: {e}")
             continue
+        if player_data:
+            record(futures[future], player_data)
+
+    # 로스터 순서를 유지하며 결과 정리
+    players = [done[player['id']] for player in roster if player['id'] in done]
+    errors = [player['name'] for player in roster if player['id'] not in done]
+    return players, errors
+
+
+def collect_team_data(team_id: int, team_info: dict, api_client: MLBAPIClient,
+                      executor: ThreadPoolExecutor = None, existing: dict = None,
+                      journal: CollectionJournal = None, allow_partial: bool = False) -> dict:
+    """
+    특정 팀의 전체 데이터 수집 (기존 레코드와 비교해 스탯이 그대로인 선수는 기존 데이터 유지)
+
+    선수가 한 명도 없거나, allow_partial이 아닌데 빠진 선수가 있으면 IncompleteTeamData
+    (저널은 남으므로 다음 실행에서 이어서 수집)
+    """
+    print(f"\nCollecting {team_info['name']}...")
+
+    existing = existing or {}
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=MLB_API_MAX_WORKERS)
+
+    try:
+        players, errors = fetch_team_players(team_id, team_info, api_client, executor, existing, journal)
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    if not players:
+        raise IncompleteTeamData(f"[{team_info['short_name']}] 로스터를 가져오지 못함")
+    if errors and not allow_partial:
+        raise IncompleteTeamData(
+            f"[{team_info['short_name']}] {len(errors)}명 수집 실패 ({', '.join(errors)}) - 기존 데이터 유지 "
+            f"(일부만이라도 저장하려면 --allow-partial)"
+        )
+
+    # 스탯 변동이 없는 선수는 FanGraphs 지표/능력치가 붙은 기존 레코드를 그대로 사용
+    unchanged = 0
+    for idx, player_data in enumerate(players):
+        if is_unchanged(player_data, existing.get(player_data['id'])):
+            players[idx] = existing[player_data['id']]
+            unchanged += 1
+    if existing:
+        print(f"[{team_info['short_name']}] {unchanged} unchanged, {len(players) - unchanged} new or updated")
+
+    pitchers = []
+    batters = []
+    for player_data in players:
+        player_data['team'] = team_info['name']
+        player_data['team_id'] = team_id
+        player_data['team_short_name'] = team_info['short_name']
 
-    print(f"Collected {len(pitchers)} pitchers, {len(batters)} batters")
+        if player_data['is_pitcher']:
+            pitchers.append(player_data)
+        else:
+            batters.append(player_data)
+
+    print(f"[{team_info['short_name']}] Collected {len(pitchers)} pitchers, {len(batters)} batters")
     if errors:
-        print(f"Failed: {', '.join(errors)}")
+        print(f"[{team_info['short_name']}] Failed: {', '.join(errors)}")
 
     return {
         "team_id": team_id,
         "team_name": team_info['name'],
         "short_name": team_info['short_name'],
         "stadium": team_info['stadium'],
+        "league": team_info.get('league'),
+        "division": team_info.get('division'),
         "pitchers": pitchers,
         "batters": batters,
         "total_players": len(pitchers) + len(batters),
@@ -81,33 +193,16 @@ def save_team_data(team_data: dict, output_dir: Path):
     filename = f"{team_data['short_name']}.json"
     filepath = output_dir / filename
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(team_data, f, indent=2, ensure_ascii=False)
+    write_json_atomic(filepath, team_data)
 
     print(f"Saved to {filepath}")
 
 
-def main():
-    """메인 함수"""
-    print("\nMLB NL West Data Collection - 2025 Season\n")
-
-    api_client = MLBAPIClient()
-    output_dir = project_root / "data" / "mlb" / "nl_west" / "teams"
-    all_teams_data = []
-
-    for team_id, team_info in NL_WEST_TEAMS.items():
-        try:
-            team_data = collect_team_data(team_id, team_info, api_client)
-            save_team_data(team_data, output_dir)
-            all_teams_data.append(team_data)
-            time.sleep(2)
-        except Exception as e:
-            print(f"Failed to collect {team_info['name']}: {e}")
-            continue
-
+def save_summary(all_teams_data: list, output_dir: Path, extra: dict = None, season: int = MLB_SEASON) -> tuple:
+    """수집 요약 파일 저장"""
     summary = {
         "collection_date": time.strftime("%Y-%m-%d %H:%M:%S"),
-        "season": 2025,
+        "season": season,
         "total_teams": len(all_teams_data),
         "teams": [
             {
@@ -117,15 +212,91 @@ def main():
                 "total": team['total_players']
             }
             for team in all_teams_data
-        ]
+        ],
+        **(extra or {})
     }
 
+    output_dir.mkdir(parents=True, exist_ok=True)
     summary_path = output_dir / "collection_summary.json"
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    write_json_atomic(summary_path, summary)
+    return summary, summary_path
+
+
+def add_scope_args(parser):
+    """수집 대상(시즌/리그/지구)과 저장소 공통 인자"""
+    parser.add_argument("--season", type=int, default=MLB_SEASON, help="수집 시즌")
+    parser.add_argument("--league", choices=["AL", "NL"], help="리그 필터")
+    parser.add_argument("--division", default="NL West", choices=list(MLB_DIVISIONS) + ["all"],
+                        help="지구 필터 ('all'이면 리그 전체 또는 30개 팀)")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH, help="SQLite 저장소 파일")
+    parser.add_argument("--export-json", action="store_true", help="지구별 팀 JSON 파일도 함께 저장")
+
+
+def selected_teams(args) -> dict:
+    return select_teams(args.league, None if args.division == "all" else args.division)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="MLB 팀 데이터 수집")
+    add_scope_args(parser)
+    parser.add_argument("--base-url", default=MLB_API_BASE_URL, help="MLB Stats API 주소 (로컬 픽스처 서버 테스트용)")
+    parser.add_argument("--rate", type=float, default=MLB_API_RATE_LIMIT, help="초당 최대 요청 수")
+    parser.add_argument("--workers", type=int, default=MLB_API_MAX_WORKERS, help="동시 요청 스레드 수")
+    parser.add_argument("--cache-ttl", type=float, default=MLB_API_CACHE_TTL, help="응답 캐시 유효 시간 (초)")
+    parser.add_argument("--no-cache", action="store_true", help="응답 캐시 사용 안 함")
+    parser.add_argument("--offline", action="store_true", help="네트워크 없이 기록된 응답만 재생")
+    parser.add_argument("--full", action="store_true", help="저장된 데이터와의 변경 감지 없이 전체 재수집")
+    parser.add_argument("--allow-partial", action="store_true", help="일부 선수 수집에 실패해도 나머지로 저장")
+    return parser.parse_args()
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    teams = selected_teams(args)
+    print(f"\nMLB Data Collection - {len(teams)} teams, {args.season} Season\n")
+
+    started = time.perf_counter()
+    cache = None if args.no_cache else ResponseCache(CACHE_DIR, ttl=args.cache_ttl)
+    api_client = MLBAPIClient(base_url=args.base_url, season=args.season, rate_limit=args.rate,
+                              pool_size=args.workers, cache=cache, offline=args.offline)
+    storage = MLBStorage(args.db)
+
+    # 선수 요청 풀은 모든 팀이 공유하고, 팀은 별도 풀에서 병렬 진행
+    with ThreadPoolExecutor(max_workers=args.workers) as player_pool, \
+            ThreadPoolExecutor(max_workers=min(len(teams), 8) or 1) as team_pool:
+        team_futures = {}
+        for team_id, team_info in teams.items():
+            existing = {} if args.full else storage.load_players(args.season, team_id)
+            journal = CollectionJournal(checkpoint_path(args.season, team_info['short_name']))
+            future = team_pool.submit(collect_team_data, team_id, team_info, api_client, player_pool, existing, journal,
+                                      args.allow_partial)
+            team_futures[future] = (team_info, journal)
+
+        results = {}
+        for future in as_completed(team_futures):
+            team_info, journal = team_futures[future]
+            try:
+                team_data = future.result()
+                storage.save_team(team_data, args.season)
+                if args.export_json:
+                    save_team_data(team_data, division_dir(team_info['division']))
+                journal.discard()
+                results[team_data['team_id']] = team_data
+            except Exception as e:
+                print(f"Failed to collect {team_info['name']}: {e}")
+
+    # 요약은 팀 정의 순서로 기록
+    all_teams_data = [results[team_id] for team_id in teams if team_id in results]
+
+    summary, summary_path = save_summary(all_teams_data, DATA_DIR / "summaries" / str(args.season), season=args.season)
 
     print(f"\nComplete: {summary['total_teams']} teams, {sum(t['total'] for t in summary['teams'])} players")
-    print(f"Saved to: {summary_path}")
+    print(f"Stored in: {args.db}")
+    print(f"Summary: {summary_path}")
+    print(f"Elapsed: {time.perf_counter() - started:.1f}s")
+    if api_client.cache_stats:
+        print("Requests: " + ", ".join(f"{k} {v}" for k, v in sorted(api_client.cache_stats.items())))
 
 
 if __name__ == "__main__":
@@ -1,13 +1,19 @@
 """
 MLB 스탯을 20-80 스케일 게임 능력치로 변환
 """
-import json
+import argparse
 import sys
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from backend.app.services.storage import MLBStorage
+from scripts.data_collection.collect_mlb_data import add_scope_args, division_dir, save_team_data
+
 
 def clamp(value, min_val=20, max_val=80):
     """값을 20-80 범위로 제한"""
@@ -200,34 +206,202 @@ def convert_pitcher_to_20_80(player):
     }
 
 
-def convert_team_data(team_file):
-    """팀 데이터 변환"""
-    with open(team_file, 'r', encoding='utf-8') as f:
-        team_data = json.load(f)
+BATTER_RATINGS = ("contact", "power", "eye", "speed", "defense", "overall")
+PITCHER_RATINGS = ("stuff", "control", "movement", "stamina", "pitchability", "overall")
+
+
+def clamp_array(values, min_val=20, max_val=80):
+    """clamp의 벡터 버전 (int() 절사 후 범위 제한)"""
+    return np.clip(np.trunc(values), min_val, max_val).astype(np.int64)
+
+
+def to_number(column, default):
+    """숫자가 아닌 값(".---" 등)은 기본값으로 채워 숫자 컬럼으로 변환"""
+    return pd.to_numeric(column, errors='coerce').fillna(default)
+
+
+def batters_to_frame(players):
+    """타자 리스트를 변환 입력 컬럼 테이블로 펼침"""
+    rows = []
+    for player in players:
+        mlb_stats = player.get('stats_2024', {})
+        fg_stats = player.get('fangraphs_stats', {})
+        rows.append((
+            mlb_stats.get('plateAppearances', 0),
+            fg_stats.get('K%', 0.23),
+            mlb_stats.get('avg', 0.250),
+            fg_stats.get('ISO', 0.150),
+            mlb_stats.get('homeRuns', 0),
+            fg_stats.get('BB%', 0.085),
+            fg_stats.get('BsR', 0.0),
+            mlb_stats.get('stolenBases', 0),
+            fg_stats.get('Def', 0.0),
+            player.get('position', 'LF')
+        ))
+    df = pd.DataFrame(rows, columns=['pa', 'k', 'avg', 'iso', 'hr', 'bb', 'bsr', 'sb', 'def', 'position'])
+    # 0타수 선수는 avg가 ".---"로 옴 - 어차피 PA<200이라 40 처리되므로 기본값으로 채움
+    df['avg'] = to_number(df['avg'], 0.250)
+    for column in ('pa', 'hr', 'sb'):
+        df[column] = to_number(df[column], 0).astype(np.int64)
+    return df
+
+
+def pitchers_to_frame(players):
+    """투수 리스트를 변환 입력 컬럼 테이블로 펼침"""
+    rows = []
+    for player in players:
+        mlb_stats = player.get('stats_2024', {})
+        fg_stats = player.get('fangraphs_stats', {})
+        rows.append((
+            mlb_stats.get('inningsPitched', '0'),
+            fg_stats.get('K%', 0.22),
+            fg_stats.get('BB%', 0.085),
+            fg_stats.get('GB%', 0.44),
+            fg_stats.get('FIP', 4.00)
+        ))
+    df = pd.DataFrame(rows, columns=['ip', 'k', 'bb', 'gb', 'fip'])
+    df['ip'] = to_number(df['ip'], 0.0)
+    return df
+
+
+def convert_batters_frame(df):
+    """리그 전체 타자를 한 번에 20-80 변환 - convert_batter_to_20_80과 동일 결과"""
+    k_pct = df['k'].to_numpy(dtype=float) * 100
+    avg = df['avg'].to_numpy(dtype=float)
+    contact = (50 + (23 - k_pct) * 1.5) + (avg - 0.250) * 100
+
+    hr = df['hr'].to_numpy()
+    hr_bonus = np.select(
+        [hr >= 50, hr >= 40, hr >= 30, hr >= 25, hr >= 20, hr >= 15],
+        [20, 15, 10, 7, 5, 3],
+        default=(hr - 10) * 0.3
+    )
+    power = (50 + (df['iso'].to_numpy(dtype=float) - 0.150) * 200) + hr_bonus
+
+    eye = 50 + (df['bb'].to_numpy(dtype=float) * 100 - 8.5) * 2.5
+
+    sb_bonus = np.minimum(df['sb'].to_numpy() * 0.4, 20)
+    speed = (50 + df['bsr'].to_numpy(dtype=float) * 4) + sb_bonus
+
+    defense_val = df['def'].to_numpy(dtype=float)
+    defense = np.select(
+        [defense_val >= 10, defense_val >= 5, defense_val >= 2, defense_val >= -2, defense_val >= -5],
+        [70, 65, 60, 50, 45],
+        default=40
+    )
+    position = df['position'].to_numpy()
+    defense = defense + np.where(np.isin(position, ['SS', 'CF', 'C']), 5, 0) \
+        - np.where(np.isin(position, ['1B', 'DH', 'TWP']), 3, 0)
+
+    overall = (contact * 0.22 + power * 0.28 + eye * 0.22 +
+               speed * 0.18 + defense * 0.10)
+
+    ratings = pd.DataFrame({
+        "contact": clamp_array(contact),
+        "power": clamp_array(power),
+        "eye": clamp_array(eye),
+        "speed": clamp_array(speed),
+        "defense": clamp_array(defense),
+        "overall": clamp_array(overall)
+    }, index=df.index)
+
+    # 최소 200타석 미만은 일괄 40
+    ratings.loc[df['pa'].to_numpy() < 200, list(BATTER_RATINGS)] = 40
+    return ratings
+
+
+def convert_pitchers_frame(df):
+    """리그 전체 투수를 한 번에 20-80 변환 - convert_pitcher_to_20_80과 동일 결과"""
+    stuff = 50 + (df['k'].to_numpy(dtype=float) * 100 - 22) * 2.5
+    control = 50 + (8.5 - df['bb'].to_numpy(dtype=float) * 100) * 3
+    movement = 50 + (df['gb'].to_numpy(dtype=float) * 100 - 44) * 2
+
+    ip = df['ip'].to_numpy(dtype=float)
+    stamina = np.select(
+        [ip >= 180, ip >= 160, ip >= 140, ip >= 120, ip >= 100, ip >= 70, ip >= 50],
+        [70, 65, 60, 55, 50, 55, 50],
+        default=45
+    )
+
+    fip = df['fip'].to_numpy(dtype=float)
+    pitchability = np.select(
+        [fip <= 2.50, fip <= 3.00, fip <= 3.50, fip <= 4.00, fip <= 4.50, fip <= 5.00, fip <= 5.50],
+        [75, 70, 65, 60, 55, 50, 45],
+        default=40
+    )
 
-    print(f"Converting {team_data['team_name']}...")
+    overall = (stuff * 0.30 + control * 0.25 + movement * 0.15 +
+               stamina * 0.15 + pitchability * 0.15)
 
-    for pitcher in team_data['pitchers']:
-        pitcher['ratings_20_80'] = convert_pitcher_to_20_80(pitcher)
+    ratings = pd.DataFrame({
+        "stuff": clamp_array(stuff),
+        "control": clamp_array(control),
+        "movement": clamp_array(movement),
+        "stamina": clamp_array(stamina),
+        "pitchability": clamp_array(pitchability),
+        "overall": clamp_array(overall)
+    }, index=df.index)
 
-    for batter in team_data['batters']:
-        batter['ratings_20_80'] = convert_batter_to_20_80(batter)
+    # 최소 30이닝 미만은 일괄 40
+    ratings.loc[ip < 30, list(PITCHER_RATINGS)] = 40
+    return ratings
 
-    with open(team_file, 'w', encoding='utf-8') as f:
-        json.dump(team_data, f, indent=2, ensure_ascii=False)
 
-    print(f"  {len(team_data['pitchers'])} pitchers, {len(team_data['batters'])} batters")
+def convert_players(batters, pitchers):
+    """선수 리스트 전체를 벡터 변환해 ratings_20_80 채우기"""
+    if batters:
+        for batter, ratings in zip(batters, convert_batters_frame(batters_to_frame(batters)).to_dict('records')):
+            batter['ratings_20_80'] = ratings
+    if pitchers:
+        for pitcher, ratings in zip(pitchers, convert_pitchers_frame(pitchers_to_frame(pitchers)).to_dict('records')):
+            pitcher['ratings_20_80'] = ratings
+
+
+def check_parity(batters, pitchers):
+    """벡터 변환과 선수별 변환 결과 비교, 불일치 선수 이름 리스트 반환"""
+    mismatches = []
+    if batters:
+        vectorized = convert_batters_frame(batters_to_frame(batters)).to_dict('records')
+        mismatches += [b['name'] for b, r in zip(batters, vectorized) if convert_batter_to_20_80(b) != r]
+    if pitchers:
+        vectorized = convert_pitchers_frame(pitchers_to_frame(pitchers)).to_dict('records')
+        mismatches += [p['name'] for p, r in zip(pitchers, vectorized) if convert_pitcher_to_20_80(p) != r]
+    return mismatches
+
+
+def convert_league(teams, only_missing=False, check=False):
+    """여러 팀 데이터를 리그 단위로 한 번에 변환 (ratings_20_80을 제자리에서 채움)"""
+    batters = [b for t in teams for b in t['batters'] if not (only_missing and 'ratings_20_80' in b)]
+    pitchers = [p for t in teams for p in t['pitchers'] if not (only_missing and 'ratings_20_80' in p)]
+
+    if check:
+        mismatches = check_parity(batters, pitchers)
+        print(f"Parity check: {len(batters) + len(pitchers) - len(mismatches)}/{len(batters) + len(pitchers)} identical")
+        if mismatches:
+            raise SystemExit(f"Vectorized conversion mismatch: {', '.join(mismatches)}")
+
+    convert_players(batters, pitchers)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="저장된 팀 데이터를 20-80 스케일 능력치로 변환")
+    add_scope_args(parser)
+    parser.add_argument("--incremental", action="store_true", help="능력치가 없는 신규/변경 선수만 변환")
+    parser.add_argument("--check-parity", action="store_true", help="선수별 변환 결과와 일치하는지 검증")
+    args = parser.parse_args()
     print("\nConverting to 20-80 Scale\n")
 
-    teams_dir = project_root / "data" / "mlb" / "nl_west" / "teams"
-
-    for team_file in sorted(teams_dir.glob("*.json")):
-        if team_file.name == "collection_summary.json":
-            continue
-        convert_team_data(team_file)
+    storage = MLBStorage(args.db)
+    division = None if args.division == "all" else args.division
+    teams = storage.load_teams(args.season, args.league, division)
+    convert_league(teams, args.incremental, args.check_parity)
+
+    for team_data in teams:
+        storage.save_team(team_data, args.season)
+        if args.export_json:
+            save_team_data(team_data, division_dir(team_data['division']))
+        print(f"Converted {team_data['team_name']}: "
+              f"{len(team_data['pitchers'])} pitchers, {len(team_data['batters'])} batters")
 
     print("\nConversion complete!")
 
@@ -1,17 +1,28 @@
 """
 FanGraphs 고급 지표를 기존 데이터에 추가
 """
-import json
+import argparse
+import os
 import sys
 import unicodedata
+from collections import Counter
 from pathlib import Path
-from pybaseball import batting_stats, pitching_stats
 import warnings
 warnings.filterwarnings('ignore')
 
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from backend.app.services.storage import MLBStorage
+from scripts.utils.constants import FANGRAPHS_SEASON
+from scripts.utils.fangraphs_cache import FanGraphsCache
+from scripts.data_collection.collect_mlb_data import add_scope_args, division_dir, save_team_data
+
+CACHE_DIR = project_root / "data" / "cache" / "fangraphs"
+
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv'}
+MLBAM_ID_COLUMNS = ('xMLBAMID', 'MLBAMID', 'key_mlbam')
+
 
 def remove_accents(text):
     """악센트 제거"""
@@ -19,59 +30,78 @@ def remove_accents(text):
     return ''.join([c for c in nfkd if not unicodedata.combining(c)])
 
 
-def load_fangraphs_data(season=2024):
-    """FanGraphs에서 고급 지표 로드"""
+def load_fangraphs_data(season=FANGRAPHS_SEASON, cache=None):
+    """FanGraphs 고급 지표 로드 (로컬 캐시 우선, FANGRAPHS_FIXTURE_DIR 지정 시 오프라인 픽스처)"""
     print(f"Loading FanGraphs {season} data...")
 
-    # 타자 데이터 (qual=1: 최소 1타석)
-    batters = batting_stats(season, qual=1)
+    if cache is None:
+        cache = FanGraphsCache(CACHE_DIR, fixture_dir=os.getenv("FANGRAPHS_FIXTURE_DIR"))
+
+    batters = cache.load('batting', season)
     print(f"Loaded {len(batters)} batters")
 
-    # 투수 데이터 (qual=1: 최소 1이닝)
-    pitchers = pitching_stats(season, qual=1)
+    pitchers = cache.load('pitching', season)
     print(f"Loaded {len(pitchers)} pitchers")
 
     return batters, pitchers
 
 
-def find_player_in_fangraphs(player_name, fg_data):
-    """FanGraphs 데이터에서 선수 찾기 (악센트 처리)"""
-    # 악센트 제거
-    clean_name = remove_accents(player_name)
-    last_name = clean_name.split()[-1]
+def normalize_name(name):
+    """매칭용 이름 정규화 (악센트/구두점/Jr. 등 접미사 제거, 소문자)"""
+    clean = remove_accents(name).lower().replace('.', '').replace("'", '').replace('-', ' ')
+    tokens = [t for t in clean.split() if t not in NAME_SUFFIXES]
+    return ' '.join(tokens)
+
+
+class FanGraphsIndex:
+    """FanGraphs 테이블을 한 번만 훑어 MLBAM ID / 정규화 전체 이름 / 성으로 O(1) 조회"""
 
-    # FanGraphs 데이터에도 악센트 제거해서 매칭
-    fg_data_copy = fg_data.copy()
-    fg_data_copy['CleanName'] = fg_data_copy['Name'].apply(remove_accents)
+    def __init__(self, fg_data):
+        self.rows = fg_data.to_dict('records')
+        self.by_id = {}
+        self.by_name = {}
+        self.by_last = {}
 
-    # 성(last name)으로 먼저 매칭
-    matches = fg_data_copy[fg_data_copy['CleanName'].str.contains(last_name, case=False, na=False)]
+        id_column = next((c for c in MLBAM_ID_COLUMNS if c in fg_data.columns), None)
+        for idx, row in enumerate(self.rows):
+            if id_column and row.get(id_column) == row.get(id_column):  # NaN 제외
+                self.by_id.setdefault(int(row[id_column]), idx)
+            name = normalize_name(str(row['Name']))
+            row['CleanName'] = name
+            self.by_name.setdefault(name, idx)
+            if name:
+                self.by_last.setdefault(name.split()[-1], []).append(idx)
 
-    if len(matches) == 0:
-        return None
-    elif len(matches) == 1:
-        return matches.iloc[0]
-    else:
-        # 여러 매치 - 전체 이름으로 정확히 매칭
-        exact = matches[matches['CleanName'].str.lower() == clean_name.lower()]
-        if not exact.empty:
-            return exact.iloc[0]
+    def lookup(self, player_name, player_id=None):
+        """(행, 매칭 품질) 반환 - 품질: id / exact / last_name / fuzzy / ambiguous / none"""
+        if player_id is not None and player_id in self.by_id:
+            return self.rows[self.by_id[player_id]], 'id'
 
-        # 정확한 매칭 실패 - 이름이 가장 유사한 것 선택
-        for _, row in matches.iterrows():
-            if clean_name.lower() in row['CleanName'].lower() or row['CleanName'].lower() in clean_name.lower():
-                return row
+        clean_name = normalize_name(player_name)
+        if clean_name in self.by_name:
+            return self.rows[self.by_name[clean_name]], 'exact'
 
-        return matches.iloc[0]
+        candidates = self.by_last.get(clean_name.split()[-1], []) if clean_name else []
+        if not candidates:
+            return None, 'none'
+        if len(candidates) == 1:
+            return self.rows[candidates[0]], 'last_name'
+
+        # 여러 매치 - 이름이 서로 포함되는 후보 우선
+        for idx in candidates:
+            candidate = self.rows[idx]['CleanName']
+            if clean_name in candidate or candidate in clean_name:
+                return self.rows[idx], 'fuzzy'
+        return self.rows[candidates[0]], 'ambiguous'
 
 
 def enrich_batter(batter, fg_batters):
-    """타자에 FanGraphs 지표 추가"""
-    fg_player = find_player_in_fangraphs(batter['name'], fg_batters)
+    """타자에 FanGraphs 지표 추가, 매칭 품질 반환"""
+    fg_player, quality = fg_batters.lookup(batter['name'], batter.get('id'))
 
     if fg_player is None:
         batter['fangraphs_stats'] = {}
-        return
+        return quality
 
     # 주요 고급 지표 추가
     batter['fangraphs_stats'] = {
@@ -87,15 +117,16 @@ def enrich_batter(batter, fg_batters):
         'Def': float(fg_player.get('Def', 0)),  # Defensive runs above average
         'BsR': float(fg_player.get('BsR', 0))   # Base running runs above average
     }
+    return quality
 
 
 def enrich_pitcher(pitcher, fg_pitchers):
-    """투수에 FanGraphs 지표 추가"""
-    fg_player = find_player_in_fangraphs(pitcher['name'], fg_pitchers)
+    """투수에 FanGraphs 지표 추가, 매칭 품질 반환"""
+    fg_player, quality = fg_pitchers.lookup(pitcher['name'], pitcher.get('id'))
 
     if fg_player is None:
         pitcher['fangraphs_stats'] = {}
-        return
+        return quality
 
     # 주요 고급 지표 추가
     pitcher['fangraphs_stats'] = {
@@ -114,48 +145,58 @@ def enrich_pitcher(pitcher, fg_pitchers):
         'GB%': float(fg_player.get('GB%', 45.0)),  # Ground ball %
         'HR/9': float(fg_player.get('HR/9', 1.0))
     }
+    return quality
 
 
-def enrich_team_data(team_file, fg_batters, fg_pitchers):
-    """팀 데이터에 FanGraphs 지표 추가"""
-    with open(team_file, 'r', encoding='utf-8') as f:
-        team_data = json.load(f)
-
-    team_name = team_data['team_name']
-    print(f"Enriching {team_name}...")
+def enrich_players(team_data, fg_batters, fg_pitchers, only_missing=False):
+    """메모리상의 팀 데이터에 FanGraphs 지표 추가, 매칭 품질 집계 반환"""
+    quality = Counter()
 
-    matched_batters = 0
     for batter in team_data['batters']:
-        enrich_batter(batter, fg_batters)
-        if batter.get('fangraphs_stats'):
-            matched_batters += 1
+        if not (only_missing and 'fangraphs_stats' in batter):
+            quality[enrich_batter(batter, fg_batters)] += 1
 
-    matched_pitchers = 0
     for pitcher in team_data['pitchers']:
-        enrich_pitcher(pitcher, fg_pitchers)
-        if pitcher.get('fangraphs_stats'):
-            matched_pitchers += 1
+        if not (only_missing and 'fangraphs_stats' in pitcher):
+            quality[enrich_pitcher(pitcher, fg_pitchers)] += 1
+
+    return quality
 
+
+def report_enrichment(team_data, quality):
+    matched_batters = sum(1 for b in team_data['batters'] if b.get('fangraphs_stats'))
+    matched_pitchers = sum(1 for p in team_data['pitchers'] if p.get('fangraphs_stats'))
     print(f"  Matched {matched_batters}/{len(team_data['batters'])} batters, "
           f"{matched_pitchers}/{len(team_data['pitchers'])} pitchers")
-
-    with open(team_file, 'w', encoding='utf-8') as f:
-        json.dump(team_data, f, indent=2, ensure_ascii=False)
+    print("  Match quality: " + ", ".join(f"{k} {v}" for k, v in quality.most_common()))
 
 
 def main():
+    parser = argparse.ArgumentParser(description="FanGraphs 고급 지표로 저장된 팀 데이터 보강")
+    add_scope_args(parser)
+    parser.add_argument("--incremental", action="store_true", help="지표가 없는 신규/변경 선수만 보강")
+    parser.add_argument("--fangraphs-season", type=int, default=FANGRAPHS_SEASON,
+                        help=f"FanGraphs 시즌 (기본: {FANGRAPHS_SEASON}, 로스터 --season과 별개)")
+    args = parser.parse_args()
     print("\nEnriching data with FanGraphs advanced metrics\n")
 
-    # FanGraphs 데이터 로드
-    fg_batters, fg_pitchers = load_fangraphs_data(season=2025)
+    # FanGraphs 데이터 로드 후 이름/ID 인덱스 생성 (1회)
+    fg_batters, fg_pitchers = load_fangraphs_data(season=args.fangraphs_season)
+    fg_batters, fg_pitchers = FanGraphsIndex(fg_batters), FanGraphsIndex(fg_pitchers)
+
+    # 저장소의 팀을 하나씩 로드해 보강 후 다시 저장
+    storage = MLBStorage(args.db)
+    division = None if args.division == "all" else args.division
+    for team in storage.list_teams(args.season, args.league, division):
+        team_data = storage.load_team(args.season, team['team_id'])
+        print(f"Enriching {team_data['team_name']}...")
 
-    # 각 팀 데이터 보강
-    teams_dir = project_root / "data" / "mlb" / "nl_west" / "teams"
+        quality = enrich_players(team_data, fg_batters, fg_pitchers, args.incremental)
+        report_enrichment(team_data, quality)
 
-    for team_file in sorted(teams_dir.glob("*.json")):
-        if team_file.name == "collection_summary.json":
-            continue
-        enrich_team_data(team_file, fg_batters, fg_pitchers)
+        storage.save_team(team_data, args.season)
+        if args.export_json:
+            save_team_data(team_data, division_dir(team_data['division']))
 
     print("\nEnrichment complete!")
 
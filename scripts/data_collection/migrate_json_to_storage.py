@@ -0,0 +1,50 @@
+"""
+기존 팀 JSON 파일(data/mlb/*/teams/*.json)을 SQLite 저장소로 가져오기
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.services.storage import DEFAULT_DB_PATH, MLBStorage
+from scripts.utils.constants import MLB_SEASON, MLB_TEAMS
+
+
+def import_team_files(storage: MLBStorage, team_files, season: int) -> int:
+    """팀 파일들을 시즌 데이터로 저장, 가져온 팀 수 반환"""
+    imported = 0
+    for team_file in team_files:
+        with open(team_file, 'r', encoding='utf-8') as f:
+            team_data = json.load(f)
+
+        team_info = MLB_TEAMS.get(team_data['team_id'], {})
+        team_data.setdefault('league', team_info.get('league'))
+        team_data.setdefault('division', team_info.get('division'))
+
+        storage.save_team(team_data, season)
+        imported += 1
+        print(f"Imported {team_data['team_name']} ({season}): {team_data['total_players']} players")
+    return imported
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="팀 JSON → SQLite 저장소 가져오기")
+    parser.add_argument("--season", type=int, default=MLB_SEASON, help="JSON 데이터의 시즌")
+    parser.add_argument("--source", type=Path, default=project_root / "data" / "mlb", help="팀 JSON 최상위 디렉토리")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH, help="저장소 파일")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    team_files = [f for f in sorted(args.source.glob("*/teams/*.json")) if f.name != "collection_summary.json"]
+    storage = MLBStorage(args.db)
+    imported = import_team_files(storage, team_files, args.season)
+    print(f"\n{imported} teams imported into {args.db}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+수집 → FanGraphs 보강 → 20-80 변환을 한 번에 처리하는 단일 패스 파이프라인
+
+팀별로 메모리 안에서 세 단계를 모두 거친 뒤 저장소에 한 번만 (한 트랜잭션으로) 기록한다.
+"""
+import argparse
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.services.storage import MLBStorage
+from scripts.utils.mlb_api import MLBAPIClient, ResponseCache
+from scripts.utils.constants import (
+    FANGRAPHS_SEASON, MLB_API_BASE_URL, MLB_API_RATE_LIMIT, MLB_API_MAX_WORKERS, MLB_API_CACHE_TTL
+)
+from scripts.data_collection.checkpoint import CollectionJournal
+from scripts.data_collection.collect_mlb_data import (
+    CACHE_DIR, DATA_DIR, add_scope_args, checkpoint_path, collect_team_data, division_dir, save_summary,
+    save_team_data, selected_teams
+)
+from scripts.data_collection.enrich_with_fangraphs import (
+    FanGraphsIndex, enrich_players, load_fangraphs_data, report_enrichment
+)
+from scripts.data_collection.convert_stats_20_80 import convert_players
+from scripts.data_collection.build_roster_artifact import build_roster_artifact
+
+
+class StageTimer:
+    """단계별 누적 소요 시간 (여러 스레드에서 동시에 기록 가능)"""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.totals[name] += elapsed
+
+    def as_dict(self) -> dict:
+        return {name: round(seconds, 3) for name, seconds in self.totals.items()}
+
+
+def process_team(team_id, team_info, api_client, player_pool, fg_batters, fg_pitchers,
+                 storage, season, timer, full=False, export_json=False, allow_partial=False):
+    """팀 하나를 수집 → 보강 → 변환 후 한 번만 저장"""
+    journal = CollectionJournal(checkpoint_path(season, team_info['short_name']))
+    existing = {} if full else storage.load_players(season, team_id)
+
+    with timer.stage('collect'):
+        team_data = collect_team_data(team_id, team_info, api_client, player_pool, existing, journal, allow_partial)
+
+    # 스탯 변동이 없는 선수는 기존 지표/능력치를 유지하므로 새로 받은 선수만 처리
+    only_missing = not full
+
+    with timer.stage('enrich'):
+        quality = enrich_players(team_data, fg_batters, fg_pitchers, only_missing)
+    print(f"[{team_info['short_name']}] Enriched")
+    report_enrichment(team_data, quality)
+
+    with timer.stage('convert'):
+        convert_players(
+            [b for b in team_data['batters'] if not (only_missing and 'ratings_20_80' in b)],
+            [p for p in team_data['pitchers'] if not (only_missing and 'ratings_20_80' in p)]
+        )
+
+    with timer.stage('write'):
+        storage.save_team(team_data, season)
+        if export_json:
+            save_team_data(team_data, division_dir(team_info['division']))
+        journal.discard()
+
+    return team_data
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="MLB 데이터 단일 패스 파이프라인 (수집 → 보강 → 변환)")
+    add_scope_args(parser)
+    parser.add_argument("--base-url", default=MLB_API_BASE_URL, help="MLB Stats API 주소")
+    parser.add_argument("--rate", type=float, default=MLB_API_RATE_LIMIT, help="초당 최대 요청 수")
+    parser.add_argument("--workers", type=int, default=MLB_API_MAX_WORKERS, help="동시 요청 스레드 수")
+    parser.add_argument("--cache-ttl", type=float, default=MLB_API_CACHE_TTL, help="응답 캐시 유효 시간 (초)")
+    parser.add_argument("--offline", action="store_true", help="네트워크 없이 기록된 응답만 재생")
+    parser.add_argument("--fangraphs-season", type=int, default=FANGRAPHS_SEASON,
+                        help=f"FanGraphs 시즌 (기본: {FANGRAPHS_SEASON}, 로스터 --season과 별개)")
+    parser.add_argument("--full", action="store_true", help="변경 감지 없이 전체 재처리")
+    parser.add_argument("--allow-partial", action="store_true", help="일부 선수 수집에 실패해도 나머지로 저장")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    teams = selected_teams(args)
+    print(f"\nMLB Data Pipeline - {len(teams)} teams, {args.season} Season\n")
+
+    started = time.perf_counter()
+    timer = StageTimer()
+    storage = MLBStorage(args.db)
+
+    with timer.stage('fangraphs'):
+        fg_batters, fg_pitchers = load_fangraphs_data(season=args.fangraphs_season)
+        fg_batters, fg_pitchers = FanGraphsIndex(fg_batters), FanGraphsIndex(fg_pitchers)
+
+    api_client = MLBAPIClient(base_url=args.base_url, season=args.season, rate_limit=args.rate,
+                              pool_size=args.workers, cache=ResponseCache(CACHE_DIR, ttl=args.cache_ttl),
+                              offline=args.offline)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=args.workers) as player_pool, \
+            ThreadPoolExecutor(max_workers=min(len(teams), 8) or 1) as team_pool:
+        futures = {
+            team_pool.submit(process_team, team_id, team_info, api_client, player_pool, fg_batters, fg_pitchers,
+                             storage, args.season, timer, args.full, args.export_json, args.allow_partial): team_info
+            for team_id, team_info in teams.items()
+        }
+        for future in as_completed(futures):
+            try:
+                team_data = future.result()
+                results[team_data['team_id']] = team_data
+            except Exception as e:
+                print(f"Failed to process {futures[future]['name']}: {e}")
+
+    all_teams_data = [results[team_id] for team_id in teams if team_id in results]
+    elapsed = round(time.perf_counter() - started, 3)
+    summary, summary_path = save_summary(all_teams_data, DATA_DIR / "summaries" / str(args.season), {
+        "timings": {**timer.as_dict(), "total": elapsed},
+        "requests": dict(api_client.cache_stats)
+    }, season=args.season)
+
+    print(f"\nComplete: {summary['total_teams']} teams, {sum(t['total'] for t in summary['teams'])} players")
+    print("Stage timings (s, summed across teams): " +
+          ", ".join(f"{name} {seconds}" for name, seconds in summary['timings'].items()))
+    print(f"Stored in: {args.db}")
+    print(f"Summary: {summary_path}")
+
+    with timer.stage('artifact'):
+        build_roster_artifact(storage, args.season)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,36 +5,67 @@
 # MLB API 설정
 MLB_API_BASE_URL = "https://statsapi.mlb.com/api/v1"
 MLB_SEASON = 2025
+MLB_API_RATE_LIMIT = 10.0   # 초당 최대 요청 수
+MLB_API_MAX_WORKERS = 8     # 동시 요청 스레드 수
+MLB_API_CACHE_TTL = 6 * 3600  # 응답 캐시 유효 시간 (초), 이후 ETag/Last-Modified로 재검증
 
-# NL West 팀 ID
-NL_WEST_TEAMS = {
-    119: {
-        "name": "Los Angeles Dodgers",
-        "short_name": "dodgers",
-        "stadium": "Dodger Stadium"
-    },
-    135: {
-        "name": "San Diego Padres",
-        "short_name": "padres",
-        "stadium": "Petco Park"
-    },
-    109: {
-        "name": "Arizona Diamondbacks",
-        "short_name": "diamondbacks",
-        "stadium": "Chase Field"
-    },
-    137: {
-        "name": "San Francisco Giants",
-        "short_name": "giants",
-        "stadium": "Oracle Park"
-    },
-    115: {
-        "name": "Colorado Rockies",
-        "short_name": "rockies",
-        "stadium": "Coors Field"
-    }
+# FanGraphs 보강 기본 시즌 (로스터 --season과 별개, --fangraphs-season으로 변경)
+FANGRAPHS_SEASON = 2024
+
+# MLB 30개 팀 (리그/지구 포함)
+MLB_TEAMS = {
+    # AL East
+    110: {"name": "Baltimore Orioles", "short_name": "orioles", "stadium": "Oriole Park at Camden Yards", "league": "AL", "division": "AL East"},
+    111: {"name": "Boston Red Sox", "short_name": "redsox", "stadium": "Fenway Park", "league": "AL", "division": "AL East"},
+    147: {"name": "New York Yankees", "short_name": "yankees", "stadium": "Yankee Stadium", "league": "AL", "division": "AL East"},
+    139: {"name": "Tampa Bay Rays", "short_name": "rays", "stadium": "George M. Steinbrenner Field", "league": "AL", "division": "AL East"},
+    141: {"name": "Toronto Blue Jays", "short_name": "bluejays", "stadium": "Rogers Centre", "league": "AL", "division": "AL East"},
+    # AL Central
+    145: {"name": "Chicago White Sox", "short_name": "whitesox", "stadium": "Rate Field", "league": "AL", "division": "AL Central"},
+    114: {"name": "Cleveland Guardians", "short_name": "guardians", "stadium": "Progressive Field", "league": "AL", "division": "AL Central"},
+    116: {"name": "Detroit Tigers", "short_name": "tigers", "stadium": "Comerica Park", "league": "AL", "division": "AL Central"},
+    118: {"name": "Kansas City Royals", "short_name": "royals", "stadium": "Kauffman Stadium", "league": "AL", "division": "AL Central"},
+    142: {"name": "Minnesota Twins", "short_name": "twins", "stadium": "Target Field", "league": "AL", "division": "AL Central"},
+    # AL West
+    117: {"name": "Houston Astros", "short_name": "astros", "stadium": "Daikin Park", "league": "AL", "division": "AL West"},
+    108: {"name": "Los Angeles Angels", "short_name": "angels", "stadium": "Angel Stadium", "league": "AL", "division": "AL West"},
+    133: {"name": "Athletics", "short_name": "athletics", "stadium": "Sutter Health Park", "league": "AL", "division": "AL West"},
+    136: {"name": "Seattle Mariners", "short_name": "mariners", "stadium": "T-Mobile Park", "league": "AL", "division": "AL West"},
+    140: {"name": "Texas Rangers", "short_name": "rangers", "stadium": "Globe Life Field", "league": "AL", "division": "AL West"},
+    # NL East
+    144: {"name": "Atlanta Braves", "short_name": "braves", "stadium": "Truist Park", "league": "NL", "division": "NL East"},
+    146: {"name": "Miami Marlins", "short_name": "marlins", "stadium": "loanDepot park", "league": "NL", "division": "NL East"},
+    121: {"name": "New York Mets", "short_name": "mets", "stadium": "Citi Field", "league": "NL", "division": "NL East"},
+    143: {"name": "Philadelphia Phillies", "short_name": "phillies", "stadium": "Citizens Bank Park", "league": "NL", "division": "NL East"},
+    120: {"name": "Washington Nationals", "short_name": "nationals", "stadium": "Nationals Park", "league": "NL", "division": "NL East"},
+    # NL Central
+    112: {"name": "Chicago Cubs", "short_name": "cubs", "stadium": "Wrigley Field", "league": "NL", "division": "NL Central"},
+    113: {"name": "Cincinnati Reds", "short_name": "reds", "stadium": "Great American Ball Park", "league": "NL", "division": "NL Central"},
+    158: {"name": "Milwaukee Brewers", "short_name": "brewers", "stadium": "American Family Field", "league": "NL", "division": "NL Central"},
+    134: {"name": "Pittsburgh Pirates", "short_name": "pirates", "stadium": "PNC Park", "league": "NL", "division": "NL Central"},
+    138: {"name": "St. Louis Cardinals", "short_name": "cardinals", "stadium": "Busch Stadium", "league": "NL", "division": "NL Central"},
+    # NL West
+    119: {"name": "Los Angeles Dodgers", "short_name": "dodgers", "stadium": "Dodger Stadium", "league": "NL", "division": "NL West"},
+    135: {"name": "San Diego Padres", "short_name": "padres", "stadium": "Petco Park", "league": "NL", "division": "NL West"},
+    109: {"name": "Arizona Diamondbacks", "short_name": "diamondbacks", "stadium": "Chase Field", "league": "NL", "division": "NL West"},
+    137: {"name": "San Francisco Giants", "short_name": "giants", "stadium": "Oracle Park", "league": "NL", "division": "NL West"},
+    115: {"name": "Colorado Rockies", "short_name": "rockies", "stadium": "Coors Field", "league": "NL", "division": "NL West"},
 }
 
+MLB_DIVISIONS = ("AL East", "AL Central", "AL West", "NL East", "NL Central", "NL West")
+
+
+def select_teams(league=None, division=None):
+    """리그/지구로 팀 필터링 (둘 다 None이면 30개 팀 전체)"""
+    return {
+        team_id: info for team_id, info in MLB_TEAMS.items()
+        if (league is None or info["league"] == league) and (division is None or info["division"] == division)
+    }
+
+
+# NL West 팀 ID
+NL_WEST_TEAMS = select_teams(division="NL West")
+
 # 포지션 코드
 POSITION_CODES = {
     "P": "Pitcher",
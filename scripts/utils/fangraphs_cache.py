@@ -0,0 +1,115 @@
+"""
+pybaseball FanGraphs 리더보드 로컬 캐시 (Feather, 사용 컬럼만 저장)
+"""
+import json
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+
+from backend.app.file_io import atomic_path, write_json_atomic
+
+# 스키마가 바뀌면 올려서 기존 캐시 무효화
+FANGRAPHS_CACHE_VERSION = 1
+
+# 선수 식별용 컬럼
+KEY_COLUMNS = ('Name', 'IDfg', 'xMLBAMID', 'MLBAMID', 'key_mlbam')
+
+# enrich_batter / enrich_pitcher에서 읽는 컬럼
+BATTING_COLUMNS = ('WAR', 'wRC+', 'wOBA', 'ISO', 'BABIP', 'K%', 'BB%', 'wRC', 'Off', 'Def', 'BsR')
+PITCHING_COLUMNS = ('WAR', 'FIP', 'xFIP', 'SIERA', 'K/9', 'BB/9', 'K%', 'BB%', 'K-BB%',
+                    'WHIP', 'BABIP', 'LOB%', 'GB%', 'HR/9')
+
+STAT_COLUMNS = {'batting': BATTING_COLUMNS, 'pitching': PITCHING_COLUMNS}
+
+# 포스트시즌까지 끝났다고 보는 날 (이후에 받은 테이블은 더 바뀌지 않음)
+SEASON_END = (11, 1)
+
+
+def season_end(season: int) -> date:
+    return date(season, *SEASON_END)
+
+
+def _fetch(kind: str, season: int) -> pd.DataFrame:
+    """pybaseball로 리그 전체 테이블 다운로드 (qual=1: 최소 1타석/1이닝)"""
+    from pybaseball import batting_stats, pitching_stats
+
+    fetch = batting_stats if kind == 'batting' else pitching_stats
+    return fetch(season, qual=1)
+
+
+def project_columns(df: pd.DataFrame, kind: str) -> pd.DataFrame:
+    """식별 컬럼 + 사용하는 스탯 컬럼만 남김"""
+    wanted = KEY_COLUMNS + STAT_COLUMNS[kind]
+    return df[[c for c in wanted if c in df.columns]].reset_index(drop=True)
+
+
+class FanGraphsCache:
+    """
+    시즌/종류별 FanGraphs 테이블 캐시
+
+    - 시즌 종료 후에 받은 캐시는 만료되지 않고, 시즌 중에 받은 캐시는 max_age_hours 이후 다시 받음
+    - Feather(무압축)로 저장해 메모리 맵으로 로드
+    - fixture_dir가 있으면 네트워크 없이 그 디렉토리의 {kind}_{season}.feather/.csv만 사용
+    """
+
+    def __init__(self, cache_dir: Path, max_age_hours: float = 24, fixture_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir)
+        self.max_age_hours = max_age_hours
+        self.fixture_dir = Path(fixture_dir) if fixture_dir else None
+
+    def _paths(self, kind: str, season: int):
+        stem = f"{kind}_{season}_v{FANGRAPHS_CACHE_VERSION}"
+        return self.cache_dir / f"{stem}.feather", self.cache_dir / f"{stem}.json"
+
+    def _is_fresh(self, meta_path: Path, season: int) -> bool:
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if meta.get('version') != FANGRAPHS_CACHE_VERSION:
+            return False
+        fetched_at = meta.get('fetched_at', 0)
+        if datetime.fromtimestamp(fetched_at).date() >= season_end(season):
+            return True
+        return time.time() - fetched_at < self.max_age_hours * 3600
+
+    def _load_fixture(self, kind: str, season: int) -> pd.DataFrame:
+        feather_path = self.fixture_dir / f"{kind}_{season}.feather"
+        if feather_path.exists():
+            df = feather.read_table(feather_path, memory_map=True).to_pandas()
+        else:
+            df = pd.read_csv(self.fixture_dir / f"{kind}_{season}.csv")
+        return project_columns(df, kind)
+
+    def _write(self, df: pd.DataFrame, kind: str, season: int):
+        data_path, meta_path = self._paths(kind, season)
+        with atomic_path(data_path) as tmp_path:
+            feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), tmp_path, compression='uncompressed')
+
+        write_json_atomic(meta_path, {
+            'version': FANGRAPHS_CACHE_VERSION,
+            'kind': kind,
+            'season': season,
+            'rows': len(df),
+            'columns': list(df.columns),
+            'fetched_at': time.time()
+        }, indent=None)
+
+    def load(self, kind: str, season: int) -> pd.DataFrame:
+        """kind: 'batting' 또는 'pitching'"""
+        if self.fixture_dir:
+            return self._load_fixture(kind, season)
+
+        data_path, meta_path = self._paths(kind, season)
+        if data_path.exists() and self._is_fresh(meta_path, season):
+            return feather.read_table(data_path, memory_map=True).to_pandas()
+
+        df = project_columns(_fetch(kind, season), kind)
+        self._write(df, kind, season)
+        return df
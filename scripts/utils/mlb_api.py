@@ -1,17 +1,164 @@
 """
 MLB API 헬퍼 함수
 """
+import hashlib
+import json
+import threading
+import time
 import requests
-from typing import Dict, List, Optional
-from .constants import MLB_API_BASE_URL, MLB_SEASON
+from collections import Counter
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlencode
+from backend.app.file_io import write_json_atomic
+from .constants import (
+    MLB_API_BASE_URL, MLB_SEASON, MLB_API_RATE_LIMIT, MLB_API_MAX_WORKERS, MLB_API_CACHE_TTL
+)
+from .rate_limit import TokenBucket
+
+
+class OfflineCacheMiss(Exception):
+    """오프라인 모드에서 기록된 응답이 없는 요청 (조회 메서드는 삼키지 않고 그대로 올려 보냄)"""
+
+
+class ResponseCache:
+    """URL+파라미터를 키로 하는 디스크 응답 캐시 (TTL, ETag/Last-Modified 재검증 정보 보관)"""
+
+    def __init__(self, cache_dir: Path, ttl: float = MLB_API_CACHE_TTL):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha256(f"{url}?{query}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def load(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, entry: Dict):
+        write_json_atomic(self._path(key), entry, indent=None)
+
+    def is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry.get('fetched_at', 0) < self.ttl
 
 
 class MLBAPIClient:
-    """MLB Stats API 클라이언트"""
+    """MLB Stats API 클라이언트 (스레드 간 공유 가능)"""
 
-    def __init__(self, base_url: str = MLB_API_BASE_URL, season: int = MLB_SEASON):
+    def __init__(self, base_url: str = MLB_API_BASE_URL, season: int = MLB_SEASON,
+                 rate_limit: float = MLB_API_RATE_LIMIT, pool_size: int = MLB_API_MAX_WORKERS,
+                 cache: Optional[ResponseCache] = None, offline: bool = False):
         self.base_url = base_url
         self.season = season
+        self.rate_limiter = TokenBucket(rate_limit)
+        self.cache = cache
+        self.offline = offline
+        self.cache_stats = Counter()
+        self._stats_lock = threading.Lock()
+
+        if offline and cache is None:
+            raise ValueError("오프라인 모드는 응답 캐시가 필요합니다")
+
+        # 커넥션 풀을 공유하는 세션
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _count(self, kind: str):
+        with self._stats_lock:
+            self.cache_stats[kind] += 1
+
+    def _get(self, url: str, params: Optional[Dict] = None) -> Dict:
+        """캐시를 우선 확인하고, 필요할 때만 속도 제한을 지키며 GET 요청 후 JSON 반환"""
+        if self.cache is None:
+            self.rate_limiter.acquire()
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            self._count('fetched')
+            return response.json()
+
+        key = self.cache.make_key(url, params)
+        entry = self.cache.load(key)
+
+        if self.offline:
+            if entry is None:
+                raise OfflineCacheMiss(f"{url} {params or ''}")
+            self._count('replayed')
+            return entry['body']
+
+        if entry is not None and self.cache.is_fresh(entry):
+            self._count('fresh')
+            return entry['body']
+
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        self.rate_limiter.acquire()
+        response = self.session.get(url, params=params, headers=headers, timeout=10)
+
+        if response.status_code == 304 and entry is not None:
+            entry['fetched_at'] = time.time()
+            self.cache.store(key, entry)
+            self._count('revalidated')
+            return entry['body']
+
+        response.raise_for_status()
+        body = response.json()
+        self.cache.store(key, {
+            'url': url,
+            'params': params or {},
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+            'body': body
+        })
+        self._count('fetched')
+        return body
+
+    @staticmethod
+    def _parse_person(person: Dict, player_id: int = None) -> Dict:
+        """/people 응답의 person 객체를 선수 기본 정보로 변환"""
+        return {
+            "id": player_id or person['id'],
+            "name": person['fullName'],
+            "position": person.get('primaryPosition', {}).get('abbreviation', 'N/A'),
+            "bat_side": person.get('batSide', {}).get('code', 'R'),
+            "pitch_hand": person.get('pitchHand', {}).get('code', 'R'),
+            "birth_date": person.get('birthDate', ''),
+            "height": person.get('height', ''),
+            "weight": person.get('weight', ''),
+            "is_pitcher": person.get('primaryPosition', {}).get('abbreviation') == 'P'
+        }
+
+    @staticmethod
+    def _extract_season_stats(person: Dict, is_pitcher: bool) -> Dict:
+        """hydrate된 person의 stats 목록에서 해당 그룹 시즌 스탯 추출"""
+        stat_group = 'pitching' if is_pitcher else 'hitting'
+        for entry in person.get('stats', []):
+            if entry.get('group', {}).get('displayName') != stat_group:
+                continue
+            splits = entry.get('splits', [])
+            if splits:
+                return splits[0]['stat']
+        return {}
+
+    def _stats_hydration(self) -> str:
+        return f"stats(type=season,season={self.season},group=[hitting,pitching])"
 
     def get_team_roster(self, team_id: int) -> List[Dict]:
         """
@@ -30,9 +177,7 @@ class MLBAPIClient:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(url, params)
 
             roster = []
             for player in data.get('roster', []):
@@ -44,7 +189,7 @@ class MLBAPIClient:
                 })
 
             return roster
-        except Exception as e:
+        except (requests.RequestException, ValueError, KeyError) as e:
             print(f"Error fetching roster for team {team_id}: {e}")
             return []
 
@@ -61,26 +206,13 @@ class MLBAPIClient:
         url = f"{self.base_url}/people/{player_id}"
 
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(url)
 
             if not data.get('people'):
                 return None
 
-            player = data['people'][0]
-            return {
-                "id": player_id,
-                "name": player['fullName'],
-                "position": player.get('primaryPosition', {}).get('abbreviation', 'N/A'),
-                "bat_side": player.get('batSide', {}).get('code', 'R'),
-                "pitch_hand": player.get('pitchHand', {}).get('code', 'R'),
-                "birth_date": player.get('birthDate', ''),
-                "height": player.get('height', ''),
-                "weight": player.get('weight', ''),
-                "is_pitcher": player.get('primaryPosition', {}).get('abbreviation') == 'P'
-            }
-        except Exception as e:
+            return self._parse_person(data['people'][0], player_id)
+        except (requests.RequestException, ValueError, KeyError) as e:
             print(f"Error fetching player info for {player_id}: {e}")
             return None
 
@@ -105,9 +237,7 @@ class MLBAPIClient:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(url, params)
 
             if not data.get('stats') or len(data['stats']) == 0:
                 return None
@@ -117,10 +247,122 @@ class MLBAPIClient:
                 return None
 
             return splits[0]['stat']
-        except Exception as e:
+        except (requests.RequestException, ValueError, KeyError) as e:
             print(f"Error fetching stats for player {player_id}: {e}")
             return None
 
+    def get_team_players(self, team_id: int) -> Optional[List[Dict]]:
+        """
+        로스터 + 선수 정보 + 시즌 스탯을 hydrate 요청 한 번으로 가져오기
+
+        Args:
+            team_id: MLB 팀 ID
+
+        Returns:
+            get_complete_player_data와 같은 형식의 선수 리스트 (요청 실패 시 None)
+        """
+        url = f"{self.base_url}/teams/{team_id}/roster"
+        params = {
+            "rosterType": "active",
+            "season": self.season,
+            "hydrate": f"person({self._stats_hydration()})"
+        }
+
+        try:
+            data = self._get(url, params)
+        except (requests.RequestException, ValueError) as e:
+            print(f"Error fetching hydrated roster for team {team_id}: {e}")
+            return None
+
+        players = []
+        for entry in data.get('roster', []):
+            person = entry['person']
+            if 'fullName' not in person or 'primaryPosition' not in person:
+                return None  # hydrate 미지원 응답
+
+            player_info = self._parse_person(person)
+            players.append({
+                **player_info,
+                "stats_2024": self._extract_season_stats(person, player_info['is_pitcher'])
+            })
+
+        return players
+
+    def get_players_bulk(self, player_ids: List[int], batch_size: int = 50) -> Dict[int, Dict]:
+        """
+        /people?personIds=... 배치 요청으로 여러 선수의 정보와 스탯 가져오기
+
+        Args:
+            player_ids: MLB 선수 ID 리스트
+            batch_size: 요청당 선수 수
+
+        Returns:
+            선수 ID -> 완전한 선수 데이터
+        """
+        url = f"{self.base_url}/people"
+        players = {}
+
+        for start in range(0, len(player_ids), batch_size):
+            batch = player_ids[start:start + batch_size]
+            params = {
+                "personIds": ",".join(str(pid) for pid in batch),
+                "hydrate": self._stats_hydration()
+            }
+
+            try:
+                data = self._get(url, params)
+            except (requests.RequestException, ValueError) as e:
+                print(f"Error fetching people batch {batch[0]}...: {e}")
+                continue
+
+            for person in data.get('people', []):
+                player_info = self._parse_person(person)
+                players[player_info['id']] = {
+                    **player_info,
+                    "stats_2024": self._extract_season_stats(person, player_info['is_pitcher'])
+                }
+
+        return players
+
+    def get_season_stats_bulk(self, pitcher_flags: Dict[int, bool], stat_keys: Sequence[str] = (),
+                              batch_size: int = 50) -> Dict[int, Dict]:
+        """
+        /people 배치 요청으로 시즌 스탯만 가져오기 (변경 감지용)
+
+        Args:
+            pitcher_flags: 선수 ID -> 투수 여부 (스탯 그룹 선택)
+            stat_keys: 응답에 남길 스탯 항목 (fields 파라미터로 축소, 비우면 전체)
+            batch_size: 요청당 선수 수
+
+        Returns:
+            선수 ID -> 시즌 스탯 (요청 실패한 선수는 빠짐)
+        """
+        url = f"{self.base_url}/people"
+        player_ids = list(pitcher_flags)
+        stats = {}
+
+        for start in range(0, len(player_ids), batch_size):
+            batch = player_ids[start:start + batch_size]
+            params = {
+                "personIds": ",".join(str(pid) for pid in batch),
+                "hydrate": self._stats_hydration()
+            }
+            if stat_keys:
+                params["fields"] = ",".join(("people", "id", "stats", "group", "displayName", "splits", "stat")
+                                            + tuple(stat_keys))
+
+            try:
+                data = self._get(url, params)
+            except (requests.RequestException, ValueError) as e:
+                print(f"Error fetching stats batch {batch[0]}...: {e}")
+                continue
+
+            for person in data.get('people', []):
+                if person.get('id') in pitcher_flags:
+                    stats[person['id']] = self._extract_season_stats(person, pitcher_flags[person['id']])
+
+        return stats
+
     def get_complete_player_data(self, player_id: int) -> Optional[Dict]:
         """
         선수의 모든 정보 한번에 가져오기
@@ -0,0 +1,30 @@
+"""
+스레드 안전 토큰 버킷 속도 제한기
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """초당 rate개 토큰을 채우고, 최대 capacity개까지 버스트 허용"""
+
+    def __init__(self, rate: float, capacity: int = None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: int = 1):
+        """토큰을 먼저 예약(잔량은 음수가 될 수 있음)하고 부족분만큼 대기"""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
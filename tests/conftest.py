@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# backend / scripts 패키지를 프로젝트 루트 기준으로 import
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,32 @@
+"""PlayerCounter.merge - 서로 다른 ID / 겹치는 ID 합치기"""
+from backend.app.game_engine.aggregation import COUNT_COLUMNS, PlayerCounter
+
+
+def test_merge_disjoint_ids():
+    a, b = PlayerCounter(), PlayerCounter()
+    a.add_many([1], [0], [0], [4])
+    b.add_many([2], [3], [1], [5])
+    a.merge(b)
+    assert len(a) == 2
+    assert a.get(1)['single'] == 1 and a.get(1)['pitches'] == 4
+    assert a.get(2)['homerun'] == 1 and a.get(2)['runs'] == 1 and a.get(2)['pitches'] == 5
+
+
+def test_merge_overlapping_ids():
+    a, b = PlayerCounter(), PlayerCounter()
+    a.add_many([1, 2], [0, 4], [0, 0], [3, 5])
+    b.add_many([3, 1], [5, 0], [0, 1], [6, 2])
+    total = a.counts.sum() + b.counts.sum()
+    a.merge(b)
+    assert len(a) == 3
+    assert a.get(1)['single'] == 2 and a.get(1)['runs'] == 1 and a.get(1)['pitches'] == 5
+    assert a.get(2)['strikeout'] == 1
+    assert a.get(3)['walk'] == 1 and a.get(3)['pitches'] == 6
+    assert a.counts.sum() == total
+
+
+def test_merge_into_empty():
+    a, b = PlayerCounter(), PlayerCounter()
+    b.add_many([7], [1], [2], [4])
+    a.merge(b)
+    assert a.get(7) == dict(zip(COUNT_COLUMNS, b.counts[0].tolist()))
@@ -0,0 +1,44 @@
+"""진루 테이블 - 확률 합, 주자 보존, 라이브 경기의 주자별 스피드 구간"""
+import numpy as np
+
+from backend.app.game_engine.baserunning import (
+    AVERAGE_BUCKET, INNING_OVER, N_STATES, TRANSITIONS, lead_runner_bucket
+)
+from backend.app.game_engine.run_expectancy import OUTCOMES
+
+SINGLE = OUTCOMES.index('single')
+
+
+def test_lead_runner_sets_the_bucket():
+    assert lead_runner_bucket([None, None, None], 75) == 2
+    assert lead_runner_bucket([30, None, None], 75) == 0
+    assert lead_runner_bucket([30, 65, None], 20) == 2
+    assert lead_runner_bucket([70, 50, 25], 70) == 0
+
+
+def test_runner_speed_changes_scoring_from_second():
+    # 2루 주자, 0아웃에서 단타 - 빠른 주자일수록 홈까지 들어올 확률이 높음
+    on_second = 0b010
+    scores = [TRANSITIONS[speed, AVERAGE_BUCKET, 1, on_second, SINGLE].sum() for speed in range(3)]
+    assert scores[0] < scores[1] < scores[2]
+
+
+def test_each_row_is_a_distribution():
+    rows = TRANSITIONS.sum(axis=(2, 5))  # 득점, 다음 상태로 합산 → [스피드, 수비, 상태, 결과]
+    np.testing.assert_allclose(rows, 1.0, atol=1e-12)
+    assert TRANSITIONS.min() >= 0
+
+
+def test_runners_are_conserved():
+    # 타석 전 주자 + 타자 = 타석 후 주자 + 득점 + 늘어난 아웃 (이닝 종료는 남은 주자를 알 수 없어 상한만)
+    speed, defense, runs, state, outcome, next_state = np.nonzero(TRANSITIONS)
+    before = np.array([bin(s % 8).count('1') for s in range(N_STATES)])[state] + 1
+    over = next_state == INNING_OVER
+    after = np.array([bin(s % 8).count('1') for s in range(N_STATES)] + [0])[next_state]
+    outs = np.where(over, 3, next_state // 8) - state // 8
+    assert np.all((before == after + runs + outs)[~over])
+    assert np.all((before >= runs + outs)[over])
+    # 아웃은 줄지 않음, 안타/볼넷은 아웃을 늘리지 않음
+    assert np.all(outs >= 0)
+    safe = np.isin(outcome, [OUTCOMES.index(o) for o in ('single', 'double', 'triple', 'homerun', 'walk')])
+    assert np.all(outs[safe] == 0)
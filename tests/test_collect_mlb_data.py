@@ -0,0 +1,80 @@
+"""fetch_team_players - 변경 감지 후 바뀐 선수만 배치 재수집, 두 경로 모두 저널 기록"""
+from concurrent.futures import ThreadPoolExecutor
+
+from scripts.data_collection.checkpoint import CollectionJournal
+from scripts.data_collection.collect_mlb_data import fetch_team_players
+
+TEAM = {'short_name': 'testers'}
+
+
+def player(pid, games, is_pitcher=False):
+    key = 'battersFaced' if is_pitcher else 'plateAppearances'
+    return {'id': pid, 'name': f"P{pid}", 'is_pitcher': is_pitcher, 'stats_2024': {'gamesPlayed': games, key: games * 4}}
+
+
+class FakeClient:
+    def __init__(self, current, hydrated=False):
+        self.current = current
+        self.hydrated = hydrated
+        self.stats_requests = []
+        self.bulk_requests = []
+
+    def get_team_players(self, team_id):
+        return list(self.current.values()) if self.hydrated else None
+
+    def get_team_roster(self, team_id):
+        return [{'id': pid, 'name': p['name']} for pid, p in self.current.items()]
+
+    def get_season_stats_bulk(self, pitcher_flags, stat_keys=()):
+        self.stats_requests.append(sorted(pitcher_flags))
+        return {pid: self.current[pid]['stats_2024'] for pid in pitcher_flags}
+
+    def get_players_bulk(self, player_ids):
+        self.bulk_requests.append(sorted(player_ids))
+        return {pid: self.current[pid] for pid in player_ids}
+
+
+def test_bulk_fetch_skips_unchanged_players(tmp_path):
+    stored = {1: player(1, 10), 2: player(2, 10), 3: player(3, 5, is_pitcher=True)}
+    stored[1]['ratings_20_80'] = {'overall': 55}
+    current = {1: player(1, 10), 2: player(2, 11), 3: player(3, 5, is_pitcher=True), 4: player(4, 1)}
+    client = FakeClient(current)
+    journal = CollectionJournal(tmp_path / 'team.jsonl')
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        players, errors = fetch_team_players(1, TEAM, client, executor, stored, journal)
+
+    assert errors == []
+    assert client.stats_requests == [[1, 2, 3]]
+    assert client.bulk_requests == [[2, 4]]
+    by_id = {p['id']: p for p in players}
+    assert by_id[1] is stored[1] and by_id[3] is stored[3]
+    assert by_id[2]['stats_2024']['gamesPlayed'] == 11
+    assert sorted(journal.load()) == [1, 2, 3, 4]
+
+
+def test_resume_skips_journaled_players(tmp_path):
+    current = {1: player(1, 10), 2: player(2, 10)}
+    journal = CollectionJournal(tmp_path / 'team.jsonl')
+    journal.append(current[1])
+    client = FakeClient(current)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        players, _ = fetch_team_players(1, TEAM, client, executor, {}, journal)
+
+    assert client.stats_requests == [] and client.bulk_requests == [[2]]
+    assert [p['id'] for p in players] == [1, 2]
+
+
+def test_hydrated_roster_is_journaled(tmp_path):
+    current = {1: player(1, 10), 2: player(2, 3, is_pitcher=True)}
+    journal = CollectionJournal(tmp_path / 'team.jsonl')
+    client = FakeClient(current, hydrated=True)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        players, errors = fetch_team_players(1, TEAM, client, executor, {}, journal)
+        fetch_team_players(1, TEAM, client, executor, {}, journal)
+
+    assert errors == [] and len(players) == 2
+    assert journal.load() == current
+    assert len(journal.path.read_text(encoding='utf-8').splitlines()) == 2  # 같은 레코드는 다시 쓰지 않음
@@ -0,0 +1,78 @@
+"""벡터 변환(convert_*_frame)과 선수별 변환(convert_*_to_20_80) 일치 - np.select 경계값 전부"""
+import itertools
+
+from scripts.data_collection.convert_stats_20_80 import (
+    BATTER_RATINGS, PITCHER_RATINGS, batters_to_frame, check_parity, convert_batter_to_20_80,
+    convert_batters_frame, convert_pitcher_to_20_80, convert_pitchers_frame, pitchers_to_frame
+)
+
+HR_EDGES = (0, 9, 10, 14, 15, 19, 20, 24, 25, 29, 30, 39, 40, 49, 50, 62)
+DEF_EDGES = (-12.0, -5.01, -5.0, -2.01, -2.0, 1.99, 2.0, 4.99, 5.0, 9.99, 10.0, 15.0)
+PA_EDGES = (0, 199, 200, 650)
+POSITIONS = ('SS', 'CF', 'C', '1B', 'DH', 'TWP', 'LF', '2B')
+
+IP_EDGES = ('0', '29.2', '30.0', '49.2', '50.0', '69.2', '70.0', '99.2', '100.0', '119.2', '120.0',
+            '139.2', '140.0', '159.2', '160.0', '179.2', '180.0', '210.1')
+FIP_EDGES = (1.8, 2.5, 2.51, 3.0, 3.01, 3.5, 3.51, 4.0, 4.01, 4.5, 4.51, 5.0, 5.01, 5.5, 5.51, 7.0)
+
+
+def batter(pa, hr, defense, position, k=0.23, bb=0.085, iso=0.150, bsr=0.0, sb=0, avg='.250'):
+    return {
+        'name': f"b-{pa}-{hr}-{defense}-{position}-{k}",
+        'position': position,
+        'stats_2024': {'plateAppearances': pa, 'homeRuns': hr, 'stolenBases': sb, 'avg': avg},
+        'fangraphs_stats': {'K%': k, 'BB%': bb, 'ISO': iso, 'BsR': bsr, 'Def': defense}
+    }
+
+
+def pitcher(ip, fip, k=0.22, bb=0.085, gb=0.44):
+    return {
+        'name': f"p-{ip}-{fip}-{k}",
+        'stats_2024': {'inningsPitched': ip},
+        'fangraphs_stats': {'K%': k, 'BB%': bb, 'GB%': gb, 'FIP': fip}
+    }
+
+
+def test_batter_thresholds_match_per_player():
+    batters = [batter(pa, hr, d, pos) for pa, hr, d, pos in itertools.product(PA_EDGES, HR_EDGES, DEF_EDGES, POSITIONS)]
+    # 범위 밖으로 잘리는 극단값 (clamp 20/80)
+    batters += [batter(600, 55, 15.0, 'SS', k=0.05, bb=0.25, iso=0.400, bsr=8.0, sb=60, avg='.350'),
+                batter(600, 0, -15.0, 'TWP', k=0.45, bb=0.01, iso=0.020, bsr=-8.0, avg='.150')]
+    assert check_parity(batters, []) == []
+
+    ratings = convert_batters_frame(batters_to_frame(batters)).to_dict('records')
+    for player, vectorized in zip(batters, ratings):
+        assert vectorized == convert_batter_to_20_80(player), player['name']
+
+
+def test_pitcher_thresholds_match_per_player():
+    pitchers = [pitcher(ip, fip) for ip, fip in itertools.product(IP_EDGES, FIP_EDGES)]
+    pitchers += [pitcher('200.0', 1.5, k=0.40, bb=0.02, gb=0.65), pitcher('45.0', 8.0, k=0.08, bb=0.20, gb=0.20)]
+    assert check_parity([], pitchers) == []
+
+    ratings = convert_pitchers_frame(pitchers_to_frame(pitchers)).to_dict('records')
+    for player, vectorized in zip(pitchers, ratings):
+        assert vectorized == convert_pitcher_to_20_80(player), player['name']
+
+
+def test_small_samples_fall_back_to_40():
+    batters = [batter(199, 50, 10.0, 'SS'), batter(200, 50, 10.0, 'SS')]
+    short, full = convert_batters_frame(batters_to_frame(batters)).to_dict('records')
+    assert short == dict.fromkeys(BATTER_RATINGS, 40)
+    assert full['defense'] == 75 and full != short
+
+    # 0타수 콜업 선수 - MLB API가 avg ".---"를 돌려줌
+    call_up = batter(0, 0, 0.0, 'LF', avg='.---')
+    assert check_parity([call_up, batters[1]], []) == []
+    assert convert_batters_frame(batters_to_frame([call_up])).to_dict('records') == [dict.fromkeys(BATTER_RATINGS, 40)]
+
+    pitchers = [pitcher('29.2', 2.0), pitcher('30.0', 2.0)]
+    short, full = convert_pitchers_frame(pitchers_to_frame(pitchers)).to_dict('records')
+    assert short == dict.fromkeys(PITCHER_RATINGS, 40)
+    assert full['pitchability'] == 75 and full['stamina'] == 45
+
+
+def test_position_adjustments():
+    positions = ('SS', '1B', 'TWP', 'LF')
+    ratings = convert_batters_frame(batters_to_frame([batter(400, 20, 0.0, pos) for pos in positions]))
+    assert dict(zip(positions, ratings['defense'])) == {'SS': 55, '1B': 47, 'TWP': 47, 'LF': 50}
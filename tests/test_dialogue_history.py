@@ -0,0 +1,50 @@
+"""DialogueHistory - 토큰 예산과 요약 캐시"""
+from backend.app.ai import dialogue_history
+from backend.app.ai.dialogue_history import DialogueHistory, estimate_tokens
+
+
+def turns(n):
+    return [{'speaker': '포수' if i % 2 else '투수', 'message': f"{i}번째 발화입니다. 뒤 문장은 요약에서 빠짐."}
+            for i in range(n)]
+
+
+def body_tokens(context):
+    lines = [line for line in context.split('\n') if line and not line.startswith('[')]
+    return sum(estimate_tokens(line) for line in lines)
+
+
+def test_short_dialogue_is_verbatim():
+    dialogue = turns(3)
+    context = DialogueHistory(max_tokens=500).build_context(dialogue)
+    assert context == "\n".join(f"{t['speaker']}: {t['message']}" for t in dialogue)
+
+
+def test_context_stays_within_budget():
+    for max_tokens in (20, 60, 120, 300):
+        history = DialogueHistory(max_tokens=max_tokens, keep_last=4)
+        assert body_tokens(history.build_context(turns(30))) <= max_tokens
+
+
+def test_older_turns_are_condensed_and_recent_kept():
+    context = DialogueHistory(max_tokens=1000, keep_last=2).build_context(turns(6))
+    summary, recent = context.split("[최근 대화]")
+    assert "[이전 대화 요약]" in summary
+    assert "0번째 발화입니다." in summary and "뒤 문장" not in summary
+    assert "5번째 발화입니다. 뒤 문장은 요약에서 빠짐." in recent
+
+
+def test_summary_is_cached_between_calls(monkeypatch):
+    calls = []
+    condense = dialogue_history._condense_turn
+    monkeypatch.setattr(dialogue_history, '_condense_turn', lambda turn, n: calls.append(turn) or condense(turn, n))
+
+    history = DialogueHistory(max_tokens=1000, keep_last=2)
+    dialogue = turns(6)
+    history.build_context(dialogue)
+    assert len(calls) == 4
+
+    history.build_context(dialogue + turns(8)[6:])
+    assert len(calls) == 6  # 새로 밀려난 두 발화만 요약
+
+    history.build_context(turns(3))  # 더 짧은 새 대화면 캐시를 버림
+    assert len(calls) == 7
@@ -0,0 +1,63 @@
+"""컬럼형 이벤트 로그 - 이벤트 왕복, 갈래(fork)의 copy-on-write, Arrow 내보내기"""
+import pyarrow as pa
+
+from backend.app.game_engine.event_log import FLUSH_ROWS, EventLog
+from backend.app.game_engine.events import InningEnd, PitcherChange, PlateAppearance
+
+
+def sample_events(count: int, start: int = 0):
+    events = []
+    for i in range(start, start + count):
+        if i % 7 == 6:
+            events.append(InningEnd(i // 7 + 1, bool(i % 2), i, i // 2))
+        elif i % 7 == 3:
+            events.append(PitcherChange(i // 7 + 1, True, 'away', 500 + i))
+        else:
+            events.append(PlateAppearance(i // 7 + 1, False, 100 + i, 200, 'single' if i % 2 else 'strikeout',
+                                          i % 2, 0, 1 if i % 2 else 8, 3, 'patient' if i % 5 == 0 else None,
+                                          'BSX'[:1 + i % 3]))
+    return events
+
+
+def test_round_trip_across_flushes():
+    events = sample_events(FLUSH_ROWS * 2 + 5)
+    log = EventLog(capacity=4)
+    log.extend(events)
+    assert len(log) == len(events)
+    assert list(log) == events
+    assert log[-1] == events[-1] and log[10:13] == events[10:13]
+
+
+def test_fork_leaves_parent_unchanged():
+    events = sample_events(20)
+    parent = EventLog()
+    parent.extend(events)
+
+    child = parent.fork()
+    child.extend(sample_events(FLUSH_ROWS + 3, start=20))
+    child.truncate(5)
+    child.append(events[-1])
+    assert list(parent) == events
+    assert list(child) == events[:5] + [events[-1]]
+
+    # 부모 쪽 변경도 갈래에 새지 않음
+    parent.truncate(2)
+    parent.extend(sample_events(3, start=100))
+    assert list(child) == events[:5] + [events[-1]]
+    assert list(parent) == events[:2] + sample_events(3, start=100)
+
+
+def test_to_arrow():
+    events = sample_events(30)
+    log = EventLog()
+    log.extend(events)
+    table = log.to_arrow()
+    assert table.num_rows == len(events)
+    assert pa.types.is_dictionary(table.schema.field('outcome').type)
+    rows = table.to_pylist()
+    for event, row in zip(events, rows):
+        if isinstance(event, PlateAppearance):
+            assert (row['kind'], row['outcome'], row['strategy'], row['sequence']) == \
+                ('plate_appearance', event.outcome, event.strategy, event.sequence)
+        else:
+            assert row['outcome'] is None and row['sequence'] == ''
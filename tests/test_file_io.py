@@ -0,0 +1,55 @@
+"""원자적 쓰기 - 일반 파일 권한, 실패 시 기존 파일 유지, 서비스 계층과 독립"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from backend.app.file_io import atomic_path, write_bytes_atomic, write_json_atomic
+
+
+@pytest.fixture
+def umask_027():
+    previous = os.umask(0o027)
+    yield 0o027
+    os.umask(previous)
+
+
+def test_files_get_umask_permissions(tmp_path, umask_027):
+    write_json_atomic(tmp_path / 'a.json', {'x': 1})
+    write_bytes_atomic(tmp_path / 'sub' / 'b.bin', b'data')
+    for path in (tmp_path / 'a.json', tmp_path / 'sub' / 'b.bin'):
+        assert os.stat(path).st_mode & 0o777 == 0o666 & ~umask_027
+    assert json.loads((tmp_path / 'a.json').read_text(encoding='utf-8')) == {'x': 1}
+
+
+def test_failed_write_keeps_existing_file(tmp_path):
+    target = tmp_path / 'team.json'
+    write_json_atomic(target, {'version': 1})
+
+    with pytest.raises(TypeError):
+        write_json_atomic(target, {'version': 2, 'bad': object()})
+    with pytest.raises(RuntimeError):
+        with atomic_path(target) as tmp:
+            with open(tmp, 'w') as f:
+                f.write('partial')
+            raise RuntimeError('interrupted')
+
+    assert json.loads(target.read_text(encoding='utf-8')) == {'version': 1}
+    assert os.listdir(tmp_path) == ['team.json']
+
+
+def test_replace_overwrites(tmp_path):
+    target = tmp_path / 'artifact.bin'
+    write_bytes_atomic(target, b'old')
+    write_bytes_atomic(target, b'new')
+    assert target.read_bytes() == b'new'
+    assert os.listdir(tmp_path) == ['artifact.bin']
+
+
+def test_import_does_not_load_services():
+    code = "import sys, backend.app.file_io; print('backend.app.services' in sys.modules, 'msgpack' in sys.modules)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ['False', 'False']
@@ -0,0 +1,113 @@
+"""경기 종료 규칙 - 라이브 GameState.is_game_over와 HeadlessGame.is_terminal 일치 (연장, 끝내기)"""
+import random
+
+from backend.app.game_engine.game_state import GameState
+from backend.app.game_engine.headless import HeadlessGame, state_from_game
+from backend.app.game_engine.markov import NEXT_STATE, RUNS
+from backend.app.game_engine.run_expectancy import OUTCOMES
+
+HOMERUN, STRIKEOUT = OUTCOMES.index('homerun'), OUTCOMES.index('strikeout')
+
+
+class UniformSimulator:
+    def outcome_probabilities(self, batter, pitcher, state, strategy=None):
+        return dict.fromkeys(OUTCOMES, 1.0)
+
+
+class ScriptedRng:
+    """HeadlessGame이 타석마다 뽑는 (결과, 투구수) 난수를 지정"""
+
+    def __init__(self):
+        self.values = []
+
+    def random(self):
+        return self.values.pop(0)
+
+
+class PairedGame:
+    """같은 타석 결과를 GameState(앱 진행 방식)와 SimState에 동시에 적용"""
+
+    def __init__(self):
+        self.game = GameState('Away', 'Home')
+        self.rng = ScriptedRng()
+        self.model = HeadlessGame(UniformSimulator(), range(9), range(9), rng=self.rng)
+        self.state = state_from_game(self.game, 0, 0, 1, 2, (), ())
+
+    def play(self, outcome: int):
+        self.rng.values = [(outcome + 0.5) / len(OUTCOMES), 0.0]
+        self.state = self.model.play(self.state)
+
+        game = self.game
+        next_state, runs = int(NEXT_STATE[game.base_out_state][outcome]), int(RUNS[game.base_out_state][outcome])
+        outs, bases = divmod(next_state, 8)
+        game.apply_transition('batter', bases, outs, runs)
+        if game.outs >= 3:
+            game.end_half_inning()
+
+        state = self.state
+        assert (game.inning, game.is_bottom, game.home_score, game.away_score) == \
+            (state.inning, state.is_bottom, state.home_score, state.away_score)
+        assert game.is_game_over() == self.model.is_terminal(state)
+
+    def finish_half(self):
+        for _ in range(3):
+            self.play(STRIKEOUT)
+
+
+def test_random_games_agree():
+    rnd = random.Random(7)
+    endings = set()
+    for _ in range(400):
+        paired = PairedGame()
+        while not paired.game.is_game_over():
+            batting_home = paired.game.is_bottom
+            paired.play(rnd.choice((STRIKEOUT,) * 6 + tuple(range(len(OUTCOMES)))))
+        game = paired.game
+        assert game.home_score != game.away_score
+        last_inning = game.inning - 1 if game.final else game.inning
+        endings.add('extra' if last_inning > 9 else 'regulation')
+        if batting_home and not game.final:
+            endings.add('walk-off')
+    assert endings == {'extra', 'regulation', 'walk-off'}
+
+
+def test_tie_after_ninth_goes_to_extra_innings():
+    paired = PairedGame()
+    while paired.game.inning < 10:
+        paired.finish_half()
+    assert (paired.game.inning, paired.game.is_bottom) == (10, False)
+    assert not paired.game.is_game_over()
+
+    # 10회초 선두타자 홈런 - 0아웃 주자 없음이지만 이닝이 끝나지 않았으므로 계속
+    paired.play(HOMERUN)
+    assert not paired.game.is_game_over()
+    paired.finish_half()
+    paired.finish_half()
+    assert paired.game.is_game_over() and paired.game.away_score == 1
+
+
+def test_walk_off_and_home_lead_after_top_of_ninth():
+    paired = PairedGame()
+    while (paired.game.inning, paired.game.is_bottom) != (9, True):
+        paired.finish_half()
+    paired.play(HOMERUN)
+    assert paired.game.is_game_over() and paired.game.outs == 0
+
+    paired = PairedGame()
+    paired.finish_half()
+    paired.play(HOMERUN)  # 7회말 홈 리드
+    while (paired.game.inning, paired.game.is_bottom) != (9, True):
+        paired.finish_half()
+    assert paired.game.is_game_over()
+
+
+def test_snapshot_keeps_final():
+    paired = PairedGame()
+    paired.play(HOMERUN)
+    while not paired.game.is_game_over():
+        paired.finish_half()
+    game = paired.game
+    snapshot = game.snapshot()
+    game.final = False
+    game.restore(snapshot)
+    assert game.is_game_over()
@@ -0,0 +1,63 @@
+"""GameState 스냅샷/복원과 갈래(branch) - 되돌린 상태와 로그가 원래와 같은지"""
+from backend.app.game_engine.events import PlateAppearance
+from backend.app.game_engine.game_state import GameState
+
+
+def play(game: GameState, batter: str, outcome: str, runs: int = 0):
+    before = game.base_out_state
+    if outcome == 'strikeout':
+        game.record_out()
+    else:
+        game.add_runner(1, batter)
+    game.add_score(runs)
+    game.pitcher_pitches += 4
+    game.play_log.append(PlateAppearance(game.inning, game.is_bottom, len(game.play_log), 1, outcome, runs,
+                                         before, game.base_out_state, 4))
+
+
+def started_game() -> GameState:
+    game = GameState('Away', 'Home')
+    play(game, 'A', 'single')
+    play(game, 'B', 'strikeout', runs=1)
+    game.balls, game.strikes = 2, 1
+    return game
+
+
+def test_restore_of_snapshot_round_trips():
+    game = started_game()
+    snapshot = game.snapshot()
+    log = list(game.play_log)
+    game.restore(snapshot)
+    assert game.snapshot() == snapshot
+
+    for batter in 'CDEF':
+        play(game, batter, 'strikeout', runs=2)
+        if game.outs >= 3:
+            game.end_half_inning()
+    game.reset_count()
+    assert game.snapshot() != snapshot
+
+    game.restore(snapshot)
+    assert game.snapshot() == snapshot
+    assert game.runners == {1: 'A', 2: None, 3: None}
+    assert list(game.play_log) == log
+
+
+def test_branch_is_isolated():
+    game = started_game()
+    snapshot = game.snapshot()
+    log = list(game.play_log)
+
+    branch = game.branch()
+    play(branch, 'C', 'single', runs=3)
+    branch.add_runner(3, 'Z')
+    branch.end_half_inning()
+    assert game.snapshot() == snapshot and list(game.play_log) == log
+    assert len(branch.play_log) == len(log) + 1
+
+    # 원래 경기를 진행해도 갈래는 그대로
+    branch_snapshot = branch.snapshot()
+    play(game, 'D', 'strikeout')
+    assert branch.snapshot() == branch_snapshot
+    branch.restore(snapshot)
+    assert list(branch.play_log) == log
@@ -0,0 +1,28 @@
+"""HeadlessGame 기본 교체 정책 - auto_change에 없는 팀은 투수를 바꾸지 않음"""
+from backend.app.game_engine.headless import HeadlessGame, SimState
+from backend.app.game_engine.run_expectancy import OUTCOMES
+
+
+class UniformSimulator:
+    def outcome_probabilities(self, batter, pitcher, state, strategy=None):
+        return dict.fromkeys(OUTCOMES, 1.0)
+
+
+def tired_state(is_bottom: bool) -> SimState:
+    return SimState(8, is_bottom, 0, 0, 2, 2, 0, 0, 10, 20, 110, 110, (11, 12), (21, 22))
+
+
+def test_default_change_replaces_tired_pitcher():
+    model = HeadlessGame(UniformSimulator(), range(9), range(9))
+    assert model.default_change(tired_state(False)).home_pitcher == 11
+    assert model.default_change(tired_state(True)).away_pitcher == 21
+
+
+def test_sides_outside_auto_change_keep_their_pitcher():
+    model = HeadlessGame(UniformSimulator(), range(9), range(9), auto_change=('home',))
+    assert model.default_change(tired_state(False)).home_pitcher == 11
+    state = tired_state(True)
+    assert model.default_change(state) is state
+
+    final = model.rollout(state)
+    assert final.away_pitcher == 20 and final.away_bullpen == (21, 22)
@@ -0,0 +1,49 @@
+"""IncrementalJSONParser / iter_json_objects - 청크 경계, 문자열 안의 특수문자, 끊긴 스트림"""
+import json
+
+from backend.app.ai.json_stream import IncrementalJSONParser, iter_json_objects
+
+CHATS = [
+    {'user': '야구덕후', 'message': '가자가자!!'},
+    {'user': '따옴표', 'message': 'He said "home run" {진짜} [ㄹㅇ]'},
+    {'user': '역슬래시\\', 'message': 'C:\\path\\"quoted\\" }]'},
+]
+TEXT = json.dumps({'chats': CHATS}, ensure_ascii=False)
+
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_objects_split_across_chunks():
+    for size in (1, 2, 3, 7, 64, len(TEXT)):
+        assert list(iter_json_objects(chunked(TEXT, size))) == CHATS
+
+
+def test_objects_are_emitted_as_soon_as_they_close():
+    parser = IncrementalJSONParser()
+    first_end = TEXT.index('}') + 1
+    assert parser.feed(TEXT[:first_end - 1]) == []
+    assert parser.feed(TEXT[first_end - 1:first_end]) == [CHATS[0]]
+
+
+def test_text_outside_json_is_ignored():
+    fenced = "```json\n" + TEXT + "\n```"
+    assert list(iter_json_objects(chunked(fenced, 5))) == CHATS
+
+
+def test_truncated_stream_keeps_completed_objects():
+    cut = TEXT.index(CHATS[2]['user'].replace('\\', '\\\\'))
+    assert list(iter_json_objects(chunked(TEXT[:cut], 4))) == CHATS[:2]
+
+
+def test_stream_error_ends_iteration():
+    def chunks():
+        yield from chunked(TEXT[:TEXT.index('따옴표')], 3)
+        raise ConnectionError("끊김")
+
+    assert list(iter_json_objects(chunks())) == CHATS[:1]
+
+
+def test_depth_zero_returns_whole_object():
+    assert list(iter_json_objects(chunked(TEXT, 9), depth=0)) == [{'chats': CHATS}]
@@ -0,0 +1,42 @@
+"""타순 최적화 - 작은 로스터에서 전수 탐색 최적값을 찾는지"""
+from itertools import permutations
+
+import numpy as np
+
+from backend.app.game_engine.lineup_optimizer import LineupOptimizer
+from backend.app.game_engine.markov import expected_runs
+from backend.app.game_engine.run_expectancy import OUTCOMES
+
+
+def batter(**rates) -> np.ndarray:
+    probs = np.array([rates.get(outcome, 0.0) for outcome in OUTCOMES])
+    probs[OUTCOMES.index('groundout')] += 1 - probs.sum()
+    return np.stack([probs, probs])
+
+
+# 세 유형 x 3명 - 서로 다른 타순은 9! / (3!)^3 = 1680가지라 전수 평가 가능
+SLUGGER = batter(homerun=0.08, double=0.07, single=0.12, walk=0.12, strikeout=0.25)
+CONTACT = batter(single=0.22, double=0.05, walk=0.06, strikeout=0.12)
+WEAK = batter(single=0.14, walk=0.05, strikeout=0.30)
+ROSTER = np.stack([SLUGGER] * 3 + [CONTACT] * 3 + [WEAK] * 3)
+
+
+def exhaustive_best(innings: int) -> float:
+    orders = sorted(set(permutations([0, 0, 0, 1, 1, 1, 2, 2, 2])))
+    types = np.stack([SLUGGER, CONTACT, WEAK])
+    return float(expected_runs(types[np.array(orders)], innings).max())
+
+
+def test_optimizer_finds_exhaustive_optimum():
+    for innings in (1, 9):
+        optimizer = LineupOptimizer(ROSTER, innings=innings, beam_width=16)
+        order, runs = optimizer.optimize(time_budget=30.0)
+        assert sorted(order) == list(range(9))
+        assert abs(runs - expected_runs(ROSTER[list(order)], innings)) < 1e-9
+        assert abs(runs - exhaustive_best(innings)) < 1e-9
+
+
+def test_optimizer_beats_given_order():
+    optimizer = LineupOptimizer(ROSTER[::-1])
+    _, runs = optimizer.optimize(time_budget=30.0)
+    assert runs >= expected_runs(ROSTER[::-1]) - 1e-12
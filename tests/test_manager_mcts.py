@@ -0,0 +1,53 @@
+"""감독 MCTS - 합법 행동, 끝난 경기, 명백히 나쁜 고의4구 회피"""
+import random
+
+from backend.app.ai.manager_mcts import BATTING_ACTIONS, PITCHING_ACTIONS, ManagerMCTS
+from backend.app.game_engine.headless import HeadlessGame, SimState
+from backend.app.game_engine.run_expectancy import OUTCOMES
+
+
+class StrategySimulator:
+    """고의4구면 볼넷, 그 밖에는 결과 균등"""
+
+    def outcome_probabilities(self, batter, pitcher, state, strategy=None):
+        if strategy == 'intentional_walk':
+            return {outcome: float(outcome == 'walk') for outcome in OUTCOMES}
+        return dict.fromkeys(OUTCOMES, 1.0)
+
+
+def make_search(seed: int = 0) -> ManagerMCTS:
+    model = HeadlessGame(StrategySimulator(), range(9), range(9), rng=random.Random(seed))
+    return ManagerMCTS(model, manage_home=False)
+
+
+def state(**fields) -> SimState:
+    base = SimState(1, False, 0, 0, 0, 0, 0, 0, 10, 20, 0, 0, (11, 12), (21, 22))
+    return base._replace(**fields)
+
+
+def test_legal_actions():
+    mcts = make_search()
+    # 원정팀 감독: 초는 타격, 말은 수비(불펜 교체 포함, 이미 바꿨으면 제외)
+    assert mcts.legal_actions(state()) == BATTING_ACTIONS
+    fielding = mcts.legal_actions(state(is_bottom=True))
+    assert fielding == PITCHING_ACTIONS + [('change', 21), ('change', 22)]
+    assert mcts.legal_actions(state(is_bottom=True, changed=True)) == PITCHING_ACTIONS
+
+
+def test_finished_game_returns_without_search():
+    result = make_search().search(state(inning=10, final=True, away_score=3), time_budget=1.0)
+    assert result.action == ('strategy', None)
+    assert result.iterations == 0 and result.win_prob == 1.0
+
+
+def test_search_avoids_walk_off_intentional_walk():
+    # 9회말 동점 2아웃 만루 - 고의4구는 밀어내기 끝내기 패배
+    root = state(inning=9, is_bottom=True, outs=2, bases=0b111, away_bullpen=())
+    mcts = make_search(1)
+    result = mcts.search(root, time_budget=60.0, max_iterations=400)
+    assert result.iterations == 400
+    assert result.action in mcts.legal_actions(root)
+    assert sum(visits for visits, _ in result.stats.values()) == 400
+    assert result.stats[('strategy', 'intentional_walk')][1] == 0.0
+    assert result.action != ('strategy', 'intentional_walk')
+    assert mcts.best_plan(root, result) == (None, result.action[1])
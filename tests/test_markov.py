@@ -0,0 +1,52 @@
+"""마르코프 기대 득점 - 고정 진루 규칙 시뮬레이션과 득점 분포가 같은 값을 내는지"""
+import random
+
+import numpy as np
+
+from backend.app.game_engine.markov import expected_runs, inning_runs_distribution, inning_tables
+from backend.app.game_engine.run_expectancy import OUTCOMES, advance
+
+
+def random_lineup(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    probs = rng.dirichlet(np.ones(len(OUTCOMES)) * 2, size=(9, 2))
+    # 아웃 비율을 현실적으로 (이닝이 길어지지 않게)
+    probs[..., OUTCOMES.index('groundout')] += 1.0
+    return probs / probs.sum(axis=-1, keepdims=True)
+
+
+def simulate_inning(lineup, rnd: random.Random) -> int:
+    bases = outs = runs = 0
+    batter = 0
+    while outs < 3:
+        risp = int(bases & 0b110 != 0)
+        outcome = rnd.choices(OUTCOMES, weights=lineup[batter % 9, risp])[0]
+        bases, outs, scored = advance(bases, outs, outcome)
+        runs += scored
+        batter += 1
+    return runs
+
+
+def test_expected_runs_match_simulation():
+    lineup = random_lineup(3)
+    expected, _ = inning_tables(lineup[np.newaxis])
+    rnd = random.Random(5)
+    simulated = np.mean([simulate_inning(lineup, rnd) for _ in range(20000)])
+    assert abs(expected[0, 0] - simulated) < 0.04
+
+
+def test_distribution_mean_matches_expected_runs():
+    lineup = random_lineup(11)
+    for baserunning in (None, (0, 2), (2, 0)):
+        expected, next_leadoff = inning_tables(lineup[np.newaxis], baserunning)
+        dist = inning_runs_distribution(lineup[np.newaxis], baserunning=baserunning)[0]
+        assert abs(dist.sum() - 1) < 1e-8
+        assert abs(dist @ np.arange(len(dist)) - expected[0, 0]) < 1e-6
+        np.testing.assert_allclose(next_leadoff.sum(axis=-1), 1, atol=1e-8)
+
+
+def test_batched_and_single_lineups_agree():
+    lineups = np.stack([random_lineup(seed) for seed in range(4)])
+    batched = expected_runs(lineups)
+    assert batched.shape == (4,)
+    np.testing.assert_allclose(batched, [expected_runs(lineup) for lineup in lineups])
@@ -0,0 +1,65 @@
+"""투구 시뮬레이터 - 볼카운트 진행의 결과 분포가 AtBatSimulator 타석 확률과 같은지"""
+import random
+from collections import Counter
+from itertools import product
+
+import numpy as np
+
+from backend.app.game_engine.at_bat_simulator import AtBatSimulator
+from backend.app.game_engine.pitch_simulator import (
+    PitchSimulator, absorption, calibrate, foul_rate, pitch_probabilities
+)
+
+
+def player(name, rating):
+    keys = ('eye', 'contact', 'power', 'control', 'stuff', 'movement')
+    return {'name': name, 'ratings_20_80': dict.fromkeys(keys, rating)}
+
+
+STATES = ({}, {'runners_in_scoring_position': True}, {'pitcher_fatigue': 90}, {'same_handedness': True})
+STRATEGIES = (None, 'careful', 'aggressive', 'patient', 'power_swing')
+
+
+def test_calibration_reproduces_at_bat_rates():
+    simulator = AtBatSimulator()
+    walks, strikeouts, fouls = [], [], []
+    for b, p, state, strategy in product((20, 50, 80), (20, 50, 80), STATES, STRATEGIES):
+        batter, pitcher = player('B', b)['ratings_20_80'], player('P', p)['ratings_20_80']
+        probs = simulator.outcome_probabilities(batter, pitcher, state, strategy)
+        walks.append(probs['walk'])
+        strikeouts.append(probs['strikeout'])
+        fouls.append(foul_rate(batter, pitcher))
+
+    foul = np.array(fouls)
+    walk, strikeout = absorption(pitch_probabilities(*calibrate(walks, strikeouts, foul), foul))
+    np.testing.assert_allclose(walk, walks, atol=1e-9)
+    np.testing.assert_allclose(strikeout, strikeouts, atol=1e-9)
+
+
+def test_pitch_by_pitch_matches_outcome_probabilities():
+    at_bat = AtBatSimulator()
+    batter, pitcher = player('Batter', 65), player('Pitcher', 45)
+    sim = PitchSimulator(at_bat, rng=random.Random(3))
+    n = 20000
+    counts = Counter(sim.simulate(batter, pitcher, {})[0] for _ in range(n))
+    probs = at_bat.outcome_probabilities(batter['ratings_20_80'], pitcher['ratings_20_80'], {})
+    for outcome, p in probs.items():
+        assert abs(counts[outcome] / n - p) < 4 * np.sqrt(p * (1 - p) / n) + 1e-3
+
+
+def test_simulate_many_matches_probabilities_and_intentional_walk():
+    at_bat = AtBatSimulator()
+    batter, pitcher = player('Batter', 40)['ratings_20_80'], player('Pitcher', 70)['ratings_20_80']
+    probs = at_bat.outcome_probabilities(batter, pitcher, {})
+    row = np.array([probs[o] for o in at_bat.outcomes])
+    ibb = np.array([probs['walk'] if o == 'walk' else 0.0 for o in at_bat.outcomes])
+    ibb /= ibb.sum()
+
+    n = 20000
+    outcome, pitches = PitchSimulator.simulate_many(
+        np.vstack([np.tile(row, (n, 1)), ibb]), foul_rate(batter, pitcher), np.random.default_rng(5)
+    )
+    assert outcome[-1] == at_bat.outcomes.index('walk') and pitches[-1] == 4
+    frequency = np.bincount(outcome[:-1], minlength=len(row)) / n
+    assert np.all(np.abs(frequency - row) < 4 * np.sqrt(row * (1 - row) / n) + 1e-3)
+    assert pitches[:-1].min() >= 1
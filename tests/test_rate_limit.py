@@ -0,0 +1,58 @@
+"""TokenBucket - 버스트와 보충 속도"""
+from scripts.utils import rate_limit
+from scripts.utils.rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def fake_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(rate_limit.time, 'sleep', clock.sleep)
+    return clock
+
+
+def test_burst_up_to_capacity_without_waiting(monkeypatch):
+    clock = fake_clock(monkeypatch)
+    bucket = TokenBucket(rate=5, capacity=3)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.now == 0.2  # 1 / rate
+
+
+def test_refill_rate_limits_sustained_requests(monkeypatch):
+    clock = fake_clock(monkeypatch)
+    bucket = TokenBucket(rate=10)
+    for _ in range(10 + 20):
+        bucket.acquire()
+    assert abs(clock.now - 2.0) < 1e-9  # 버스트 10개 이후 초당 10개
+
+
+def test_refill_is_capped_at_capacity(monkeypatch):
+    clock = fake_clock(monkeypatch)
+    bucket = TokenBucket(rate=4, capacity=2)
+    bucket.acquire(2)
+    clock.now += 60  # 오래 쉬어도 capacity까지만 쌓임
+    bucket.acquire(2)
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == [0.25]
+
+
+def test_default_capacity_is_one_second_of_tokens():
+    assert TokenBucket(rate=12.5).capacity == 12
+    assert TokenBucket(rate=0.5).capacity == 1
@@ -0,0 +1,42 @@
+"""순차 표본 평가 - 뚜렷한 차이는 일찍 갈리고, 분산 0인 동점은 갈리지 않음"""
+import numpy as np
+
+from backend.app.ai.sequential_evaluator import evaluate_options
+
+
+def bernoulli_sampler(rates, seed=0):
+    rng = np.random.default_rng(seed)
+    calls = []
+
+    def sample(option, n):
+        calls.append((option, n))
+        return (rng.random(n) < rates[option]).astype(float)
+
+    return sample, calls
+
+
+def test_obvious_pair_separates_early():
+    sampler, calls = bernoulli_sampler({'good': 0.8, 'bad': 0.2})
+    result = evaluate_options(sampler, ['bad', 'good'], time_budget=30.0)
+    assert result.separated and result.best == 'good'
+    assert [e.option for e in result.estimates] == ['good', 'bad']
+    assert result.estimates[0].low > result.estimates[1].high
+    # 최소 표본만으로 갈림
+    assert result.samples == 400 and len(calls) == 2
+
+
+def test_zero_variance_tie_does_not_separate():
+    result = evaluate_options(lambda option, n: np.full(n, 0.5), ['a', 'b'],
+                              batch=50, min_samples=50, max_samples=300, time_budget=30.0)
+    assert not result.separated
+    assert all(e.samples == 300 and e.low == e.high == 0.5 for e in result.estimates)
+
+
+def test_dominated_option_stops_sampling():
+    sampler, calls = bernoulli_sampler({'best': 0.7, 'close': 0.65, 'hopeless': 0.0}, seed=1)
+    result = evaluate_options(sampler, ['best', 'close', 'hopeless'], batch=100, min_samples=200,
+                              max_samples=3000, time_budget=30.0)
+    counts = {e.option: e.samples for e in result.estimates}
+    assert counts['hopeless'] == 200
+    assert counts['close'] > 200
+    assert sum(n for option, n in calls if option == 'hopeless') == 200
@@ -0,0 +1,46 @@
+"""WinProbability 9회 이후 종료 규칙 - 동점이면 연장, GameState.is_game_over / HeadlessGame과 같은 결과"""
+import random
+
+import pytest
+
+from backend.app.game_engine.headless import HeadlessGame, SimState
+from backend.app.game_engine.run_expectancy import OUTCOMES
+from backend.app.game_engine.win_probability import WinProbability, average_probabilities
+
+
+@pytest.fixture(scope='module')
+def wp():
+    return WinProbability()
+
+
+def test_end_of_ninth_payoff(wp):
+    # 9회말 종료: 이기면 1, 지면 0, 동점이면 연장 승률
+    assert wp.home_win_probability(9, True, 3, 0, 1) == 1.0
+    assert wp.home_win_probability(9, True, 3, 0, -1) == 0.0
+    assert wp.home_win_probability(9, True, 3, 0, 0) == pytest.approx(wp.extra_inning_wp)
+    # 9회초 종료 시 홈 리드면 9회말 없이 종료
+    assert wp.home_win_probability(9, False, 3, 0, 1) == 1.0
+    assert 0.0 < wp.home_win_probability(9, False, 3, 0, -1) < 1.0
+
+
+def test_tied_ninth_and_extra_innings_share_one_value(wp):
+    # 동점 9회초 시작은 연장 이닝과 같은 상황 (홈팀이 이닝에서 더 많이 내면 승리, 아니면 반복)
+    assert 0.45 < wp.extra_inning_wp < 0.6
+    for inning in (9, 10, 12):
+        assert wp.home_win_probability(inning, False, 0, 0, 0) == pytest.approx(wp.extra_inning_wp)
+
+
+class AverageSimulator:
+    def __init__(self):
+        self.probs = average_probabilities()
+
+    def outcome_probabilities(self, batter, pitcher, state, strategy=None):
+        return dict(zip(OUTCOMES, self.probs[int(state['runners_in_scoring_position'])]))
+
+
+def test_extra_inning_wp_matches_headless_games(wp):
+    model = HeadlessGame(AverageSimulator(), range(9), range(9), rng=random.Random(3))
+    start = SimState(10, False, 0, 0, 4, 4, 0, 0, 1, 2, 0, 0, (), ())
+    games = 4000
+    home_wins = sum(model.home_result(model.rollout(start)) for _ in range(games))
+    assert home_wins / games == pytest.approx(wp.extra_inning_wp, abs=0.03)